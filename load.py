@@ -24,6 +24,8 @@ if TYPE_CHECKING:
     from edmcruleengine import Config, EventHandler
     from edmcruleengine.vkb.vkb_link_manager import VKBLinkManager
     from edmcruleengine.events.event_recorder import EventRecorder
+    from edmcruleengine.utils.startup_timeline import StartupTimeline
+    from edmcruleengine.utils.profiling import ProfilingSession
 
 # Constants
 SHIFT_BITMAP_MASK = 0x03  # 2 bits for Shift1/Shift2
@@ -130,6 +132,8 @@ class PluginState:
         self.plugin_dir: Optional[str] = None
         self.prefs_vars: dict[str, Any] = {}
         self.stop_event = threading.Event()
+        self.startup_timeline: Optional["StartupTimeline"] = None
+        self.profiling_session: Optional["ProfilingSession"] = None
 
 
 # Global instance
@@ -168,11 +172,16 @@ def _restore_test_shift_state_from_config() -> None:
 
 def _check_for_updates() -> None:
     """Check for plugin updates in a background thread and prompt if found."""
-    if not _state.plugin_update_manager:
+    if not _state.plugin_dir:
         return
 
     def _do_check():
         try:
+            if _state.plugin_update_manager is None:
+                # Imported here: update/download code is not needed at startup
+                from edmcruleengine.utils.plugin_update_manager import PluginUpdateManager
+
+                _state.plugin_update_manager = PluginUpdateManager(Path(_state.plugin_dir), logger=logger)
             latest = _state.plugin_update_manager.check_for_update(VERSION)
             if latest:
                 logger.info(f"Plugin update available: v{latest.version}")
@@ -310,6 +319,109 @@ def _save_rules_file_from_ui(rules: list[dict], wrapped: bool, rules_path: str)
         return False
 
 
+def _edmc_journal_dir() -> Optional[str]:
+    """Return EDMC's configured journal directory, or None outside EDMC."""
+    try:
+        from config import config as edmc_config
+    except Exception:
+        return None
+    try:
+        return edmc_config.get_str("journaldir") or edmc_config.default_journal_dir
+    except Exception as e:
+        logger.debug(f"Could not resolve journal directory: {e}")
+        return None
+
+
+def _edmc_commander() -> Optional[str]:
+    """Commander EDMC's journal monitor already knows about, if any."""
+    try:
+        from monitor import monitor
+    except Exception:
+        return None
+    return getattr(monitor, "cmdr", None) or None
+
+
+def _restore_signal_snapshot(handler: "EventHandler") -> None:
+    """
+    Restore the previous session's signal snapshot (never fails startup).
+
+    The snapshot is only restored for the commander it was taken for; when
+    EDMC does not know the commander yet, the handler restores it on the
+    warm start seed or first event that names one.
+    """
+    try:
+        handler.restore_signal_snapshot_when_known(_edmc_commander())
+    except Exception as e:
+        logger.warning(f"Could not restore signal snapshot: {e}")
+
+
+def _warm_start_from_journal(handler: "EventHandler") -> None:
+    """Seed state.* signals from the newest journal before live events arrive."""
+    if not _state.config or not _state.config.get("warm_start_enabled", True):
+        return
+    journal_dir = _edmc_journal_dir()
+    if not journal_dir:
+        return
+    try:
+        from edmcruleengine.events.warm_start import warm_start
+
+        max_kb = _safe_int(_state.config.get("warm_start_max_kb", 1024), 1024)
+        warm_start(handler, journal_dir, max_bytes=max_kb * 1024 if max_kb > 0 else None)
+    except Exception as e:
+        logger.warning(f"Warm start from journal failed: {e}")
+
+
+def _finish_startup_branch(timeline: "StartupTimeline", branch: str) -> None:
+    """Mark a startup branch complete and log the timeline once all branches finish."""
+    if timeline.mark_branch_done(branch):
+        logger.info(f"Startup timeline: {timeline.format_summary()}")
+
+
+def _run_vkb_startup(manager: "VKBLinkManager", timeline: "StartupTimeline") -> None:
+    """Background VKB-Link startup branch (ensure-running + connect)."""
+    try:
+        manager.startup(stop_event=_state.stop_event, timeline=timeline)
+    finally:
+        _finish_startup_branch(timeline, "vkb_link")
+
+
+def _start_profiling(reason: str) -> bool:
+    """
+    Start a profiling session from the ``profiling_*`` settings.
+
+    ``profiling_enabled`` is a one-shot trigger: it is cleared again when the
+    session has written its files to ``<plugin_dir>/profiles``.
+    """
+    if not _state.config or not _state.plugin_dir:
+        return False
+    if _state.profiling_session is not None and _state.profiling_session.running:
+        return False
+    from edmcruleengine.utils.profiling import ProfilingSession
+
+    def _finished(_result) -> None:
+        _state.profiling_session = None
+        if _state.config and _state.config.get("profiling_enabled", False):
+            _state.config.set("profiling_enabled", False)
+
+    config = _state.config
+    logger.info(f"Starting profiler ({reason})")
+    _state.profiling_session = ProfilingSession(
+        _state.plugin_dir,
+        duration_seconds=float(config.get("profiling_duration_seconds", 30) or 30),
+        interval_seconds=max(1, _safe_int(config.get("profiling_interval_ms", 5), 5)) / 1000.0,
+        memory=bool(config.get("profiling_tracemalloc", False)),
+        roots=(Path(__file__).resolve().parent,),
+        on_finished=_finished,
+    )
+    _state.profiling_session.start()
+    return True
+
+
+def _on_config_changed(snapshot: Any, changed_keys: frozenset) -> None:
+    if "profiling_enabled" in changed_keys and snapshot.get("profiling_enabled", False):
+        _start_profiling("profiling_enabled set")
+
+
 def plugin_start3(plugin_dir: str) -> Optional[str]:
     """
     Start the plugin (called by EDMC 5.0+).
@@ -327,19 +439,25 @@ def plugin_start3(plugin_dir: str) -> Optional[str]:
         # Import here to avoid issues if EDMC modules aren't available during testing
         from edmcruleengine import Config, EventHandler
         from edmcruleengine.vkb.vkb_link_manager import VKBLinkManager
-        from edmcruleengine.events.event_recorder import EventRecorder
-        from edmcruleengine.utils.plugin_update_manager import PluginUpdateManager
+        from edmcruleengine.vkb.vkb_target_pool import VKBTargetPool
+        from edmcruleengine.utils.startup_timeline import StartupTimeline
         import threading
 
         logger.info(f"VKB Connector v{VERSION} starting")
         _state.stop_event.clear()
 
+        # Startup has two concurrent branches: the EDMC main thread (config,
+        # catalog, rules) and the VKB-Link thread (process discovery, INI, connect).
+        timeline = StartupTimeline(branches=("main", "vkb_link"))
+        _state.startup_timeline = timeline
+
         # Initialize configuration (uses EDMC's stored preferences)
-        _state.config = Config()
-        _state.plugin_dir = plugin_dir
+        with timeline.stage("config"):
+            _state.config = Config()
+            _state.plugin_dir = plugin_dir
 
-        # Ensure default rules.json exists (from rules.json.example) if user hasn't created one
-        _ensure_rules_file_exists(_state.plugin_dir)
+            # Ensure default rules.json exists (from rules.json.example) if user hasn't created one
+            _ensure_rules_file_exists(_state.plugin_dir)
 
         vkb_host = _state.config.get("vkb_host", "127.0.0.1")
         vkb_port = _state.config.get("vkb_port", 50995)
@@ -357,16 +475,44 @@ def plugin_start3(plugin_dir: str) -> Optional[str]:
 
         # Initialize VKB components — client construction is encapsulated in from_config
         _state.vkb_manager = VKBLinkManager.from_config(_state.config, Path(_state.plugin_dir))
+        _restore_test_shift_state_from_config()
+
+        # Delegate the full startup sequence (ensure-running + connect) to the manager.
+        # Runs in a daemon thread so it never blocks the EDMC UI, and is started
+        # before catalog/rules loading so process discovery overlaps with them.
+        # Warm start actions below update the shift state before the socket is
+        # up; the manager sends them once startup() connects.
+        _state.vkb_manager.defer_sends_until_connected()
+        startup_thread = threading.Thread(
+            target=_run_vkb_startup,
+            args=(_state.vkb_manager, timeline),
+            daemon=True,
+        )
+        startup_thread.start()
 
         # Initialize event handler and register endpoints
-        _state.event_handler = EventHandler(_state.config, endpoints=[], plugin_dir=_state.plugin_dir)
+        _state.event_handler = EventHandler(
+            _state.config,
+            endpoints=[],
+            plugin_dir=_state.plugin_dir,
+            startup_timeline=timeline,
+        )
         _state.event_handler.add_endpoint(_state.vkb_manager)
 
-        _state.event_recorder = EventRecorder()
-        _restore_test_shift_state_from_config()
+        # Optional additional VKB-Link targets (separate devices / LAN hosts)
+        target_pool = VKBTargetPool.from_config(_state.config)
+        if target_pool is not None:
+            _state.event_handler.add_endpoint(target_pool)
+            threading.Thread(target=target_pool.connect, name="VKBTargetPoolConnect", daemon=True).start()
 
-        # Initialize update manager and check for updates in background
-        _state.plugin_update_manager = PluginUpdateManager(Path(_state.plugin_dir), logger=logger)
+        # Restore the last session's signals/edge state, then refresh state.*
+        # signals from the newest journal.
+        with timeline.stage("warm_start"):
+            _restore_signal_snapshot(_state.event_handler)
+            _warm_start_from_journal(_state.event_handler)
+
+        # The event recorder is created by the preferences panel when
+        # recording starts; the update manager in the update-check thread.
         _check_for_updates()
 
         # On startup, refresh unregistered events against catalog
@@ -378,14 +524,17 @@ def plugin_start3(plugin_dir: str) -> Optional[str]:
         except Exception as e:
             logger.warning(f"Error refreshing unregistered events on startup: {e}")
 
-        # Delegate the full startup sequence (ensure-running + connect) to the manager.
-        # Runs in a daemon thread so it never blocks the EDMC UI.
-        startup_thread = threading.Thread(
-            target=_state.vkb_manager.startup,
-            kwargs={"stop_event": _state.stop_event},
-            daemon=True,
-        )
-        startup_thread.start()
+        _finish_startup_branch(timeline, "main")
+
+        # Profiling can be requested for the next start or toggled at runtime
+        try:
+            subscribe = getattr(_state.config, "subscribe", None)
+            if callable(subscribe):
+                subscribe(_on_config_changed)
+            if _state.config.get("profiling_enabled", False):
+                _start_profiling("enabled at startup")
+        except Exception as e:
+            logger.warning(f"Could not set up profiling hooks: {e}")
 
         # Return the internal name for the plugin (shown in EDMC UI)
         return "VKB Connector"
@@ -404,6 +553,10 @@ def plugin_stop() -> None:
     try:
         logger.info("VKB Connector stopping")
         _state.stop_event.set()
+        if _state.profiling_session is not None:
+            # Write whatever was sampled so far
+            _state.profiling_session.stop()
+            _state.profiling_session.wait(5.0)
         if _state.event_recorder and _state.event_recorder.is_recording:
             _state.event_recorder.stop()
         
@@ -411,8 +564,11 @@ def plugin_stop() -> None:
         if _state.vkb_manager:
             _state.vkb_manager.shutdown()
 
-        # Finally disconnect the event handler
+        # Finally persist the signal snapshot, flush pending tracker writes and
+        # disconnect the event handler
         if _state.event_handler:
+            _state.event_handler.save_signal_snapshot()
+            _state.event_handler.flush_unregistered_events()
             _state.event_handler.disconnect()
             
         logger.info("VKB Connector stopped successfully")
@@ -503,6 +659,9 @@ def prefs_changed(cmdr: str, is_beta: bool) -> None:
     try:
         logger.info("Preferences changed, reconnecting VKB connector")
         _persist_prefs_from_ui()
+        if _state.config:
+            # Pick up values changed outside Config.set and notify subscribers
+            _state.config.refresh()
 
         # Reload rules and reconnect with new settings
         _state.event_handler.reload_rules()
@@ -561,6 +720,7 @@ def journal_entry(
             source="journal",
             cmdr=cmdr,
             is_beta=is_beta,
+            state=state,
         )
 
     except Exception as e:
@@ -0,0 +1,69 @@
+"""Backtest a rules file against a directory of recorded sessions.
+
+Every ``.jsonl``/``.jsonl.gz`` recording in the directory is replayed at
+maximum speed by its own rule engine in a process pool.  The report lists
+activations, time active, flap rate and evaluation cost per rule, plus rules
+that never fired.
+
+Usage:
+    python scripts/dev/backtest_rules.py rules.json recordings/ [--workers 8] [--flap-window 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from edmcruleengine.rules.backtest import (  # noqa: E402
+    DEFAULT_FLAP_WINDOW_SECONDS,
+    find_recordings,
+    run_backtest,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("rules", type=Path, help="Rules file to evaluate")
+    parser.add_argument("recordings", type=Path, help="Directory of recordings")
+    parser.add_argument("--plugin-dir", type=Path, default=PROJECT_ROOT, help="Plugin directory holding the catalog")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--flap-window",
+        type=float,
+        default=DEFAULT_FLAP_WINDOW_SECONDS,
+        help="Activations shorter than this many recorded seconds count as flaps",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.rules.exists():
+        print(f"ERROR: rules file not found: {args.rules}")
+        return 1
+    if not args.recordings.is_dir():
+        print(f"ERROR: recordings directory not found: {args.recordings}")
+        return 1
+
+    recordings = find_recordings(args.recordings)
+    if not recordings:
+        print(f"ERROR: no .jsonl/.jsonl.gz recordings in {args.recordings}")
+        return 1
+
+    report = run_backtest(
+        args.rules,
+        recordings,
+        plugin_dir=args.plugin_dir,
+        workers=args.workers,
+        flap_window_seconds=args.flap_window,
+    )
+    print(report.format_summary())
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
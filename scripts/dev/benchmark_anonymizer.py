@@ -0,0 +1,135 @@
+"""Benchmark event anonymization against large CAPI-style payloads.
+
+Compares the shared single-pass ``CompiledAnonymizer`` (as used by the
+EventRecorder) with the previous approach: deep-copy the payload, then run
+each regex over every string.
+
+Usage:
+    python scripts/dev/benchmark_anonymizer.py [--modules 400] [--commodities 800] [--iterations 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from edmcruleengine.events import event_recorder  # noqa: E402
+from edmcruleengine.events.event_recorder import EventRecorder  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=400, help="Ship modules per payload")
+    parser.add_argument("--commodities", type=int, default=800, help="Market commodities per payload")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed iterations per implementation")
+    return parser.parse_args()
+
+
+def build_capi_payload(modules: int, commodities: int) -> Dict[str, Any]:
+    """Build a CAPI profile/market-shaped payload with a few identifying values."""
+    return {
+        "commander": {"id": 1234567, "name": "Jameson", "credits": 987654321, "docked": True},
+        "Commander": "Jameson",
+        "FID": "F1234567",
+        "lastSystem": {"id": 10477373803, "name": "Sol", "faction": "Federation"},
+        "lastStarport": {
+            "id": 128016640,
+            "name": "Abraham Lincoln",
+            "services": {name: "ok" for name in ("refuel", "repair", "rearm", "outfitting", "shipyard")},
+        },
+        "ship": {
+            "name": "Anaconda",
+            "shipName": "Rusty Bucket",
+            "modules": {
+                f"Slot{i:03d}": {
+                    "module": {"id": 128049500 + i, "name": f"Int_Module_Size{i % 8}_Class{i % 5}",
+                               "value": 1000 + i, "health": 1000000, "on": True, "priority": i % 5},
+                    "engineer": {"recipeName": "Misc_LightWeight", "recipeLevel": 5},
+                }
+                for i in range(modules)
+            },
+        },
+        "market": {
+            "commodities": [
+                {"id": 128049152 + i, "name": f"Commodity{i}", "buyPrice": 100 + i, "sellPrice": 90 + i,
+                 "stock": i * 3, "demand": i * 2, "categoryname": "Chemicals", "statusFlags": []}
+                for i in range(commodities)
+            ],
+        },
+        "journalDir": "C:\\Users\\Jameson\\Saved Games\\Frontier Developments\\Elite Dangerous",
+        "host": "connecting via 192.168.1.20 from /home/jameson/.local",
+    }
+
+
+def legacy_anonymize(recorder: EventRecorder, data: Any) -> Any:
+    """Reference implementation: deep copy, then three regex passes per string."""
+
+    def scrub(value: str) -> str:
+        value = event_recorder._WIN_PATH_RE.sub(recorder._redact_win_path, value)
+        value = event_recorder._UNIX_HOME_RE.sub("/home/redacted", value)
+        return event_recorder._IP_RE.sub("0.0.0.0", value)
+
+    def walk(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            for key in list(obj.keys()):
+                if key == "FID":
+                    obj[key] = recorder.mock_fid
+                elif key == "Commander":
+                    obj[key] = recorder.mock_commander
+                else:
+                    obj[key] = walk(obj[key])
+            return obj
+        if isinstance(obj, list):
+            return [walk(item) for item in obj]
+        if isinstance(obj, str):
+            return scrub(obj)
+        return obj
+
+    return walk(copy.deepcopy(data))
+
+
+def time_it(func: Callable[[Any], Any], payload: Any, iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(payload)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> int:
+    args = parse_args()
+    payload = build_capi_payload(args.modules, args.commodities)
+    recorder = EventRecorder()
+
+    legacy_result = legacy_anonymize(recorder, payload)
+    compiled_result = recorder._anonymize_data(payload)
+    if legacy_result != compiled_result:
+        print("ERROR: compiled anonymizer output differs from the reference implementation")
+        return 1
+
+    results = {
+        "legacy (deepcopy + 3 regex)": time_it(lambda data: legacy_anonymize(recorder, data), payload, args.iterations),
+        "compiled (single pass, COW)": time_it(recorder._anonymize_data, payload, args.iterations),
+    }
+
+    print(f"Payload: {args.modules} modules, {args.commodities} commodities, {args.iterations} iterations")
+    baseline = None
+    for name, timings in results.items():
+        timings.sort()
+        median_ms = timings[len(timings) // 2] * 1000
+        baseline = baseline or median_ms
+        print(f"  {name:<30} median {median_ms:8.3f} ms  best {timings[0] * 1000:8.3f} ms  "
+              f"speedup x{baseline / median_ms:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
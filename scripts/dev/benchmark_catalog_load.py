@@ -0,0 +1,83 @@
+"""Benchmark signals catalog loading with and without the compiled cache.
+
+Measures three paths for ``data/signals_catalog.json``:
+    json      parse + validate + flatten + index on every load (no cache)
+    compile   the same plus writing the compiled cache (first start after a change)
+    cached    loading the compiled runtime core
+    cached+ui loading the runtime core, then UI metadata on first access
+
+Usage:
+    python scripts/dev/benchmark_catalog_load.py [--iterations 50] [--catalog path/to/signals_catalog.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from edmcruleengine.rules.catalog_cache import UI_CACHE_SECTION, cache_path_for  # noqa: E402
+from edmcruleengine.rules.signals_catalog import SignalsCatalog  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50, help="Loads per measurement")
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=PROJECT_ROOT / "data" / "signals_catalog.json",
+        help="Catalog to load (copied to a temp dir so the real cache is untouched)",
+    )
+    return parser.parse_args()
+
+
+def _measure(label: str, iterations: int, load: Callable[[], object]) -> float:
+    samples: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        load()
+        samples.append((time.perf_counter() - started) * 1000)
+    median = statistics.median(samples)
+    print(f"  {label:<9} median {median:8.3f} ms   min {min(samples):8.3f} ms   max {max(samples):8.3f} ms")
+    return median
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.catalog.exists():
+        print(f"ERROR: catalog not found: {args.catalog}")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = Path(tmp) / args.catalog.name
+        shutil.copyfile(args.catalog, catalog)
+        cache = cache_path_for(catalog)
+
+        def _compile() -> None:
+            cache.unlink(missing_ok=True)
+            SignalsCatalog.from_file(catalog)
+
+        print(f"Loading {args.catalog} ({args.catalog.stat().st_size / 1024:.0f} KB), {args.iterations} iterations")
+        json_ms = _measure("json", args.iterations, lambda: SignalsCatalog.from_file(catalog, use_cache=False))
+        _measure("compile", args.iterations, _compile)
+        cached_ms = _measure("cached", args.iterations, lambda: SignalsCatalog.from_file(catalog))
+        _measure("cached+ui", args.iterations, lambda: SignalsCatalog.from_file(catalog).signal_hierarchy)
+        ui_cache = cache_path_for(catalog, UI_CACHE_SECTION)
+        print(
+            f"  cache size {cache.stat().st_size / 1024:.0f} KB runtime + {ui_cache.stat().st_size / 1024:.0f} KB UI,"
+            f" runtime speedup {json_ms / cached_ms:.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""Measure the plugin's import time at EDMC startup against a budget.
+
+Runs fresh interpreters with ``python -X importtime`` that import ``load`` and
+the modules ``plugin_start3`` imports, then reports the median self and
+cumulative import time per module.  Standard-library modules EDMC has already
+imported before it loads plugins (tkinter, logging, json, ...) are imported
+first and not counted.  A warm-up run compiles bytecode so the timed runs
+match an installed plugin.
+
+Exits 1 when the startup imports exceed ``--budget-ms`` or pull in a module
+that should only load on first use (downloaders, crypto, updater, recorder, UI).
+
+Usage:
+    python scripts/dev/benchmark_import_time.py [--runs 7] [--budget-ms 60] [--top 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Already imported by EDMC before any plugin loads.
+EDMC_PRELOADED = ("tkinter", "tkinter.messagebox", "logging", "json", "threading", "socket", "pathlib", "re", "typing")
+
+# Mirrors the imports in load.py at module level and in plugin_start3().
+STARTUP_IMPORTS = (
+    "import load",
+    "from edmcruleengine import Config, EventHandler",
+    "from edmcruleengine.vkb.vkb_link_manager import VKBLinkManager",
+    "from edmcruleengine.vkb.vkb_target_pool import VKBTargetPool",
+    "from edmcruleengine.utils.startup_timeline import StartupTimeline",
+)
+
+# Must not be imported until first use.
+DEFERRED_MODULES = (
+    "urllib.request",
+    "edmcruleengine.utils.downloaders",
+    "edmcruleengine.utils.mega_downloader",
+    "edmcruleengine.utils.onedrive_downloader",
+    "edmcruleengine.utils.pure_python_aes",
+    "edmcruleengine.utils.plugin_update_manager",
+    "edmcruleengine.events.event_recorder",
+    "edmcruleengine.events.event_anonymizer",
+    "edmcruleengine.utils.diagnostics",
+    "edmcruleengine.utils.profiling",
+    "edmcruleengine.ui.prefs_panel",
+    "edmcruleengine.ui.rule_editor",
+)
+
+_MARKER = "--plugin-startup-imports--"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7, help="Timed interpreter runs (median is reported)")
+    parser.add_argument("--budget-ms", type=float, default=60.0, help="Maximum startup import time")
+    parser.add_argument("--top", type=int, default=20, help="Modules to list in the breakdown")
+    return parser.parse_args()
+
+
+def _child_code() -> str:
+    lines = [
+        "import sys",
+        f"sys.path[:0] = [{str(PROJECT_ROOT)!r}, {str(PROJECT_ROOT / 'src')!r}]",
+        *(f"import {name}" for name in EDMC_PRELOADED),
+        f"sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush()",
+        *STARTUP_IMPORTS,
+        f"print(__import__('json').dumps([m for m in {list(DEFERRED_MODULES)!r} if m in sys.modules]))",
+    ]
+    return "\n".join(lines)
+
+
+def run_once(env: Dict[str, str]) -> Tuple[Dict[str, Tuple[int, int, int]], List[str]]:
+    """Return ``{module: (self_us, cumulative_us, depth)}`` and deferred modules imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _child_code()],
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: Dict[str, Tuple[int, int, int]] = {}
+    seen_marker = False
+    for line in result.stderr.splitlines():
+        if line == _MARKER:
+            seen_marker = True
+            continue
+        match = _IMPORTTIME_LINE.match(line)
+        if seen_marker and match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return timings, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    args = parse_args()
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+
+    run_once(env)  # warm-up: write bytecode caches
+    runs = [run_once(env) for _ in range(max(1, args.runs))]
+
+    totals = [sum(cum for _self, cum, depth in timings.values() if depth == 0) / 1000 for timings, _ in runs]
+    modules = {name for timings, _ in runs for name in timings}
+    rows = []
+    for name in modules:
+        samples = [timings[name] for timings, _ in runs if name in timings]
+        rows.append((
+            statistics.median(cum for _self, cum, _depth in samples) / 1000,
+            statistics.median(self_us for self_us, _cum, _depth in samples) / 1000,
+            name,
+        ))
+    rows.sort(reverse=True)
+
+    print(f"Startup imports ({len(runs)} runs): {', '.join(s.split()[-1] for s in STARTUP_IMPORTS)}")
+    print(f"  {'cumulative':>10}  {'self':>8}  module")
+    for cumulative_ms, self_ms, name in rows[: args.top]:
+        print(f"  {cumulative_ms:8.2f}ms  {self_ms:6.2f}ms  {name}")
+
+    total_ms = statistics.median(totals)
+    print(f"\nTotal startup import time: median {total_ms:.1f} ms (min {min(totals):.1f}, max {max(totals):.1f}),"
+          f" budget {args.budget_ms:.1f} ms")
+
+    failed = False
+    deferred = sorted({name for _timings, imported in runs for name in imported})
+    if deferred:
+        print(f"FAIL: imported at startup but should load on first use: {', '.join(deferred)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: startup imports exceed the {args.budget_ms:.1f} ms budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""Replay EventRecorder sessions through the rule pipeline.
+
+Streams one or more recordings (``.jsonl`` or ``.jsonl.gz``, e.g. the parts
+of a rotated recording, in order) through ``EventHandler.handle_event`` and
+reports events/sec and per-stage latency.
+
+Timing:
+    --speed 0      as fast as possible (default)
+    --speed 1      follow the recorded timing
+    --speed 10     ten times faster than recorded
+
+Endpoints:
+    null   count actions only (default)
+    mock   start the test mock VKB server and send real packets to it
+    vkb    send packets to a running VKB-Link at --host/--port
+
+--trace PATH writes the pipeline spans of the replay as Chrome Trace Event
+JSON (open in chrome://tracing or https://ui.perfetto.dev).
+
+Usage:
+    python scripts/dev/replay_recording.py recording.jsonl.gz --rules rules.json --speed 20
+    python scripts/dev/replay_recording.py recording.jsonl.gz --limit 5000 --trace replay-trace.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from edmcruleengine.events.endpoint import Endpoint  # noqa: E402
+from edmcruleengine.events.event_handler import EventHandler  # noqa: E402
+from edmcruleengine.events.replay import (  # noqa: E402
+    NullEndpoint,
+    ReplayConfig,
+    ReplayEngine,
+    iter_recordings,
+)
+from edmcruleengine.utils.clock import VirtualClock  # noqa: E402
+from edmcruleengine.vkb.vkb_client import VKBClient  # noqa: E402
+from edmcruleengine.vkb.vkb_target_pool import VKBTarget, VKBTargetPool  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", nargs="+", type=Path, help="Recording files, replayed in the given order")
+    parser.add_argument("--rules", type=Path, help="Rules file (default: <plugin-dir>/rules.json)")
+    parser.add_argument("--plugin-dir", type=Path, default=PROJECT_ROOT, help="Plugin directory holding the catalog")
+    parser.add_argument("--speed", type=float, default=0.0, help="Playback speed multiplier; 0 = max speed")
+    parser.add_argument("--limit", type=int, help="Replay at most this many events")
+    parser.add_argument("--endpoint", choices=("null", "mock", "vkb"), default="null")
+    parser.add_argument("--host", default="127.0.0.1", help="VKB-Link host for --endpoint vkb/mock")
+    parser.add_argument("--port", type=int, default=50995, help="VKB-Link port for --endpoint vkb/mock")
+    parser.add_argument("--trace", type=Path, help="Write pipeline spans as Chrome Trace Event JSON")
+    parser.add_argument("--trace-buffer", type=int, default=200000, help="Spans kept in the trace ring buffer")
+    return parser.parse_args()
+
+
+def _start_mock_server(host: str, port: int):
+    sys.path.insert(0, str(PROJECT_ROOT / "test"))
+    from mock_vkb_server import MockVKBServer
+
+    server = MockVKBServer(host, port, verbose=False)
+    threading.Thread(target=server.start, daemon=True, name="MockVKBServer").start()
+    deadline = time.monotonic() + 2.0
+    while not server.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return server
+
+
+def _build_endpoint(args: argparse.Namespace) -> Endpoint:
+    if args.endpoint == "null":
+        return NullEndpoint()
+    target = VKBTarget("replay", args.host, args.port)
+    return VKBTargetPool([target], {target.name: VKBClient(host=args.host, port=args.port)})
+
+
+def main() -> int:
+    args = parse_args()
+    missing: List[Path] = [path for path in args.recordings if not path.exists()]
+    if missing:
+        print(f"ERROR: recording not found: {', '.join(str(p) for p in missing)}")
+        return 1
+
+    server = _start_mock_server(args.host, args.port) if args.endpoint == "mock" else None
+    endpoint = _build_endpoint(args)
+    overrides = {"rules_path": str(args.rules)} if args.rules else {}
+    if args.trace:
+        overrides.update({"trace_enabled": True, "trace_buffer_size": args.trace_buffer})
+    clock = VirtualClock()
+    handler = EventHandler(
+        ReplayConfig(overrides),
+        endpoints=[endpoint],
+        plugin_dir=str(args.plugin_dir),
+        clock=clock,
+    )
+    if handler.rule_engine is None:
+        print("WARNING: no rules loaded; only the event path is measured")
+
+    handler.connect()
+    try:
+        speed: Optional[float] = args.speed if args.speed > 0 else None
+        report = ReplayEngine(handler, clock=clock, speed=speed).replay(
+            iter_recordings(args.recordings), limit=args.limit
+        )
+    finally:
+        handler.disconnect()
+        if server is not None:
+            print(f"Mock VKB server received {server.get_message_count()} packets")
+            server.stop()
+
+    print(report.format_summary())
+    if args.trace:
+        print(f"Trace written to {handler.tracer.dump(args.trace)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Run the rule engine against the live journal directory without EDMC.
+
+Tails the newest ``Journal.*.log`` (following rollover to new journals) and
+watches ``Status.json``, feeding both into ``EventHandler`` exactly as the
+EDMC hooks do.  Unless --from-start is given, the last session's signal
+snapshot is restored and state.* signals are seeded from the latest journal
+(see ``events/warm_start.py``); the snapshot is saved again on exit.  Useful on
+dedicated cockpit PCs and as a realistic load generator on CI (point it at a
+directory another process writes into).
+
+Endpoints:
+    null   count actions only
+    vkb    send packets to a running VKB-Link at --host/--port (default)
+
+Usage:
+    python scripts/dev/run_headless.py [--journal-dir DIR] [--rules rules.json] [--from-start | --no-warm-start]
+"""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from edmcruleengine.events.endpoint import Endpoint  # noqa: E402
+from edmcruleengine.events.event_handler import EventHandler  # noqa: E402
+from edmcruleengine.events.journal_tailer import (  # noqa: E402
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    HeadlessRunner,
+    default_journal_dir,
+)
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig  # noqa: E402
+from edmcruleengine.vkb.vkb_client import VKBClient  # noqa: E402
+from edmcruleengine.vkb.vkb_target_pool import VKBTarget, VKBTargetPool  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--journal-dir", type=Path, default=default_journal_dir(), help="Elite Dangerous journal directory")
+    parser.add_argument("--rules", type=Path, help="Rules file (default: <plugin-dir>/rules.json)")
+    parser.add_argument("--plugin-dir", type=Path, default=PROJECT_ROOT, help="Plugin directory holding the catalog")
+    parser.add_argument("--from-start", action="store_true", help="Process the current journal from its first line")
+    parser.add_argument("--no-warm-start", action="store_true", help="Do not seed state from the latest journal")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL_SECONDS, help="Idle poll interval in seconds")
+    parser.add_argument("--endpoint", choices=("null", "vkb"), default="vkb")
+    parser.add_argument("--host", default="127.0.0.1", help="VKB-Link host")
+    parser.add_argument("--port", type=int, default=50995, help="VKB-Link port")
+    return parser.parse_args()
+
+
+def _build_endpoint(args: argparse.Namespace) -> Endpoint:
+    if args.endpoint == "null":
+        return NullEndpoint()
+    target = VKBTarget("headless", args.host, args.port)
+    return VKBTargetPool([target], {target.name: VKBClient(host=args.host, port=args.port)})
+
+
+def main() -> int:
+    args = parse_args()
+    if args.journal_dir is None or not args.journal_dir.is_dir():
+        print(f"ERROR: journal directory not found: {args.journal_dir} (use --journal-dir)")
+        return 1
+
+    overrides = {"signal_snapshot_enabled": True}
+    if args.rules:
+        overrides["rules_path"] = str(args.rules)
+    handler = EventHandler(
+        ReplayConfig(overrides),
+        endpoints=[_build_endpoint(args)],
+        plugin_dir=str(args.plugin_dir),
+    )
+    if handler.rule_engine is None:
+        print("WARNING: no rules loaded; events are read but nothing is sent")
+
+    runner = HeadlessRunner(
+        handler,
+        args.journal_dir,
+        poll_interval=args.poll_interval,
+        start_at_end=not args.from_start,
+    )
+    signal.signal(signal.SIGINT, lambda *_: runner.stop())
+    handler.connect()
+    if not args.from_start:
+        handler.restore_signal_snapshot()
+        if not args.no_warm_start:
+            runner.warm_start()
+    try:
+        runner.run()
+    finally:
+        handler.save_signal_snapshot()
+        handler.disconnect()
+        handler.flush_unregistered_events()
+    print(f"Processed {runner.journal_events} journal events and {runner.status_updates} status updates")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
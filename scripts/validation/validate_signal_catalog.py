@@ -252,7 +252,7 @@ def validate_catalog_structure(catalog_path: Path) -> List[str]:
     try:
         from src.edmcruleengine.signals_catalog import SignalsCatalog  # type: ignore
 
-        SignalsCatalog.from_file(catalog_path)
+        SignalsCatalog.from_file(catalog_path, use_cache=False)
     except Exception as exc:
         errors.append(f"Catalog structure validation failed: {type(exc).__name__}: {exc}")
     return errors
@@ -91,16 +91,31 @@ def plugin_logger(module: str) -> logging.Logger:
     _apply_edmc_context_filter(log)
     return log
 
-from .vkb.vkb_client import VKBClient
-from .events.event_handler import EventHandler
-from .config.config import Config
-from .vkb.message_formatter import MessageFormatter, VKBLinkMessageFormatter
-
-__all__ = [
-    "VKBClient",
-    "EventHandler",
-    "Config",
-    "MessageFormatter",
-    "VKBLinkMessageFormatter",
-]
+# Public classes are imported on first access so that importing the package
+# (e.g. for ``__version__`` or ``plugin_logger``) does not pull in the rule
+# engine, catalog and VKB client at EDMC startup.
+_LAZY_EXPORTS = {
+    "VKBClient": ".vkb.vkb_client",
+    "EventHandler": ".events.event_handler",
+    "Config": ".config.config",
+    "MessageFormatter": ".vkb.message_formatter",
+    "VKBLinkMessageFormatter": ".vkb.message_formatter",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
@@ -7,8 +7,10 @@ Configuration is persisted by EDMC in the system-appropriate location
 """
 
 import json
+import threading
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, List, Mapping, Optional
 
 from .. import plugin_logger
 
@@ -56,9 +58,42 @@ _FALLBACK_DEFAULTS = {
     # Preferences/UI timings.
     "vkb_ui_apply_delay_seconds": 4,
     "vkb_ui_poll_interval_seconds": 2,
+    # Additional VKB-Link targets ("name=host:port") served by VKBTargetPool.
+    "vkb_targets": [],
+    "vkb_target_reconnect_interval_seconds": 5,
+    # Outbound shift-state damping (0 disables each).
+    "vkb_send_min_interval_ms": 0,
+    "vkb_send_hysteresis_ms": 0,
     "track_unregistered_events": False,
+    # Seed state.* signals from the latest journal on startup.
+    "warm_start_enabled": True,
+    # Journal data (KiB) the warm start reads at most, newest first (0 = no limit).
+    "warm_start_max_kb": 1024,
+    # Persisted signal snapshot (interval 0 saves on shutdown only).
+    "signal_snapshot_enabled": True,
+    "signal_snapshot_interval_seconds": 60,
+    # Pipeline latency histograms and counters (see utils/metrics.py).
+    "metrics_enabled": True,
+    # Pipeline span tracer and its ring buffer size in spans (see utils/tracing.py).
+    "trace_enabled": False,
+    "trace_buffer_size": 20000,
+    # One-shot sampling profiler run, cleared when its files are written
+    # to <plugin_dir>/profiles (see utils/profiling.py).
+    "profiling_enabled": False,
+    "profiling_duration_seconds": 30,
+    "profiling_interval_ms": 5,
+    "profiling_tracemalloc": False,
+    # Rule engine detail kept for the last N events (0 disables) and per-category
+    # sampling, e.g. "payload=0.1,conditions=0.25" (see utils/hot_path_log.py).
+    "debug_explain_events": 0,
+    "debug_sample_rates": "",
     "recorder_mock_commander": "CMDR",
     "recorder_mock_fid": "F0000000",
+    # Event recorder output (0 disables rotation; the size limit applies to the
+    # file on disk, i.e. compressed size when recorder_compress is on).
+    "recorder_compress": False,
+    "recorder_rotate_max_mb": 0,
+    "recorder_rotate_max_minutes": 0,
 }
 
 
@@ -101,6 +136,102 @@ def _load_defaults_from_file() -> dict[str, Any]:
 # Defaults for all configuration keys. Loaded from config_defaults.json.
 DEFAULTS = _load_defaults_from_file()
 
+_TRUE_STRINGS = ("true", "1", "yes", "on", "y", "t")
+_FALSE_STRINGS = ("false", "0", "no", "off", "n", "f", "")
+
+
+def _coerce(value: Any, default: Any) -> Any:
+    """Coerce a stored value to the type of ``default``; returns ``default`` on failure."""
+    if value is None:
+        return default
+    try:
+        if isinstance(default, bool):
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, (int, float)):
+                return value != 0
+            if isinstance(value, str):
+                normalized = value.strip().lower()
+                if normalized in _TRUE_STRINGS:
+                    return True
+                if normalized in _FALSE_STRINGS:
+                    return False
+                return default
+            return bool(value)
+        if isinstance(default, int):
+            return int(value)
+        if isinstance(default, float):
+            return float(value)
+        if isinstance(default, str):
+            return str(value)
+        if isinstance(default, list):
+            return list(value)
+    except (TypeError, ValueError):
+        return default
+    return value
+
+
+class ConfigSnapshot:
+    """
+    Immutable, typed view of every key in DEFAULTS.
+
+    Values are read from EDMC's store once and coerced to the type of their
+    default.  ``is_stored`` reports whether a key has a persisted value (as
+    opposed to falling back to its default).
+    """
+
+    __slots__ = ("_values", "_stored")
+
+    def __init__(self, values: Mapping[str, Any], stored: Iterable[str] = ()) -> None:
+        object.__setattr__(self, "_values", MappingProxyType(dict(values)))
+        object.__setattr__(self, "_stored", frozenset(stored))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ConfigSnapshot is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def is_stored(self, key: str) -> bool:
+        return key in self._stored
+
+    def keys(self) -> List[str]:
+        return list(self._values)
+
+    def as_dict(self) -> dict[str, Any]:
+        return dict(self._values)
+
+    def with_value(self, key: str, value: Any, *, stored: bool = True) -> "ConfigSnapshot":
+        """Return a copy with ``key`` replaced."""
+        values = dict(self._values)
+        values[key] = value
+        stored_keys = set(self._stored)
+        if stored:
+            stored_keys.add(key)
+        else:
+            stored_keys.discard(key)
+        return ConfigSnapshot(values, stored_keys)
+
+    def changed_keys(self, other: Optional["ConfigSnapshot"]) -> frozenset[str]:
+        """Keys whose value or stored-ness differs from ``other``."""
+        if other is None:
+            return frozenset(self._values)
+        keys = set(self._values) | set(other._values)
+        return frozenset(
+            key for key in keys
+            if self._values.get(key) != other._values.get(key)
+            or (key in self._stored) != (key in other._stored)
+        )
+
+
+ConfigSubscriber = Callable[[ConfigSnapshot, frozenset], None]
+
 
 class Config:
     """
@@ -109,12 +240,19 @@ class Config:
     Configuration is stored in EDMC's persistent storage and can be
     managed via EDMC's settings dialog if the plugin provides a UI panel.
 
+    All keys in DEFAULTS are read once into a ConfigSnapshot; ``get`` serves
+    them from the snapshot.  The snapshot is updated by ``set``/``delete`` and
+    reloaded by ``refresh`` (called on prefs_changed), and subscribers are
+    told which keys changed.
+
     For local testing without EDMC, falls back to in-memory defaults.
     """
 
     def __init__(self):
         """Initialize configuration (loads from EDMC's config store)."""
-        pass
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._snapshot_lock = threading.RLock()
+        self._subscribers: List[ConfigSubscriber] = []
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -134,42 +272,114 @@ class Config:
             # Local testing mode: return defaults
             return default
 
-        try:
-            # Determine the type of value we're expecting based on DEFAULTS
-            if key in DEFAULTS:
-                expected_type = type(DEFAULTS[key])
-
-                # Use type-specific getters for EDMC's config API
-                if expected_type is str:
-                    return config.get_str(f"{CONFIG_PREFIX}{key}", default)
-                elif expected_type is int:
-                    return config.get_int(f"{CONFIG_PREFIX}{key}", default)
-                elif expected_type is bool:
-                    # Robust boolean coercion from EDMC config
-                    val = config.get(f"{CONFIG_PREFIX}{key}")
-                    if val is None:
-                        return default
-                    if isinstance(val, bool):
-                        return val
-                    if isinstance(val, (int, float)):
-                        return val != 0
-                    if isinstance(val, str):
-                        normalized = val.strip().lower()
-                        if normalized in ("true", "1", "yes", "on", "y", "t"):
-                            return True
-                        if normalized in ("false", "0", "no", "off", "n", "f", ""):
-                            return False
-                        return default
-                    return bool(val)
-                elif expected_type is list:
-                    return config.get_list(f"{CONFIG_PREFIX}{key}", default)
-
-            # Fallback for unknown types
+        if key in DEFAULTS:
+            snapshot = self.snapshot()
+            if snapshot.is_stored(key):
+                return snapshot[key]
             return default
 
+        # Keys without a declared default are not cached
+        return default
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Return the current configuration snapshot (loaded on first use)."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._snapshot_lock:
+                if self._snapshot is None:
+                    self._snapshot = self._load_snapshot()
+                snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self) -> frozenset[str]:
+        """
+        Reload every key from EDMC's store and notify subscribers of changes.
+
+        Returns:
+            The set of keys whose value changed.
+        """
+        new_snapshot = self._load_snapshot()
+        with self._snapshot_lock:
+            old_snapshot = self._snapshot
+            self._snapshot = new_snapshot
+        changed = new_snapshot.changed_keys(old_snapshot) if old_snapshot is not None else frozenset()
+        if changed:
+            logger.debug(f"Configuration refreshed; changed keys: {sorted(changed)}")
+            self._notify(new_snapshot, changed)
+        return changed
+
+    def subscribe(self, callback: ConfigSubscriber) -> Callable[[], None]:
+        """
+        Register ``callback(snapshot, changed_keys)`` for configuration changes.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        with self._snapshot_lock:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._snapshot_lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def _notify(self, snapshot: ConfigSnapshot, changed: frozenset) -> None:
+        with self._snapshot_lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(snapshot, changed)
+            except Exception as e:
+                logger.error(f"Error in config change subscriber: {e}", exc_info=True)
+
+    def _apply_to_snapshot(self, key: str, value: Any, *, stored: bool) -> None:
+        """Update a loaded snapshot after a write and notify on change."""
+        if key not in DEFAULTS:
+            return
+        with self._snapshot_lock:
+            old_snapshot = self._snapshot
+            if old_snapshot is None:
+                return
+            new_snapshot = old_snapshot.with_value(key, value, stored=stored)
+            self._snapshot = new_snapshot
+        changed = new_snapshot.changed_keys(old_snapshot)
+        if changed:
+            self._notify(new_snapshot, changed)
+
+    def _load_snapshot(self) -> ConfigSnapshot:
+        values: dict[str, Any] = {}
+        stored: set[str] = set()
+        for key, default in DEFAULTS.items():
+            raw = self._read_stored(key, default)
+            if raw is None:
+                values[key] = default
+            else:
+                values[key] = _coerce(raw, default)
+                stored.add(key)
+        return ConfigSnapshot(values, stored)
+
+    @staticmethod
+    def _read_stored(key: str, default: Any) -> Any:
+        """Read the persisted value for ``key`` (None if unset or unavailable)."""
+        if config is None:
+            return None
+        full_key = f"{CONFIG_PREFIX}{key}"
+        try:
+            # Use type-specific getters for EDMC's config API
+            if isinstance(default, bool):
+                return config.get(full_key)
+            if isinstance(default, int):
+                return config.get_int(full_key, default=None)
+            if isinstance(default, str):
+                return config.get_str(full_key, default=None)
+            if isinstance(default, list):
+                return config.get_list(full_key, default=None)
+            return config.get(full_key)
         except Exception as e:
             logger.warning(f"Failed to retrieve config key '{key}': {e}")
-            return default
+            return None
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -189,6 +399,8 @@ class Config:
             logger.debug(f"Configuration '{key}' set to {value}")
         except Exception as e:
             logger.error(f"Failed to set config key '{key}': {e}")
+            return
+        self._apply_to_snapshot(key, _coerce(value, DEFAULTS.get(key)), stored=True)
 
     def delete(self, key: str) -> None:
         """
@@ -207,6 +419,8 @@ class Config:
             logger.debug(f"Configuration '{key}' deleted")
         except Exception as e:
             logger.error(f"Failed to delete config key '{key}': {e}")
+            return
+        self._apply_to_snapshot(key, DEFAULTS.get(key), stored=False)
 
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style access."""
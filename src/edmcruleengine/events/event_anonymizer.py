@@ -3,15 +3,102 @@ Event anonymization module for EDMC VKB Connector.
 
 Anonymizes Elite Dangerous events by replacing commander-specific and
 system-specific information with mock data while maintaining event validity.
+
+``CompiledAnonymizer`` is the shared copy-on-write engine used by both the
+``EventAnonymizer`` (unregistered-event samples) and the ``EventRecorder``.
 """
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 from .. import plugin_logger
 
 logger = plugin_logger(__name__)
 
+# Strings that contain none of these characters cannot match any path or IP
+# pattern, so no regex is ever run over them.
+_SCAN_CANDIDATE = re.compile(r"[\\/0-9]").search
+
+StringReplacement = Union[str, Callable[["re.Match[str]"], str]]
+
+
+class CompiledAnonymizer:
+    """
+    Single-pass, copy-on-write anonymization of nested event payloads.
+
+    ``key_rules`` is a dispatch table from dict key to ``(strings_only, fn)``.
+    ``fn(value)`` returns the replacement value; with ``strings_only`` set the
+    rule only applies to ``str`` values and anything else is walked normally.
+    All other strings are scrubbed with ``string_rules``: ordered
+    ``(pattern, replacement)`` pairs applied one after another, each to the
+    output of the previous rule, so text inside one rule's match (an IP in a
+    URL or file name) is still seen by later rules.  A combined alternation
+    is searched first so strings that match no rule are never rewritten.  A
+    callable replacement receives the match; ``match.group(0)`` is the text
+    matched by that rule and ``match.string`` is the value as that rule sees
+    it.  String replacements are inserted literally.
+
+    The input is never mutated.  Containers are copied only when something
+    beneath them changes, so untouched subtrees are shared with the original.
+    """
+
+    def __init__(
+        self,
+        key_rules: Mapping[str, Tuple[bool, Callable[[Any], Any]]],
+        string_rules: Sequence[Tuple[str, StringReplacement]],
+    ) -> None:
+        self._key_rules: Dict[str, Tuple[bool, Callable[[Any], Any]]] = dict(key_rules)
+        self._string_rules: List[Tuple[re.Pattern, Callable[["re.Match[str]"], str]]] = []
+        for pattern, replacement in string_rules:
+            if isinstance(replacement, str):
+                replacement = (lambda match, text=replacement: text)
+            self._string_rules.append((re.compile(pattern), replacement))
+        self._pattern: Optional[re.Pattern] = (
+            re.compile("|".join(f"(?:{pattern})" for pattern, _ in string_rules))
+            if string_rules else None
+        )
+
+    def anonymize(self, data: Any) -> Any:
+        """Return ``data`` with identifying values replaced (shared where unchanged)."""
+        return self._walk(data)
+
+    def scrub_string(self, value: str) -> str:
+        """Apply the string rules to one value; returns ``value`` itself if unchanged."""
+        if self._pattern is None or not _SCAN_CANDIDATE(value) or not self._pattern.search(value):
+            return value
+        result = value
+        for pattern, replacement in self._string_rules:
+            result = pattern.sub(replacement, result)
+        return value if result == value else result
+
+    def _walk(self, obj: Any) -> Any:
+        if isinstance(obj, str):
+            return self.scrub_string(obj)
+        if isinstance(obj, dict):
+            key_rules = self._key_rules
+            copied: Optional[Dict[Any, Any]] = None
+            for key, value in obj.items():
+                rule = key_rules.get(key)
+                if rule is not None and (not rule[0] or isinstance(value, str)):
+                    new_value = rule[1](value)
+                else:
+                    new_value = self._walk(value)
+                if new_value is not value:
+                    if copied is None:
+                        copied = dict(obj)
+                    copied[key] = new_value
+            return obj if copied is None else copied
+        if isinstance(obj, list):
+            copied_list: Optional[List[Any]] = None
+            for index, item in enumerate(obj):
+                new_item = self._walk(item)
+                if new_item is not item:
+                    if copied_list is None:
+                        copied_list = list(obj)
+                    copied_list[index] = new_item
+            return obj if copied_list is None else copied_list
+        return obj
+
 
 class EventAnonymizer:
     """
@@ -72,6 +159,22 @@ class EventAnonymizer:
         # Pattern for IP addresses
         self.ip_pattern = re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b')
 
+        self._engine = CompiledAnonymizer(
+            self._build_key_rules(),
+            [
+                (self.windows_path_pattern.pattern, r'C:\MockPath'),
+                (self.unix_path_pattern.pattern, self._replace_unix_path),
+                (self.ip_pattern.pattern, '127.0.0.1'),
+            ],
+        )
+
+    def _build_key_rules(self) -> Dict[str, Tuple[bool, Callable[[Any], Any]]]:
+        """Dispatch table for the field-name based replacements (string values only)."""
+        rules: Dict[str, Tuple[bool, Callable[[Any], Any]]] = {}
+        for field_name in self.COMMANDER_FIELDS | self.SHIP_FIELDS | self.PATH_FIELDS | self.NETWORK_FIELDS:
+            rules[field_name] = (True, lambda value, name=field_name: self._anonymize_string_field(name, value))
+        return rules
+
     def anonymize_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Anonymize an event by replacing identifying information.
@@ -80,56 +183,10 @@ class EventAnonymizer:
             event_data: Original event data
 
         Returns:
-            Anonymized copy of event data
-        """
-        # Create a deep copy to avoid modifying the original
-        anonymized = self._deep_copy_dict(event_data)
-
-        # Recursively anonymize the event
-        self._anonymize_dict(anonymized)
-
-        return anonymized
-
-    def _deep_copy_dict(self, data: Any) -> Any:
-        """Create a deep copy of data structures."""
-        if isinstance(data, dict):
-            return {k: self._deep_copy_dict(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._deep_copy_dict(item) for item in data]
-        else:
-            return data
-
-    def _anonymize_dict(self, data: Dict[str, Any]) -> None:
-        """
-        Recursively anonymize a dictionary in-place.
-
-        Args:
-            data: Dictionary to anonymize
-        """
-        for key, value in list(data.items()):
-            # Handle nested structures
-            if isinstance(value, dict):
-                self._anonymize_dict(value)
-            elif isinstance(value, list):
-                self._anonymize_list(value)
-            elif isinstance(value, str):
-                # Anonymize string values based on field name
-                data[key] = self._anonymize_string_field(key, value)
-
-    def _anonymize_list(self, data: List[Any]) -> None:
+            Anonymized event data.  The original is never modified; containers
+            with nothing to replace are shared with it rather than copied.
         """
-        Recursively anonymize a list in-place.
-
-        Args:
-            data: List to anonymize
-        """
-        for i, item in enumerate(data):
-            if isinstance(item, dict):
-                self._anonymize_dict(item)
-            elif isinstance(item, list):
-                self._anonymize_list(item)
-            elif isinstance(item, str):
-                data[i] = self._anonymize_string_value(item)
+        return self._engine.anonymize(event_data)
 
     def _anonymize_string_field(self, field_name: str, value: str) -> str:
         """
@@ -175,17 +232,14 @@ class EventAnonymizer:
         Returns:
             Anonymized string value
         """
-        # Replace Windows paths
-        value = self.windows_path_pattern.sub(r'C:\\MockPath', value)
-
-        # Replace Unix paths (but not URLs)
-        if not value.startswith(('http://', 'https://', 'ftp://')):
-            value = self.unix_path_pattern.sub(r'/mock/path', value)
-
-        # Replace IP addresses
-        value = self.ip_pattern.sub('127.0.0.1', value)
-
-        return value
+        return self._engine.scrub_string(value)
+
+    @staticmethod
+    def _replace_unix_path(match: "re.Match[str]") -> str:
+        """Replace Unix paths, but leave URLs untouched."""
+        if match.string.startswith(('http://', 'https://', 'ftp://')):
+            return match.group(0)
+        return '/mock/path'
 
     def _anonymize_path(self, path: str) -> str:
         """
@@ -4,18 +4,30 @@ Generic event handler for forwarding Elite Dangerous events to configurable endp
 
 from __future__ import annotations
 
-import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 from .. import plugin_logger
+from ..config.paths import data_path
 from ..rules.rule_loader import load_rules_file, RuleLoadError
 from ..rules.rules_engine import RuleEngine, MatchResult
+from ..rules.signal_snapshot import (
+    SNAPSHOT_FILE_NAME,
+    SignalSnapshot,
+    SnapshotWriter,
+    file_hash,
+    load_snapshot,
+)
 from ..rules.signals_catalog import SignalsCatalog, CatalogError
+from ..utils.clock import SYSTEM_CLOCK, Clock
+from ..utils.metrics import METRICS, Counter, MetricsRegistry
+from ..utils.hot_path_log import HotPathLog
+from ..utils.tracing import DEFAULT_CAPACITY, TRACER, SpanTracer
 from .unregistered_events_tracker import UnregisteredEventsTracker
 
 if TYPE_CHECKING:
     from ..config.config import Config
+    from ..utils.startup_timeline import StartupTimeline
     from .endpoint import Endpoint
 
 logger = plugin_logger(__name__)
@@ -35,6 +47,10 @@ class EventHandler:
         endpoints: Optional[List[Endpoint]] = None,
         *,
         plugin_dir: Optional[str] = None,
+        startup_timeline: Optional["StartupTimeline"] = None,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[SpanTracer] = None,
     ):
         """
         Initialize event handler.
@@ -43,8 +59,30 @@ class EventHandler:
             config: Configuration object.
             endpoints: Initial list of rule action endpoints.
             plugin_dir: Root directory of the plugin.
+            startup_timeline: Optional timeline receiving catalog/rules load durations.
+            clock: Time source shared with the rule engine and unregistered
+                events tracker (defaults to real time).
+            metrics: Pipeline metrics registry shared with the rule engine
+                (defaults to the process-wide one); ``metrics_enabled``
+                switches it on or off.
+            tracer: Span tracer shared with the rule engine (defaults to the
+                process-wide one); ``trace_enabled`` switches it on or off.
         """
         self.config = config
+        self.clock = clock or SYSTEM_CLOCK
+        self.metrics = metrics or METRICS
+        self.metrics.enabled = bool(config.get("metrics_enabled", True))
+        self._handle_latency = self.metrics.histogram("event.handle")
+        self._reload_check_latency = self.metrics.histogram("rules.reload_check")
+        self._events_received = self.metrics.counter("events.received")
+        self._events_filtered = self.metrics.counter("events.filtered")
+        self._recent_window = self.metrics.gauge("events.recent_window")
+        self._source_counters: Dict[str, Counter] = {}
+        self.tracer = tracer or TRACER
+        self._configure_tracer()
+        # Sampled rule engine debug detail; kept across rule reloads
+        self.hot_log = HotPathLog(plugin_logger(RuleEngine.__module__))
+        self._configure_hot_log()
         self.plugin_dir = Path(plugin_dir) if plugin_dir else Path.cwd()
         self.endpoints = endpoints if endpoints is not None else []
 
@@ -60,16 +98,58 @@ class EventHandler:
         self._recent_events: Dict[str, float] = {}  # event_name -> timestamp
         self._event_window_seconds = 5  # How long to track events
 
-        self._load_catalog()
-        self._load_rules()
+        # Persisted signal snapshot (see rules/signal_snapshot.py)
+        self._catalog_hash = ""
+        self._rules_hash = ""
+        self._snapshot_path = self.plugin_dir / SNAPSHOT_FILE_NAME
+        self._snapshot_enabled = bool(config.get("signal_snapshot_enabled", True))
+        self._snapshot_interval = float(config.get("signal_snapshot_interval_seconds", 60) or 0)
+        self._snapshot_saved_at = self.clock.monotonic()
+        self._snapshot_writer = SnapshotWriter()
+        # Restore waiting for the commander (see restore_signal_snapshot_when_known)
+        self._snapshot_restore_pending = False
+
+        if startup_timeline is not None:
+            with startup_timeline.stage("catalog_load"):
+                self._load_catalog()
+            with startup_timeline.stage("rules_compile"):
+                self._load_rules()
+        else:
+            self._load_catalog()
+            self._load_rules()
 
         # Initialize unregistered events tracker
         self.unregistered_events_tracker = UnregisteredEventsTracker(
             self.plugin_dir,
-            catalog=self.catalog
+            catalog=self.catalog,
+            clock=self.clock,
+            metrics=self.metrics,
         )
         self.track_unregistered_events = config.get("track_unregistered_events", False)
 
+        subscribe = getattr(config, "subscribe", None)
+        if callable(subscribe):
+            subscribe(self._on_config_changed)
+
+    def _on_config_changed(self, snapshot: Any, changed_keys: frozenset) -> None:
+        """Apply handler-level settings as soon as they change in config."""
+        if "enabled" in changed_keys:
+            self.enabled = self.config.get("enabled", True)
+        if "debug" in changed_keys:
+            self.debug = self.config.get("debug", False)
+        if "track_unregistered_events" in changed_keys:
+            self.track_unregistered_events = self.config.get("track_unregistered_events", False)
+        if "signal_snapshot_enabled" in changed_keys:
+            self._snapshot_enabled = bool(self.config.get("signal_snapshot_enabled", True))
+        if "signal_snapshot_interval_seconds" in changed_keys:
+            self._snapshot_interval = float(self.config.get("signal_snapshot_interval_seconds", 60) or 0)
+        if "metrics_enabled" in changed_keys:
+            self.metrics.enabled = bool(self.config.get("metrics_enabled", True))
+        if changed_keys & {"trace_enabled", "trace_buffer_size"}:
+            self._configure_tracer()
+        if changed_keys & {"debug_explain_events", "debug_sample_rates"}:
+            self._configure_hot_log()
+
     @property
     def track_unregistered_events(self) -> bool:
         """Whether unregistered event tracking is enabled."""
@@ -86,6 +166,9 @@ class EventHandler:
             mock_ship_name=self.config.get("mock_ship_name", "TestShip"),
             mock_ship_ident=self.config.get("mock_ship_ident", "TEST-01"),
         )
+        tracker = getattr(self, "unregistered_events_tracker", None)
+        if tracker is not None:
+            tracker.anonymizer = self.anonymizer
 
     @property
     def vkb_client(self) -> Any:
@@ -144,18 +227,32 @@ class EventHandler:
         source: str = "journal",
         cmdr: str = "",
         is_beta: bool = False,
+        state: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """
         Handle an EDMC event and evaluate rules.
+
+        ``state`` is EDMC's state dict passed with journal events; the rule
+        engine tracks which of its sections changed instead of copying it.
         """
         if not self.enabled:
             return
 
+        started = self.metrics.start()
+        trace_started = self.tracer.begin()
+        self._events_received.inc()
+        source_counter = self._source_counters.get(source)
+        if source_counter is None:
+            source_counter = self._source_counters[source] = self.metrics.counter(f"events.source.{source}")
+        source_counter.inc()
         self._reload_rules_if_changed()
+        self._reload_check_latency.observe_since(started)
+        self.tracer.end("rules.reload_check", trace_started)
         self._handle_session_events(event_type)
 
         # Filter by configured event types if list is not empty
         if self.event_types and event_type not in self.event_types:
+            self._events_filtered.inc()
             return
 
         if self.debug:
@@ -163,15 +260,18 @@ class EventHandler:
 
         # Track journal events with timestamps for recent operator
         if source == "journal":
-            current_time = time.time()
+            current_time = self.clock.time()
             self._recent_events[event_type] = current_time
             cutoff = current_time - self._event_window_seconds
             self._recent_events = {
                 k: v for k, v in self._recent_events.items() if v >= cutoff
             }
+            self._recent_window.set(len(self._recent_events))
 
         # Run rule engine
         if self.rule_engine:
+            if self._snapshot_restore_pending and cmdr:
+                self._restore_pending_snapshot(cmdr)
             try:
                 context = {
                     "recent_events": self._recent_events.copy(),
@@ -186,10 +286,18 @@ class EventHandler:
                     event_type=event_type,
                     entry=event_data,
                     context=context,
+                    state=state,
                 )
             except Exception as e:
                 logger.debug(f"Error in rule engine: {e}", exc_info=True)
 
+            if (
+                self._snapshot_enabled
+                and self._snapshot_interval > 0
+                and self.clock.monotonic() - self._snapshot_saved_at >= self._snapshot_interval
+            ):
+                self._queue_signal_snapshot()
+
         # Track unregistered events
         if self._track_unregistered_events:
             try:
@@ -197,6 +305,116 @@ class EventHandler:
             except Exception as e:
                 logger.debug(f"Error tracking unregistered event: {e}", exc_info=True)
 
+        self._handle_latency.observe_since(started)
+        if trace_started is not None:
+            self.tracer.end("handle_event", trace_started, args={"event": event_type, "source": source})
+
+    def seed_state(self, state: Dict[str, Any], *, cmdr: str = "", is_beta: bool = False) -> None:
+        """
+        Evaluate rules once against a warm-start state before live events.
+
+        Establishes the initial edge-trigger state (and sends the resulting
+        actions) for rules whose ``state.*`` signals are known, without
+        touching recent-event windows or unregistered event tracking.
+        """
+        if not self.enabled or not self.rule_engine:
+            return
+        if self._snapshot_restore_pending and cmdr:
+            self._restore_pending_snapshot(cmdr)
+        try:
+            self.rule_engine.on_notification(
+                cmdr=cmdr,
+                is_beta=is_beta,
+                source="warm_start",
+                event_type="WarmStart",
+                entry={"event": "WarmStart"},
+                context={"recent_events": {}, "trigger_source": "warm_start", "event_name": "WarmStart"},
+                state=state,
+            )
+        except Exception as e:
+            logger.warning(f"Error seeding warm-start state: {e}", exc_info=True)
+
+    def save_signal_snapshot(self) -> bool:
+        """Persist the rule engine's last known signals and edge state now (on shutdown)."""
+        self._snapshot_saved_at = self.clock.monotonic()
+        snapshot = self._build_signal_snapshot()
+        if snapshot is None:
+            return False
+        return self._snapshot_writer.flush(self._snapshot_path, snapshot)
+
+    def _queue_signal_snapshot(self) -> None:
+        """Hand a periodic snapshot to the background writer (no disk I/O here)."""
+        self._snapshot_saved_at = self.clock.monotonic()
+        snapshot = self._build_signal_snapshot()
+        if snapshot is not None:
+            self._snapshot_writer.submit(self._snapshot_path, snapshot)
+
+    def _build_signal_snapshot(self) -> Optional[SignalSnapshot]:
+        engine = self.rule_engine
+        if not self._snapshot_enabled or engine is None or engine.last_identity is None:
+            return None
+        cmdr, is_beta = engine.last_identity
+        return SignalSnapshot(
+            catalog_hash=self._catalog_hash,
+            rules_hash=self._rules_hash,
+            cmdr=cmdr,
+            is_beta=is_beta,
+            signals=dict(engine.last_known_signals),
+            edges=engine.edge_states(),
+            saved_at=self.clock.time(),
+        )
+
+    def restore_signal_snapshot(self, cmdr: Optional[str] = None) -> bool:
+        """
+        Restore the persisted snapshot if it matches the loaded catalog and rules.
+
+        Restored edge state is re-sent to the endpoints once so hardware that
+        restarted empty matches the rules again.  ``cmdr`` (when known)
+        rejects snapshots taken for a different commander.
+        """
+        engine = self.rule_engine
+        if not self._snapshot_enabled or engine is None:
+            return False
+        snapshot = load_snapshot(self._snapshot_path)
+        if snapshot is None:
+            return False
+        if not snapshot.matches(self._catalog_hash, self._rules_hash):
+            logger.info("Signal snapshot ignored: catalog or rules changed since it was saved")
+            return False
+        if cmdr is not None and cmdr != snapshot.cmdr:
+            logger.info("Signal snapshot ignored: taken for a different commander")
+            return False
+
+        restored = engine.restore_state(snapshot.signals, snapshot.edges)
+        engine.last_identity = (snapshot.cmdr, snapshot.is_beta)
+        sent = engine.reapply_edge_actions(snapshot.cmdr, snapshot.is_beta)
+        logger.info(
+            f"Restored signal snapshot: {len(snapshot.signals)} signal(s), "
+            f"{restored} edge state(s), re-sent actions for {sent} rule(s)"
+        )
+        return True
+
+    def restore_signal_snapshot_when_known(self, cmdr: Optional[str] = None) -> bool:
+        """
+        Restore the snapshot for ``cmdr``, or once the commander is known.
+
+        Without a commander the restore waits for the first warm start seed
+        or event that carries one, so a snapshot taken for another commander
+        is never restored (and its edge actions never re-sent).
+        """
+        if cmdr:
+            self._snapshot_restore_pending = False
+            return self.restore_signal_snapshot(cmdr=cmdr)
+        self._snapshot_restore_pending = self._snapshot_enabled
+        return False
+
+    def _restore_pending_snapshot(self, cmdr: str) -> None:
+        self._snapshot_restore_pending = False
+        try:
+            self.restore_signal_snapshot(cmdr=cmdr)
+        except Exception as e:
+            logger.warning(f"Could not restore signal snapshot: {e}")
+
     def _handle_rule_action(self, result: MatchResult) -> None:
         """
         Relay rule match actions to endpoints.
@@ -215,19 +433,46 @@ class EventHandler:
                     logger.info(f"[{result.rule_title}] {message}")
                     continue
 
-                # Delegate to endpoints
+                # Delegate to endpoints.  VKB shift actions go to every endpoint
+                # (the primary VKB-Link and any target pool each apply the
+                # tokens they own); other actions stop at the first handler.
+                broadcast = key.startswith("vkb_")
                 handled = False
                 for endpoint in self.endpoints:
+                    trace_started = self.tracer.begin()
                     try:
                         if endpoint.handle_action(key, value, result):
                             handled = True
-                            break
+                            if not broadcast:
+                                break
                     except Exception as e:
                         logger.error(f"Error in endpoint '{endpoint.name}' action handler: {e}")
+                    finally:
+                        if trace_started is not None:
+                            self.tracer.end(
+                                f"action.{key}", trace_started, "action",
+                                args={"endpoint": endpoint.name, "rule": result.rule_id},
+                            )
                 
                 if not handled and key != "log":
                     logger.debug(f"Action key '{key}' was not handled by any endpoint")
 
+    def _configure_tracer(self) -> None:
+        self.tracer.configure(
+            enabled=bool(self.config.get("trace_enabled", False)),
+            capacity=int(self.config.get("trace_buffer_size", DEFAULT_CAPACITY) or DEFAULT_CAPACITY),
+        )
+
+    def _configure_hot_log(self) -> None:
+        self.hot_log.configure(
+            capacity=int(self.config.get("debug_explain_events", 0) or 0),
+            sample_rates=self.config.get("debug_sample_rates", "") or {},
+        )
+
+    def explain_recent_events(self, count: Optional[int] = None) -> List[str]:
+        """Rule engine detail for the last ``count`` events (``debug_explain_events`` > 0)."""
+        return self.hot_log.explain(count)
+
     def _handle_session_events(self, event_type: str) -> None:
         """Notify endpoints of session-level lifecycle events."""
         if event_type in ("Commander", "LoadGame", "Shutdown"):
@@ -248,6 +493,7 @@ class EventHandler:
     def _load_catalog(self) -> None:
         try:
             self.catalog = SignalsCatalog.from_plugin_dir(str(self.plugin_dir))
+            self._catalog_hash = file_hash(data_path(self.plugin_dir, "signals_catalog.json"))
             logger.info("Loaded signals catalog")
             if hasattr(self, 'unregistered_events_tracker'):
                 self.unregistered_events_tracker.set_catalog(self.catalog)
@@ -273,8 +519,17 @@ class EventHandler:
         try:
             mtime_ns = rules_path.stat().st_mtime_ns
             rules = load_rules_file(rules_path)
-            self.rule_engine = RuleEngine(rules, self.catalog, action_handler=self._handle_rule_action)
+            self.rule_engine = RuleEngine(
+                rules,
+                self.catalog,
+                action_handler=self._handle_rule_action,
+                clock=self.clock,
+                metrics=self.metrics,
+                tracer=self.tracer,
+                hot_log=self.hot_log,
+            )
             self._rules_mtime_ns = mtime_ns
+            self._rules_hash = file_hash(rules_path)
             logger.info(f"Loaded {len(rules)} rules from {rules_path}")
         except Exception as e:
             if not preserve_on_error:
@@ -309,6 +564,9 @@ class EventHandler:
     def clear_all_unregistered_events(self) -> int:
         return self.unregistered_events_tracker.clear_all_events()
 
+    def flush_unregistered_events(self) -> None:
+        self.unregistered_events_tracker.flush()
+
     # --- Compatibility Proxy Methods (Delegates to VKBLinkManager endpoint) ---
 
     def set_connection_status_override(self, status: Optional[str]) -> None:
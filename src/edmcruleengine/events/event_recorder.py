@@ -4,31 +4,27 @@ Event Recorder for EDMC VKB Connector.
 Records all incoming EDMC events to a JSONL file for debugging and analysis.
 Each line is a self-contained JSON object with timestamp, source, event type,
 and the anonymized event payload. Personal information is automatically redacted.
+Writing happens on a background thread in batches, optionally gzip-compressed
+and rotated by size or age.
 """
 
-import copy
+import gzip
 import json
+import os
+import queue
 import re
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .. import plugin_logger
+from ..utils.metrics import METRICS, MetricsRegistry
+from .event_anonymizer import CompiledAnonymizer
 
 logger = plugin_logger(__name__)
 
-# Keys whose values are always commander-identifying
-_COMMANDER_KEYS = {"Commander", "FID"}
-
-# Keys whose string values may contain filesystem paths or environment info
-_PATH_KEYS = {
-    "filename", "Filename", "FileName",
-    "path", "Path",
-    "directory", "Directory",
-    "gameversion", "build",
-}
-
 # Regex patterns for environment-identifying strings
 _WIN_PATH_RE = re.compile(r"[A-Za-z]:\\(?:[^\\\/:*?\"<>|\r\n]+\\)*[^\\\/:*?\"<>|\r\n]*")
 _UNIX_HOME_RE = re.compile(r"/home/[^/\s]+")
@@ -38,21 +34,88 @@ _IP_RE = re.compile(
     r"(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\b"
 )
 
+# Sentinel placed on the writer queue by stop()
+_STOP = object()
+
 
 class EventRecorder:
-    """Records EDMC events to a JSONL file."""
+    """
+    Records EDMC events to a JSONL file.
+
+    ``record`` timestamps the event, snapshots its payload as JSON and hands
+    it to a queue; a background writer thread anonymizes, serializes and
+    writes events in batches, flushing when ``flush_batch_size`` lines are
+    buffered or ``flush_interval_seconds`` has elapsed.  Output can be
+    gzip-compressed and rotated by size or age.
 
-    def __init__(self) -> None:
+    The snapshot is taken on the dispatch thread because EDMC only makes a
+    shallow copy of each entry per plugin: nested lists and dicts are shared
+    with EDMC and other plugins and may change after ``record`` returns.
+    """
+
+    DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+    DEFAULT_FLUSH_BATCH_SIZE = 256
+    DEFAULT_QUEUE_SIZE = 10000
+
+    def __init__(
+        self,
+        *,
+        compress: bool = False,
+        rotate_max_bytes: int = 0,
+        rotate_max_seconds: float = 0,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
         self._lock = threading.Lock()
+        self.metrics = metrics or METRICS
+        self._record_latency = self.metrics.histogram("recorder.record")
+        self._write_latency = self.metrics.histogram("recorder.write")
+        self._dropped = self.metrics.counter("recorder.dropped")
+        self._queue_depth = self.metrics.gauge("recorder.queue_depth")
+        self._batch_bytes = self.metrics.gauge("recorder.batch_bytes")
         self._file = None
         self._output_path: Optional[Path] = None
+        self._output_paths: List[Path] = []
         self._event_count: int = 0
+        self._dropped_count: int = 0
         self._last_event_type: str = ""
         self._recording: bool = False
 
+        self.compress = compress
+        self.rotate_max_bytes = max(0, int(rotate_max_bytes or 0))
+        self.rotate_max_seconds = max(0.0, float(rotate_max_seconds or 0))
+        self.flush_interval_seconds = max(0.01, float(flush_interval_seconds))
+        self.flush_batch_size = max(1, int(flush_batch_size))
+        self._queue_size = max(1, int(queue_size))
+        self._queue: Optional["queue.Queue[Any]"] = None
+        self._writer: Optional[threading.Thread] = None
+        self._base_path: Optional[Path] = None
+        self._part_index = 0
+        self._part_bytes = 0
+        self._part_started = 0.0
+
         # Anonymization is mandatory
         self.mock_commander: str = "CMDR_Redacted"
         self.mock_fid: str = "F0000000"
+        self._anonymizer = CompiledAnonymizer(
+            {
+                "Commander": (False, lambda _value: self.mock_commander),
+                "FID": (False, lambda _value: self.mock_fid),
+            },
+            [
+                (_WIN_PATH_RE.pattern, self._redact_win_path),
+                (_UNIX_HOME_RE.pattern, "/home/redacted"),
+                (_IP_RE.pattern, "0.0.0.0"),
+            ],
+        )
+
+    def configure(self, config) -> None:
+        """Apply the ``recorder_*`` config settings; takes effect on the next start()."""
+        self.compress = bool(config.get("recorder_compress", False))
+        self.rotate_max_bytes = max(0, int(config.get("recorder_rotate_max_mb", 0) or 0)) * 1024 * 1024
+        self.rotate_max_seconds = max(0, int(config.get("recorder_rotate_max_minutes", 0) or 0)) * 60.0
 
     @property
     def is_recording(self) -> bool:
@@ -62,71 +125,217 @@ class EventRecorder:
     def event_count(self) -> int:
         return self._event_count
 
+    @property
+    def dropped_count(self) -> int:
+        """Events discarded because the writer queue was full."""
+        return self._dropped_count
+
     @property
     def last_event_type(self) -> str:
         return self._last_event_type
 
     @property
     def output_path(self) -> Optional[Path]:
+        """File currently (or most recently) written to."""
         return self._output_path
 
+    @property
+    def output_paths(self) -> List[Path]:
+        """All files written during the current/last recording, in order."""
+        return list(self._output_paths)
+
     def start(self, output_path: Path) -> None:
         """Start recording events to the given file path."""
         with self._lock:
             if self._recording:
                 return
+            output_path = Path(output_path)
+            if self.compress and output_path.suffix != ".gz":
+                output_path = output_path.with_name(output_path.name + ".gz")
             try:
-                self._output_path = output_path
-                self._file = open(output_path, "a", encoding="utf-8")
+                self._base_path = output_path
+                self._part_index = 0
+                self._output_paths = []
+                self._open_part(output_path)
                 self._event_count = 0
+                self._dropped_count = 0
                 self._last_event_type = ""
+                self._queue = queue.Queue(maxsize=self._queue_size)
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    args=(self._queue,),
+                    name="EventRecorderWriter",
+                    daemon=True,
+                )
                 self._recording = True
+                self._writer.start()
                 logger.info(f"Event recording started: {output_path}")
             except Exception as e:
                 logger.error(f"Failed to start event recording: {e}")
                 self._recording = False
-                if self._file:
-                    self._file.close()
-                    self._file = None
+                self._close_file()
                 raise
 
     def stop(self) -> None:
-        """Stop recording and close the file."""
+        """Stop recording, drain queued events and close the file."""
         with self._lock:
             if not self._recording:
                 return
             self._recording = False
-            if self._file:
-                try:
-                    self._file.close()
-                except Exception as e:
-                    logger.error(f"Error closing recording file: {e}")
-                finally:
-                    self._file = None
-            logger.info(
-                f"Event recording stopped. {self._event_count} events recorded to {self._output_path}"
-            )
+            writer, pending = self._writer, self._queue
+            self._writer = None
+            self._queue = None
+        if pending is not None:
+            pending.put(_STOP)
+        if writer is not None:
+            writer.join()
+        with self._lock:
+            self._close_file()
+        logger.info(
+            f"Event recording stopped. {self._event_count} events recorded to {self._output_path}"
+            + (f" ({self._dropped_count} dropped)" if self._dropped_count else "")
+        )
 
     def record(self, source: str, event_type: str, event_data: Dict[str, Any]) -> None:
-        """Record a single event with mandatory anonymization. No-op if not recording."""
+        """Queue a single event for (anonymized) recording. No-op if not recording."""
         if not self._recording:
             return
+        pending = self._queue
+        if pending is None:
+            return
+        started = self.metrics.start()
+        try:
+            payload = json.dumps(event_data, default=str)
+        except Exception as e:
+            logger.error(f"Error recording event: {e}")
+            return
+        try:
+            pending.put_nowait((datetime.now(timezone.utc), source, event_type, payload))
+        except queue.Full:
+            self._dropped_count += 1
+            self._dropped.inc()
+            return
+        self._event_count += 1
+        self._last_event_type = event_type
+        self._record_latency.observe_since(started)
+
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
+
+    def _writer_loop(self, pending: "queue.Queue[Any]") -> None:
+        batch: List[str] = []
+        last_flush = time.monotonic()
+        stopping = False
+        while not stopping:
+            timeout = max(0.0, self.flush_interval_seconds - (time.monotonic() - last_flush))
+            try:
+                item = pending.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stopping = True
+            elif item is not None:
+                line = self._serialize(item)
+                if line is not None:
+                    batch.append(line)
+                # Drain whatever else is already waiting without blocking.
+                while len(batch) < self.flush_batch_size:
+                    try:
+                        item = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    line = self._serialize(item)
+                    if line is not None:
+                        batch.append(line)
+
+            due = time.monotonic() - last_flush >= self.flush_interval_seconds
+            if batch and (stopping or due or len(batch) >= self.flush_batch_size):
+                # Serialized lines awaiting write are the recorder's buffered memory
+                self._queue_depth.set(pending.qsize())
+                self._batch_bytes.set(sum(len(line) for line in batch))
+                self._write_batch(batch)
+                batch = []
+                last_flush = time.monotonic()
+            elif due:
+                last_flush = time.monotonic()
+
+    def _serialize(self, item: tuple) -> Optional[str]:
+        ts, source, event_type, payload = item
+        try:
+            record = {
+                "ts": ts.isoformat(),
+                "source": source,
+                "event": event_type,
+                "data": self._anonymize_data(json.loads(payload)),  # Always anonymize
+            }
+            return json.dumps(record, default=str) + "\n"
+        except Exception as e:
+            logger.error(f"Error recording event: {e}")
+            return None
+
+    def _write_batch(self, lines: List[str]) -> None:
+        started = self.metrics.start()
         with self._lock:
-            if not self._recording or not self._file:
+            if not self._file:
                 return
             try:
-                record = {
-                    "ts": datetime.now(timezone.utc).isoformat(),
-                    "source": source,
-                    "event": event_type,
-                    "data": self._anonymize_data(event_data),  # Always anonymize
-                }
-                self._file.write(json.dumps(record, default=str) + "\n")
+                for line in lines:
+                    if self._should_rotate():
+                        self._rotate()
+                    self._file.write(line)
+                    if not self.compress:
+                        self._part_bytes += len(line)
                 self._file.flush()
-                self._event_count += 1
-                self._last_event_type = event_type
+                if self.compress:
+                    # Size of the .gz part on disk, so rotate_max_bytes matches
+                    # the files (checked once per batch)
+                    self._part_bytes = os.path.getsize(self._output_path)
             except Exception as e:
-                logger.error(f"Error recording event: {e}")
+                logger.error(f"Error writing recorded events: {e}")
+        self._write_latency.observe_since(started)
+
+    def _should_rotate(self) -> bool:
+        if self._part_bytes == 0:
+            return False
+        if self.rotate_max_bytes and self._part_bytes >= self.rotate_max_bytes:
+            return True
+        if self.rotate_max_seconds and time.monotonic() - self._part_started >= self.rotate_max_seconds:
+            return True
+        return False
+
+    def _rotate(self) -> None:
+        """Close the current part and continue in ``<name>.<NNN>.jsonl[.gz]``."""
+        self._close_file()
+        self._part_index += 1
+        base = self._base_path
+        suffixes = "".join(base.suffixes)
+        stem = base.name[: -len(suffixes)] if suffixes else base.name
+        path = base.with_name(f"{stem}.{self._part_index:03d}{suffixes}")
+        self._open_part(path)
+        logger.info(f"Event recording rotated to {path}")
+
+    def _open_part(self, path: Path) -> None:
+        if self.compress:
+            self._file = gzip.open(path, "at", encoding="utf-8")
+        else:
+            self._file = open(path, "a", encoding="utf-8")
+        self._output_path = path
+        self._output_paths.append(path)
+        self._part_bytes = 0
+        self._part_started = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._file:
+            try:
+                self._file.close()
+            except Exception as e:
+                logger.error(f"Error closing recording file: {e}")
+            finally:
+                self._file = None
 
     # ------------------------------------------------------------------
     # Anonymization
@@ -139,38 +348,15 @@ class EventRecorder:
         - Commander name and FID fields with configured mock values
         - Windows/Unix filesystem paths with redacted placeholders
         - Non-localhost IP addresses with 0.0.0.0
+
+        Unchanged subtrees are shared with ``data`` rather than copied; the
+        result is only serialized, never mutated.
         """
-        return self._walk(copy.deepcopy(data))
-
-    def _walk(self, obj: Any) -> Any:
-        """Recursively walk and scrub a data structure."""
-        if isinstance(obj, dict):
-            for key in list(obj.keys()):
-                if key in _COMMANDER_KEYS:
-                    if key == "FID":
-                        obj[key] = self.mock_fid
-                    else:
-                        obj[key] = self.mock_commander
-                elif key in _PATH_KEYS and isinstance(obj[key], str):
-                    obj[key] = self._scrub_string(obj[key])
-                else:
-                    obj[key] = self._walk(obj[key])
-            return obj
-        elif isinstance(obj, list):
-            return [self._walk(item) for item in obj]
-        elif isinstance(obj, str):
-            return self._scrub_string(obj)
-        return obj
+        return self._anonymizer.anonymize(data)
 
     def _scrub_string(self, value: str) -> str:
         """Scrub identifying information from a string value."""
-        # Replace Windows paths  (e.g. C:\Users\john\... → X:\Redacted\path)
-        value = _WIN_PATH_RE.sub(self._redact_win_path, value)
-        # Replace Unix home paths (e.g. /home/john/... → /home/redacted/...)
-        value = _UNIX_HOME_RE.sub("/home/redacted", value)
-        # Replace non-localhost IP addresses
-        value = _IP_RE.sub("0.0.0.0", value)
-        return value
+        return self._anonymizer.scrub_string(value)
 
     @staticmethod
     def _redact_win_path(match: re.Match) -> str:
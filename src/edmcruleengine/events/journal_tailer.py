@@ -0,0 +1,266 @@
+"""
+Headless journal tailing for running the rule engine without EDMC.
+
+``JournalTailer`` follows the newest ``Journal.*.log`` in the Elite Dangerous
+journal directory with an offset-tracking incremental reader: each poll reads
+only the bytes appended since the previous poll, keeps a trailing partial line
+for the next poll, and drains the old file before switching when the game
+starts a new journal.  ``StatusWatcher`` re-reads ``Status.json`` only when
+its mtime or size changes.  ``HeadlessRunner`` feeds both into
+``EventHandler.handle_event`` the same way ``load.journal_entry`` and
+``load.dashboard_entry`` do under EDMC.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .. import plugin_logger
+
+if TYPE_CHECKING:
+    from .event_handler import EventHandler
+
+logger = plugin_logger(__name__)
+
+JOURNAL_GLOB = "Journal.*.log"
+STATUS_FILE_NAME = "Status.json"
+DEFAULT_POLL_INTERVAL_SECONDS = 0.25
+
+
+def default_journal_dir() -> Optional[Path]:
+    """Return the standard Windows journal directory if it exists."""
+    profile = os.environ.get("USERPROFILE")
+    if not profile:
+        return None
+    path = Path(profile) / "Saved Games" / "Frontier Developments" / "Elite Dangerous"
+    return path if path.is_dir() else None
+
+
+def find_latest_journal(journal_dir: Path | str) -> Optional[Path]:
+    """Return the most recently written ``Journal.*.log``, or None."""
+    newest: Optional[Tuple[int, str, Path]] = None
+    try:
+        candidates = list(Path(journal_dir).glob(JOURNAL_GLOB))
+    except OSError:
+        return None
+    for path in candidates:
+        try:
+            key = (path.stat().st_mtime_ns, path.name, path)
+        except OSError:
+            continue
+        if newest is None or key[:2] > newest[:2]:
+            newest = key
+    return newest[2] if newest else None
+
+
+class JournalTailer:
+    """
+    Incremental reader for the newest journal file.
+
+    Args:
+        journal_dir: Directory containing ``Journal.*.log`` files.
+        start_at_end: Skip the content already in the newest journal when
+            tailing starts (only new events are returned).  Files that appear
+            later are always read from the beginning.
+    """
+
+    def __init__(self, journal_dir: Path | str, *, start_at_end: bool = True) -> None:
+        self.journal_dir = Path(journal_dir)
+        self.start_at_end = start_at_end
+        self.path: Optional[Path] = None
+        self.offset = 0
+        self._partial = b""
+        self._started = False
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Return the journal entries appended since the previous poll."""
+        latest = find_latest_journal(self.journal_dir)
+        entries: List[Dict[str, Any]] = []
+
+        if not self._started:
+            self._started = True
+            if latest is not None:
+                self._open(latest, at_end=self.start_at_end)
+        elif latest is not None and latest != self.path:
+            if self.path is not None:
+                # Drain whatever the game wrote before it rolled over.
+                entries.extend(self._read_new())
+                logger.info(f"Journal rolled over: {self.path.name} -> {latest.name}")
+            self._open(latest, at_end=False)
+
+        if self.path is not None:
+            entries.extend(self._read_new())
+        return entries
+
+    def _open(self, path: Path, *, at_end: bool) -> None:
+        self.path = path
+        self._partial = b""
+        self.offset = 0
+        if at_end:
+            try:
+                self.offset = path.stat().st_size
+            except OSError:
+                pass
+        logger.info(f"Tailing {path.name} from offset {self.offset}")
+
+    def _read_new(self) -> List[Dict[str, Any]]:
+        assert self.path is not None
+        try:
+            size = self.path.stat().st_size
+            if size < self.offset:
+                logger.warning(f"{self.path.name} shrank; reading from the start")
+                self.offset = 0
+                self._partial = b""
+            if size == self.offset:
+                return []
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read(size - self.offset)
+        except OSError as e:
+            logger.debug(f"Could not read {self.path}: {e}")
+            return []
+
+        self.offset += len(chunk)
+        data = self._partial + chunk
+        complete, _, self._partial = data.rpartition(b"\n")
+        if not complete:
+            return []
+
+        entries: List[Dict[str, Any]] = []
+        for line in complete.split(b"\n"):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line.decode("utf-8", errors="replace"))
+            except ValueError as e:
+                logger.warning(f"Skipping malformed journal line in {self.path.name}: {e}")
+                continue
+            if isinstance(entry, dict) and "event" in entry:
+                entries.append(entry)
+        return entries
+
+
+class StatusWatcher:
+    """
+    Change detector for ``Status.json``.
+
+    The file is only re-read when its mtime or size differs from the last
+    successful read.  A read that fails to parse (the game rewrites the file
+    in place) leaves the signature untouched so the next poll retries it.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._signature: Optional[Tuple[int, int]] = None
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """Return the new status dict if the file changed, else None."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return None
+        try:
+            status = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(status, dict):
+            return None
+        self._signature = signature
+        return status
+
+
+class HeadlessRunner:
+    """
+    Drive an ``EventHandler`` from the journal directory instead of EDMC.
+
+    Commander and beta flags are taken from ``Fileheader``/``LoadGame``/
+    ``Commander`` events as they are read.
+    """
+
+    def __init__(
+        self,
+        handler: "EventHandler",
+        journal_dir: Path | str,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        start_at_end: bool = True,
+    ) -> None:
+        self.handler = handler
+        self.journal_dir = Path(journal_dir)
+        self.poll_interval = poll_interval
+        self.journal = JournalTailer(self.journal_dir, start_at_end=start_at_end)
+        self.status = StatusWatcher(self.journal_dir / STATUS_FILE_NAME)
+        self.cmdr = ""
+        self.is_beta = False
+        self.journal_events = 0
+        self.status_updates = 0
+        self._stop = threading.Event()
+
+    def _track_session(self, entry: Dict[str, Any]) -> None:
+        event_type = entry.get("event")
+        if event_type == "Fileheader":
+            self.is_beta = "beta" in str(entry.get("gameversion", "")).lower()
+        elif event_type == "LoadGame" and entry.get("Commander"):
+            self.cmdr = str(entry["Commander"])
+        elif event_type == "Commander" and entry.get("Name"):
+            self.cmdr = str(entry["Name"])
+
+    def warm_start(self) -> None:
+        """Seed the handler from the newest journal and adopt its commander."""
+        from .warm_start import warm_start
+
+        result = warm_start(self.handler, self.journal_dir)
+        if result is not None and result.cmdr:
+            self.cmdr = result.cmdr
+            self.is_beta = result.is_beta
+
+    def poll_once(self) -> int:
+        """Dispatch new journal entries and any Status.json change; return the count."""
+        dispatched = 0
+        for entry in self.journal.poll():
+            self._track_session(entry)
+            self.handler.handle_event(
+                str(entry["event"]),
+                entry,
+                source="journal",
+                cmdr=self.cmdr,
+                is_beta=self.is_beta,
+            )
+            dispatched += 1
+        self.journal_events += dispatched
+
+        status = self.status.poll()
+        if status is not None:
+            self.handler.handle_event(
+                str(status.get("event", "Status")),
+                status,
+                source="dashboard",
+                cmdr=self.cmdr,
+                is_beta=self.is_beta,
+            )
+            self.status_updates += 1
+            dispatched += 1
+        return dispatched
+
+    def run(self) -> None:
+        """Poll until ``stop`` is called; a busy poll is followed immediately by another."""
+        logger.info(f"Headless runner watching {self.journal_dir}")
+        while not self._stop.is_set():
+            try:
+                busy = self.poll_once()
+            except Exception as e:
+                logger.error(f"Error in headless poll: {e}", exc_info=True)
+                busy = 0
+            if not busy:
+                self._stop.wait(self.poll_interval)
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,328 @@
+"""
+Replay of recorded EDMC sessions.
+
+Streams EventRecorder JSONL files (plain or ``.jsonl.gz``) through
+``EventHandler.handle_event`` to reproduce production sessions and measure
+pipeline changes.  Playback can follow the recorded timing, a scaled version
+of it, or run as fast as possible.  The handler is driven by a
+``VirtualClock`` that follows the recorded timestamps, so time-window signals
+such as ``recent`` behave the same at any playback speed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .. import plugin_logger
+from ..config.config import DEFAULTS
+from ..utils.clock import VirtualClock
+from .endpoint import Endpoint
+
+if TYPE_CHECKING:
+    from ..rules.rules_engine import MatchResult
+    from .event_handler import EventHandler
+
+logger = plugin_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RecordedEvent:
+    """One line of an EventRecorder recording."""
+    timestamp: float  # epoch seconds when the event was recorded
+    source: str
+    event_type: str
+    data: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class StageLatency:
+    """Latency distribution of one replay stage, in milliseconds."""
+    name: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """Outcome of a replay run."""
+    events: int
+    skipped: int
+    actions: int
+    wall_seconds: float
+    recorded_seconds: float
+    stages: Dict[str, StageLatency]
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def format_summary(self) -> str:
+        lines = [
+            f"Replayed {self.events} events ({self.skipped} skipped, {self.actions} actions) "
+            f"in {self.wall_seconds:.3f}s - {self.events_per_second:,.0f} events/s "
+            f"({self.recorded_seconds:.1f}s of recorded time)",
+        ]
+        for stage in self.stages.values():
+            lines.append(
+                f"  {stage.name:<12} n={stage.count:<7} mean {stage.mean_ms:8.3f} ms  "
+                f"p50 {stage.p50_ms:8.3f} ms  p95 {stage.p95_ms:8.3f} ms  max {stage.max_ms:8.3f} ms"
+            )
+        return "\n".join(lines)
+
+
+class ReplayConfig:
+    """
+    Standalone configuration for replays outside EDMC.
+
+    Reads the packaged defaults with optional overrides (e.g. ``rules_path``);
+    ``set`` only changes the in-memory overrides.
+    """
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None) -> None:
+        self._values: Dict[str, Any] = dict(DEFAULTS)
+        # Replays must not overwrite the live plugin's signal snapshot.
+        self._values["signal_snapshot_enabled"] = False
+        self._values.update(overrides or {})
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._values[key] = value
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def iter_recording(path: Path | str) -> Iterator[RecordedEvent]:
+    """
+    Yield events from a recording, in file order.
+
+    ``.gz`` files are decompressed on the fly.  Malformed lines are logged and
+    skipped.  Lines without a ``ts`` reuse the previous timestamp.
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    last_timestamp = 0.0
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                event_type = row["event"]
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed line {line_number} in {path.name}: {e}")
+                continue
+            timestamp = _parse_timestamp(row.get("ts"))
+            if timestamp is not None:
+                last_timestamp = timestamp
+            data = row.get("data")
+            yield RecordedEvent(
+                timestamp=last_timestamp,
+                source=str(row.get("source", "journal")),
+                event_type=str(event_type),
+                data=data if isinstance(data, dict) else {},
+            )
+
+
+def iter_recordings(paths: Iterable[Path | str]) -> Iterator[RecordedEvent]:
+    """Yield events from several recordings (e.g. rotated parts) one after another."""
+    for path in paths:
+        yield from iter_recording(path)
+
+
+class NullEndpoint(Endpoint):
+    """Endpoint that accepts and counts every action without doing anything."""
+
+    def __init__(self) -> None:
+        self.actions = 0
+        self.session_events = 0
+
+    @property
+    def name(self) -> str:
+        return "Null"
+
+    def handle_action(self, action_key: str, action_value: Any, result: "MatchResult") -> bool:
+        self.actions += 1
+        return True
+
+    def on_session_event(self, event_type: str) -> None:
+        self.session_events += 1
+
+    def connect(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        pass
+
+
+class _TimedEndpoint(Endpoint):
+    """Wraps an endpoint and records the duration of each handled action."""
+
+    def __init__(self, inner: Endpoint, samples: List[float], timer: Callable[[], float]) -> None:
+        self._inner = inner
+        self._samples = samples
+        self._timer = timer
+        self.actions = 0
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    def handle_action(self, action_key: str, action_value: Any, result: "MatchResult") -> bool:
+        started = self._timer()
+        try:
+            handled = self._inner.handle_action(action_key, action_value, result)
+        finally:
+            self._samples.append(self._timer() - started)
+        if handled:
+            self.actions += 1
+        return handled
+
+    def on_session_event(self, event_type: str) -> None:
+        self._inner.on_session_event(event_type)
+
+    def connect(self) -> bool:
+        return self._inner.connect()
+
+    def disconnect(self) -> None:
+        self._inner.disconnect()
+
+
+def _stage_latency(name: str, samples: List[float]) -> StageLatency:
+    if not samples:
+        return StageLatency(name, 0, 0.0, 0.0, 0.0, 0.0)
+    ordered = sorted(samples)
+    count = len(ordered)
+
+    def _pct(fraction: float) -> float:
+        return ordered[min(count - 1, int(fraction * count))] * 1000.0
+
+    return StageLatency(
+        name=name,
+        count=count,
+        mean_ms=sum(ordered) / count * 1000.0,
+        p50_ms=_pct(0.50),
+        p95_ms=_pct(0.95),
+        max_ms=ordered[-1] * 1000.0,
+    )
+
+
+class ReplayEngine:
+    """
+    Feeds recorded events into an EventHandler.
+
+    ``speed`` selects the timing mode: ``1.0`` follows the recorded timing,
+    ``N`` plays N times faster, and ``None`` (or ``0``) plays at maximum speed.
+    The handler should be built with the same ``clock``; the engine advances
+    it to each event's recorded timestamp before dispatching it.
+
+    Stages reported: ``read`` (decode one line), ``handle_event`` (the full
+    handler call), ``rules`` (handler time minus endpoint time) and
+    ``endpoint`` (one endpoint ``handle_action`` call).
+    """
+
+    def __init__(
+        self,
+        handler: "EventHandler",
+        *,
+        clock: VirtualClock,
+        speed: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.handler = handler
+        self.clock = clock
+        self.speed = speed if speed and speed > 0 else None
+        self._sleep = sleep
+        self._timer = timer
+
+    def replay(self, events: Iterable[RecordedEvent], *, limit: Optional[int] = None) -> ReplayReport:
+        """Replay ``events`` (optionally only the first ``limit``) and return the report."""
+        read_samples: List[float] = []
+        handle_samples: List[float] = []
+        rules_samples: List[float] = []
+        endpoint_samples: List[float] = []
+
+        original_endpoints = list(self.handler.endpoints)
+        timed = [_TimedEndpoint(ep, endpoint_samples, self._timer) for ep in original_endpoints]
+        self.handler.endpoints = timed
+
+        count = 0
+        skipped = 0
+        first_recorded: Optional[float] = None
+        last_recorded = 0.0
+        pace_origin: Optional[Tuple[float, float]] = None  # (wall, recorded)
+        started = self._timer()
+        iterator = iter(events)
+        try:
+            while limit is None or count < limit:
+                read_start = self._timer()
+                try:
+                    event = next(iterator)
+                except StopIteration:
+                    break
+                read_samples.append(self._timer() - read_start)
+
+                if first_recorded is None:
+                    first_recorded = event.timestamp
+                last_recorded = max(last_recorded, event.timestamp)
+
+                if self.speed is not None:
+                    if pace_origin is None:
+                        pace_origin = (self._timer(), event.timestamp)
+                    due = pace_origin[0] + (event.timestamp - pace_origin[1]) / self.speed
+                    delay = due - self._timer()
+                    if delay > 0:
+                        self._sleep(delay)
+
+                self.clock.advance_to(event.timestamp)
+                endpoint_calls = len(endpoint_samples)
+                handle_start = self._timer()
+                try:
+                    self.handler.handle_event(event.event_type, event.data, source=event.source)
+                except Exception as e:
+                    skipped += 1
+                    logger.warning(f"Replay of {event.event_type} failed: {e}")
+                    continue
+                elapsed = self._timer() - handle_start
+                handle_samples.append(elapsed)
+                endpoint_time = sum(endpoint_samples[endpoint_calls:])
+                rules_samples.append(max(0.0, elapsed - endpoint_time))
+                count += 1
+        finally:
+            self.handler.endpoints = original_endpoints
+
+        wall = self._timer() - started
+        return ReplayReport(
+            events=count,
+            skipped=skipped,
+            actions=sum(ep.actions for ep in timed),
+            wall_seconds=wall,
+            recorded_seconds=max(0.0, last_recorded - (first_recorded or last_recorded)),
+            stages={
+                stage.name: stage
+                for stage in (
+                    _stage_latency("read", read_samples),
+                    _stage_latency("handle_event", handle_samples),
+                    _stage_latency("rules", rules_samples),
+                    _stage_latency("endpoint", endpoint_samples),
+                )
+            },
+        )
@@ -7,24 +7,77 @@ to the catalog as needed.
 
 Features:
 - Tracks unregistered events with complete metadata
-- Stores events persistently to a JSON file
+- Stores events persistently to a JSON file (debounced, written atomically)
+- Groups occurrences by a hashed schema fingerprint with a few samples each
 - Validates events against catalog and removes entries when they appear
 - Provides list and clearing methods for UI integration
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-import time
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .. import plugin_logger
 from ..rules.signals_catalog import SignalsCatalog
+from ..utils.clock import SYSTEM_CLOCK, Clock
+from ..utils.metrics import METRICS, MetricsRegistry
 
 logger = plugin_logger(__name__)
 
+# List items inspected per list when fingerprinting (keeps cost bounded for
+# long inventories such as Materials or Cargo).
+_FINGERPRINT_LIST_ITEMS = 16
+
+
+def _type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    return type(value).__name__
+
+
+def _collect_schema(value: Any, path: str, fields: Set[str]) -> None:
+    fields.add(f"{path}:{_type_name(value)}")
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _collect_schema(child, f"{path}.{key}" if path else str(key), fields)
+    elif isinstance(value, list):
+        for item in value[:_FINGERPRINT_LIST_ITEMS]:
+            _collect_schema(item, f"{path}[]", fields)
+
+
+def schema_fingerprint(event_data: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """
+    Compute a stable fingerprint of an event's shape.
+
+    The fingerprint hashes the set of key paths and value types (``a.b:string``,
+    ``Items[].Name:string``), so events that differ only in values share one.
+
+    Returns:
+        ``(fingerprint, sorted_fields)``
+    """
+    fields: Set[str] = set()
+    for key, value in event_data.items():
+        _collect_schema(value, str(key), fields)
+    ordered = sorted(fields)
+    digest = hashlib.blake2b("\n".join(ordered).encode("utf-8"), digest_size=8).hexdigest()
+    return digest, ordered
+
 
 class UnregisteredEventsTracker:
     """
@@ -32,23 +85,61 @@ class UnregisteredEventsTracker:
     
     Events not found in the catalog are logged both to the log file and
     persisted to a JSON file for later review and catalog updates.
+
+    Each entry groups occurrences by schema fingerprint (see
+    ``schema_fingerprint``) and keeps up to ``MAX_SAMPLES_PER_SCHEMA``
+    distinct samples per variant.  Once a variant's samples are full, repeat
+    occurrences only update counters and are never sanitized again.
+
+    Tracking only marks the tracker dirty; a background timer writes the file
+    ``save_interval_seconds`` after the first unsaved change, coalescing all
+    changes in between, so there is at most one write per interval.  User actions (clear, refresh)
+    and ``flush()`` write immediately.  Writes go to a temporary file that is
+    then renamed over the tracker file, so it is never left half-written.
     """
     
     TRACKER_FILE_NAME = "unregistered_events.json"
+    SAVE_INTERVAL_SECONDS = 5.0
+    # Distinct sanitized samples kept per schema fingerprint
+    MAX_SAMPLES_PER_SCHEMA = 3
+    # Schema variants kept per event type; further variants are only counted
+    MAX_SCHEMAS_PER_EVENT = 10
     
-    def __init__(self, plugin_dir: Path | str, catalog: Optional[SignalsCatalog] = None) -> None:
+    def __init__(
+        self,
+        plugin_dir: Path | str,
+        catalog: Optional[SignalsCatalog] = None,
+        *,
+        save_interval_seconds: float = SAVE_INTERVAL_SECONDS,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
         """
         Initialize the tracker.
         
         Args:
             plugin_dir: Plugin directory path where tracker file will be stored
             catalog: Optional SignalsCatalog to validate events against
+            save_interval_seconds: Minimum time between background writes
+            clock: Time source for first/last seen stamps (defaults to real time)
+            metrics: Registry for the tracked event count and stored size
         """
         self.plugin_dir = Path(plugin_dir)
         self.catalog = catalog
+        self.clock = clock or SYSTEM_CLOCK
         self.tracker_file = self.plugin_dir / self.TRACKER_FILE_NAME
         self.unregistered_events: Dict[str, Dict[str, Any]] = {}
         self._known_events: Optional[Set[str]] = None
+        # Optional EventAnonymizer applied to stored samples
+        self.anonymizer: Optional[Any] = None
+        self.save_interval_seconds = max(0.0, float(save_interval_seconds))
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()  # orders snapshot + write of concurrent saves
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self.metrics = metrics or METRICS
+        self._events_gauge = self.metrics.gauge("tracker.events")
+        self._bytes_gauge = self.metrics.gauge("tracker.bytes")
         
         # Load existing unregistered events from file
         self._load_from_file()
@@ -91,39 +182,64 @@ class UnregisteredEventsTracker:
             event_data: Complete event data dictionary
             source: Source of the event ("journal", "dashboard", "capi", etc.)
         """
-        # Skip if event is in catalog
-        if self._is_event_known(event_type):
-            # Event is registered, remove from tracker if present
-            self.unregistered_events.pop(event_type, None)
-            return
+        with self._lock:
+            # Skip if event is in catalog
+            if self._is_event_known(event_type):
+                # Event is registered, remove from tracker if present
+                self.unregistered_events.pop(event_type, None)
+                return
         
-        # Check if event only contains timestamp fields - skip if it does
-        if self._is_timestamp_only(event_data):
-            return
+            # Check if event only contains timestamp fields - skip if it does
+            if self._is_timestamp_only(event_data):
+                return
         
-        # Event not in catalog, track it
-        if event_type not in self.unregistered_events:
-            entry = {
-                "event_type": event_type,
-                "source": source,
-                "first_seen": time.time(),
-                "last_seen": time.time(),
-                "occurrences": 1,
-                "sample_data": self._sanitize_event_data(event_data),
-            }
-            self.unregistered_events[event_type] = entry
-            logger.warning(f"Unregistered event detected: {event_type} from {source}")
-        else:
-            # Update existing entry
-            entry = self.unregistered_events[event_type]
-            entry["last_seen"] = time.time()
+            # Event not in catalog, track it
+            now = self.clock.time()
+            entry = self.unregistered_events.get(event_type)
+            if entry is None:
+                entry = {
+                    "event_type": event_type,
+                    "source": source,
+                    "first_seen": now,
+                    "last_seen": now,
+                    "occurrences": 0,
+                    "fingerprint": None,
+                    "schemas": {},
+                    "sample_data": {},
+                }
+                self.unregistered_events[event_type] = entry
+                logger.warning(f"Unregistered event detected: {event_type} from {source}")
+            entry["last_seen"] = now
             entry["occurrences"] = entry.get("occurrences", 0) + 1
-            # Update sample data to latest occurrence
-            entry["sample_data"] = self._sanitize_event_data(event_data)
+            self._record_schema(entry, event_data, now)
         
-        # Persist to file
-        self._save_to_file()
+            self._mark_dirty()
     
+    def _record_schema(self, entry: Dict[str, Any], event_data: Dict[str, Any], now: float) -> None:
+        """Count the occurrence against its schema variant, sampling it if there is room."""
+        fingerprint, fields = schema_fingerprint(event_data)
+        schemas = entry.setdefault("schemas", {})
+        schema = schemas.get(fingerprint)
+        if schema is None:
+            if len(schemas) >= self.MAX_SCHEMAS_PER_EVENT:
+                entry["untracked_variants"] = entry.get("untracked_variants", 0) + 1
+                return
+            schema = {"fields": fields, "first_seen": now, "count": 0, "samples": []}
+            schemas[fingerprint] = schema
+            if entry.get("fingerprint") is not None:
+                logger.info(f"New schema variant for unregistered event {entry['event_type']}: {fingerprint}")
+        schema["count"] += 1
+        schema["last_seen"] = now
+        entry["fingerprint"] = fingerprint
+
+        samples = schema["samples"]
+        if len(samples) >= self.MAX_SAMPLES_PER_SCHEMA:
+            return
+        sample = self._sanitize_event_data(event_data)
+        if sample not in samples:
+            samples.append(sample)
+            entry["sample_data"] = sample
+
     def _is_timestamp_only(self, event_data: Dict[str, Any]) -> bool:
         """
         Check if event data contains only timestamp fields.
@@ -181,10 +297,10 @@ class UnregisteredEventsTracker:
                 events_to_remove.append(event_type)
                 logger.info(f"Event now in catalog, removing from tracking: {event_type}")
         
-        for event_type in events_to_remove:
-            del self.unregistered_events[event_type]
-        
         if events_to_remove:
+            with self._lock:
+                for event_type in events_to_remove:
+                    del self.unregistered_events[event_type]
             self._save_to_file()
         
         return len(events_to_remove)
@@ -196,7 +312,8 @@ class UnregisteredEventsTracker:
         Returns:
             List of event entry dictionaries, sorted by last_seen (newest first)
         """
-        events_list = list(self.unregistered_events.values())
+        with self._lock:
+            events_list = list(self.unregistered_events.values())
         # Sort by last_seen timestamp (descending - newest first)
         events_list.sort(key=lambda e: e.get("last_seen", 0), reverse=True)
         return events_list
@@ -211,8 +328,9 @@ class UnregisteredEventsTracker:
         Returns:
             True if event was removed, False if not found
         """
-        if event_type in self.unregistered_events:
-            del self.unregistered_events[event_type]
+        with self._lock:
+            removed = self.unregistered_events.pop(event_type, None) is not None
+        if removed:
             self._save_to_file()
             logger.info(f"Cleared tracked event: {event_type}")
             return True
@@ -225,9 +343,10 @@ class UnregisteredEventsTracker:
         Returns:
             Number of events cleared
         """
-        count = len(self.unregistered_events)
-        if count > 0:
+        with self._lock:
+            count = len(self.unregistered_events)
             self.unregistered_events.clear()
+        if count > 0:
             self._save_to_file()
             logger.info(f"Cleared all {count} tracked unregistered events")
         return count
@@ -240,7 +359,8 @@ class UnregisteredEventsTracker:
         """
         Create a sanitized copy of event data for storage.
         
-        Removes potentially sensitive or very large fields.
+        Removes potentially sensitive or very large fields and, when an
+        anonymizer is attached, replaces identifying values.
         
         Args:
             event_data: Original event data
@@ -253,6 +373,9 @@ class UnregisteredEventsTracker:
         # Fields to skip (sensitive or too large)
         skip_keys = {"MarketID", "OutfittingID", "ShipyardID", "StationServices"}
         max_value_length = 1000
+
+        if self.anonymizer is not None:
+            event_data = self.anonymizer.anonymize_event(event_data)
         
         for key, value in event_data.items():
             if key in skip_keys:
@@ -286,10 +409,13 @@ class UnregisteredEventsTracker:
         
         try:
             with open(self.tracker_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                text = f.read()
+            data = json.loads(text)
+            self._bytes_gauge.set(len(text))
             
             if isinstance(data, dict) and "events" in data:
                 self.unregistered_events = data.get("events", {})
+                self._events_gauge.set(len(self.unregistered_events))
             else:
                 logger.warning(f"Invalid tracker file format: {self.tracker_file}")
                 self.unregistered_events = {}
@@ -300,25 +426,63 @@ class UnregisteredEventsTracker:
             logger.error(f"Failed to load tracker file: {e}")
             self.unregistered_events = {}
     
+    def flush(self) -> None:
+        """Write pending changes now (called on plugin shutdown)."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+        self._save_to_file()
+
+    def _mark_dirty(self) -> None:
+        """Record unsaved changes and schedule a debounced background write. Lock must be held."""
+        self._dirty = True
+        if self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(self.save_interval_seconds, self._flush_from_timer)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+        self._save_to_file()
+
     def _save_to_file(self) -> None:
-        """Save tracked events to the tracker file."""
-        try:
-            # Ensure directory exists
-            self.plugin_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Write with new format for clarity
-            data = {
-                "metadata": {
-                    "version": "1.0",
-                    "description": "Tracked unregistered game events - these events were received but not found in signals_catalog.json",
-                    "last_updated": time.time(),
-                },
-                "events": self.unregistered_events,
-            }
-            
-            with open(self.tracker_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
-                f.write("\n")
-        except Exception as e:
-            logger.error(f"Failed to save tracker file: {e}")
+        """Atomically save tracked events to the tracker file."""
+        with self._write_lock:
+            with self._lock:
+                # Write with new format for clarity
+                data = {
+                    "metadata": {
+                        "version": "1.0",
+                        "description": "Tracked unregistered game events - these events were received but not found in signals_catalog.json",
+                        "last_updated": self.clock.time(),
+                    },
+                    "events": self.unregistered_events,
+                }
+                try:
+                    payload = json.dumps(data, indent=2, default=str) + "\n"
+                except Exception as e:
+                    logger.error(f"Failed to serialize tracker file: {e}")
+                    return
+                self._dirty = False
+                # The serialized size stands in for the tracker's memory use
+                self._events_gauge.set(len(self.unregistered_events))
+                self._bytes_gauge.set(len(payload))
 
+            tmp_path = self.tracker_file.with_name(self.tracker_file.name + ".tmp")
+            try:
+                # Ensure directory exists
+                self.plugin_dir.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.tracker_file)
+            except Exception as e:
+                logger.error(f"Failed to save tracker file: {e}")
+                with self._lock:
+                    self._dirty = True
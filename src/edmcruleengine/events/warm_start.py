@@ -0,0 +1,337 @@
+"""
+Warm start from the latest journal.
+
+After a (re)start, ``state.*`` signals stay unknown until the game emits
+``LoadGame``/``Rank``/``Loadout``/``Cargo``... again.  The warm start works
+out which EDMC state sections the loaded rules depend on, reads the newest
+journal *backwards* in fixed-size blocks until the most recent event for
+every one of those sections has been found, rebuilds those sections and seeds
+them into the ``EventHandler`` before the first live event.
+
+Only lines whose event name is still wanted are JSON-decoded, and the scan
+stops as soon as nothing is missing or ``max_bytes`` have been read, so the
+cost follows what the rules need and is bounded even when a wanted section
+(``FleetCarrier``, ``Squadron``...) never appears in the journal.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .. import plugin_logger
+from .journal_tailer import find_latest_journal
+
+if TYPE_CHECKING:
+    from ..rules.rules_engine import RuleEngine
+    from .event_handler import EventHandler
+
+logger = plugin_logger(__name__)
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+# State section -> journal events that (re)write it, mirroring EDMC's monitor.
+_LOCATION_EVENTS = ("Location", "FSDJump", "CarrierJump")
+_STATION_EVENTS = ("Location", "Docked", "Undocked", "FSDJump", "CarrierJump")
+_SHIP_EVENTS = ("Loadout", "LoadGame")
+STATE_SECTION_EVENTS: Dict[str, Tuple[str, ...]] = {
+    "Commander": ("LoadGame", "Commander"),
+    "GameMode": ("LoadGame",),
+    "Horizons": ("LoadGame",),
+    "Odyssey": ("LoadGame",),
+    "ShipType": _SHIP_EVENTS,
+    "ShipName": _SHIP_EVENTS,
+    "ShipIdent": _SHIP_EVENTS,
+    "HullValue": ("Loadout",),
+    "ModulesValue": ("Loadout",),
+    "Rebuy": ("Loadout",),
+    "UnladenMass": ("Loadout",),
+    "CargoCapacity": ("Loadout",),
+    "MaxJumpRange": ("Loadout",),
+    "FuelCapacity": ("Loadout",),
+    "HullHealth": ("Loadout",),
+    "Rank": ("Rank",),
+    "RankProgress": ("Progress",),
+    "Reputation": ("Reputation",),
+    "Statistics": ("Statistics",),
+    "Cargo": ("Cargo",),
+    "Raw": ("Materials",),
+    "Manufactured": ("Materials",),
+    "Encoded": ("Materials",),
+    "Missions": ("Missions",),
+    "Passengers": ("Passengers",),
+    "Powerplay": ("Powerplay",),
+    "Squadron": ("SquadronStartup",),
+    "FleetCarrier": ("CarrierStats",),
+    "FSDTarget": ("FSDTarget",),
+    "Target": ("ShipTargeted",),
+    "StarSystem": _LOCATION_EVENTS,
+    "SystemAddress": _LOCATION_EVENTS,
+    "StarPos": _LOCATION_EVENTS,
+    "Population": _LOCATION_EVENTS,
+    "SystemAllegiance": _LOCATION_EVENTS,
+    "SystemEconomy": _LOCATION_EVENTS,
+    "SystemGovernment": _LOCATION_EVENTS,
+    "SystemSecurity": _LOCATION_EVENTS,
+    "SystemFaction": _LOCATION_EVENTS,
+    "StationName": _STATION_EVENTS,
+    "StationType": _STATION_EVENTS,
+    "MarketID": _STATION_EVENTS,
+    "StationFaction": _STATION_EVENTS,
+    "StationGovernment": _STATION_EVENTS,
+    "StationAllegiance": _STATION_EVENTS,
+    "StationEconomy": _STATION_EVENTS,
+    "DistFromStarLS": _STATION_EVENTS,
+}
+
+_EVENT_SECTIONS: Dict[str, Set[str]] = {}
+for _section, _events in STATE_SECTION_EVENTS.items():
+    for _event in _events:
+        _EVENT_SECTIONS.setdefault(_event, set()).add(_section)
+
+_EVENT_NAME = re.compile(rb'"event"\s*:\s*"([^"]+)"')
+
+_SYSTEM_FIELDS = (
+    "StarSystem", "SystemAddress", "StarPos", "Population", "SystemAllegiance",
+    "SystemEconomy", "SystemGovernment", "SystemSecurity", "SystemFaction",
+)
+_STATION_FIELDS = (
+    "StationName", "StationType", "MarketID", "StationFaction", "StationGovernment",
+    "StationAllegiance", "StationEconomy", "DistFromStarLS",
+)
+
+
+@dataclass
+class WarmStartResult:
+    """Outcome of a warm start scan."""
+    journal: Optional[str] = None
+    sections_wanted: Set[str] = field(default_factory=set)
+    sections_missing: Set[str] = field(default_factory=set)
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    bytes_read: int = 0
+    truncated: bool = False  # stopped at max_bytes before the start of the file
+    state: Dict[str, Any] = field(default_factory=dict)
+    cmdr: str = ""
+    is_beta: bool = False
+
+
+def _collect_state_sections(spec: Any, sections: Set[str]) -> None:
+    if isinstance(spec, dict):
+        path = spec.get("path")
+        if isinstance(path, str) and path.startswith("state."):
+            sections.add(path.split(".", 2)[1])
+        for value in spec.values():
+            _collect_state_sections(value, sections)
+    elif isinstance(spec, list):
+        for value in spec:
+            _collect_state_sections(value, sections)
+
+
+def required_state_sections(rule_engine: "RuleEngine") -> Set[str]:
+    """Return the top-level state sections read by the loaded rules' signals."""
+    sections: Set[str] = set()
+    for name in rule_engine.required_signals():
+        signal_def = rule_engine.catalog.runtime_signals.get(name)
+        if signal_def:
+            _collect_state_sections(signal_def.get("derive"), sections)
+    return sections
+
+
+def scan_journal_backwards(
+    path: Path | str,
+    sections: Iterable[str],
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+) -> WarmStartResult:
+    """
+    Find the most recent journal entry for each wanted state section.
+
+    Returns the matching entries in chronological order.  Sections that no
+    known event writes are ignored; sections not found before the start of
+    the file (or within the last ``max_bytes``; None reads the whole file)
+    are reported in ``sections_missing``.
+    """
+    path = Path(path)
+    wanted = {s for s in sections if s in STATE_SECTION_EVENTS}
+    result = WarmStartResult(journal=str(path), sections_wanted=set(wanted))
+    remaining = set(wanted)
+    found: List[Dict[str, Any]] = []
+
+    def _consider(line: bytes) -> None:
+        match = _EVENT_NAME.search(line)
+        if not match:
+            return
+        satisfied = _EVENT_SECTIONS.get(match.group(1).decode("utf-8", "replace"), set()) & remaining
+        if not satisfied:
+            return
+        try:
+            entry = json.loads(line.decode("utf-8", errors="replace"))
+        except ValueError:
+            return
+        if not isinstance(entry, dict):
+            return
+        # Only sections the entry actually writes count as found (a Cargo
+        # event without Inventory leaves the section to an older entry).
+        satisfied &= _STATE_BUILDERS[str(entry.get("event"))](entry).keys()
+        if satisfied:
+            found.append(entry)
+            remaining.difference_update(satisfied)
+
+    with open(path, "rb") as f:
+        position = f.seek(0, 2)
+        carry = b""
+        while position > 0 and remaining:
+            if max_bytes is not None and result.bytes_read >= max_bytes:
+                result.truncated = True
+                break
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size) + carry
+            result.bytes_read += size
+            lines = block.split(b"\n")
+            # The first line may continue in the previous block
+            carry = lines.pop(0) if position > 0 else b""
+            for line in reversed(lines):
+                if line.strip():
+                    _consider(line)
+                    if not remaining:
+                        break
+
+    found.reverse()
+    result.entries = found
+    result.sections_missing = remaining
+    return result
+
+
+def _payload(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in entry.items() if k not in ("timestamp", "event")}
+
+
+def _ship(entry: Dict[str, Any]) -> Dict[str, Any]:
+    # Absent fields map to None so an older ship's values are not picked up.
+    state: Dict[str, Any] = {"ShipType": str(entry["Ship"]).lower() if entry.get("Ship") else None}
+    for key in ("ShipName", "ShipIdent"):
+        state[key] = entry.get(key)
+    return state
+
+
+def _load_game(entry: Dict[str, Any]) -> Dict[str, Any]:
+    state = _ship(entry)
+    state["Commander"] = entry.get("Commander", "")
+    for key in ("GameMode", "Horizons", "Odyssey"):
+        if key in entry:
+            state[key] = entry[key]
+    return state
+
+
+def _loadout(entry: Dict[str, Any]) -> Dict[str, Any]:
+    state = _ship(entry)
+    for key in ("HullValue", "ModulesValue", "Rebuy", "UnladenMass", "CargoCapacity", "MaxJumpRange", "FuelCapacity"):
+        state[key] = entry.get(key)
+    hull = entry.get("HullHealth")
+    state["HullHealth"] = round(hull * 100, 1) if isinstance(hull, (int, float)) else None  # journal 0..1, signals use percent
+    return state
+
+
+def _location(entry: Dict[str, Any]) -> Dict[str, Any]:
+    state = {key: entry.get(key) for key in _SYSTEM_FIELDS}
+    docked = entry.get("event") != "FSDJump" and entry.get("Docked", False)
+    state.update({key: entry.get(key) if docked else None for key in _STATION_FIELDS})
+    return state
+
+
+def _materials(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: entry.get(key, []) for key in ("Raw", "Manufactured", "Encoded")}
+
+
+def _target(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {"Target": _payload(entry) if entry.get("TargetLocked") else {}}
+
+
+_STATE_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "LoadGame": _load_game,
+    "Commander": lambda e: {"Commander": e.get("Name", "")},
+    "Loadout": _loadout,
+    "Rank": lambda e: {"Rank": _payload(e)},
+    "Progress": lambda e: {"RankProgress": _payload(e)},
+    "Reputation": lambda e: {"Reputation": _payload(e)},
+    "Statistics": lambda e: {"Statistics": _payload(e)},
+    "Cargo": lambda e: {"Cargo": e["Inventory"]} if e.get("Vessel", "Ship") == "Ship" and "Inventory" in e else {},
+    "Materials": _materials,
+    "Missions": lambda e: {"Missions": e.get("Active", [])},
+    "Passengers": lambda e: {"Passengers": e.get("Manifest", [])},
+    "Powerplay": lambda e: {"Powerplay": _payload(e)},
+    "SquadronStartup": lambda e: {"Squadron": {"Name": e.get("SquadronName"), "Rank": e.get("CurrentRank")}},
+    "CarrierStats": lambda e: {"FleetCarrier": {
+        "Callsign": e.get("Callsign"),
+        "Name": e.get("Name"),
+        "Fuel": e.get("FuelLevel"),
+        "Balance": (e.get("Finance") or {}).get("CarrierBalance"),
+    }},
+    "FSDTarget": lambda e: {"FSDTarget": {"Name": e.get("Name"), "RemainingJumpsInRoute": e.get("RemainingJumpsInRoute", 0)}},
+    "ShipTargeted": _target,
+    "Location": _location,
+    "FSDJump": _location,
+    "CarrierJump": _location,
+    "Docked": lambda e: {key: e.get(key) for key in _STATION_FIELDS},
+    "Undocked": lambda e: {key: None for key in _STATION_FIELDS},
+}
+
+
+def build_state(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply journal entries (oldest first) to an empty EDMC-style state dict."""
+    state: Dict[str, Any] = {}
+    for entry in entries:
+        builder = _STATE_BUILDERS.get(str(entry.get("event")))
+        if builder is not None:
+            state.update(builder(entry))
+    return {key: value for key, value in state.items() if value is not None}
+
+
+def warm_start(
+    handler: "EventHandler",
+    journal_dir: Path | str,
+    *,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+) -> Optional[WarmStartResult]:
+    """
+    Seed ``handler`` with state rebuilt from the newest journal.
+
+    Returns None when there are no rules, nothing to seed or no journal.
+    """
+    engine = handler.rule_engine
+    if engine is None:
+        return None
+    sections = required_state_sections(engine)
+    if not sections:
+        return None
+    journal = find_latest_journal(journal_dir)
+    if journal is None:
+        return None
+
+    # The commander is always wanted so seeded edge state uses the live key.
+    result = scan_journal_backwards(
+        journal, sections | {"Commander"}, block_size=block_size, max_bytes=max_bytes
+    )
+    result.state = build_state(result.entries)
+    result.cmdr = str(result.state.get("Commander", ""))
+    for entry in result.entries:
+        if entry.get("event") == "LoadGame":
+            result.is_beta = "beta" in str(entry.get("gameversion", "")).lower()
+
+    logger.info(
+        f"Warm start read {result.bytes_read} bytes of {journal.name}: "
+        f"{len(result.entries)} event(s), {len(result.sections_wanted - result.sections_missing)}/"
+        f"{len(result.sections_wanted)} state section(s)"
+        + (" (read limit reached)" if result.truncated else "")
+    )
+    if result.state:
+        handler.seed_state(result.state, cmdr=result.cmdr, is_beta=result.is_beta)
+    return result
@@ -0,0 +1,229 @@
+"""
+Rule backtesting against recorded sessions.
+
+Replays a directory of EventRecorder recordings through a rules file and
+collects per-rule statistics: activations, time active, flap rate, rules that
+never fired and evaluation cost.  Each recording is evaluated by its own
+``EventHandler``/``RuleEngine`` in a separate worker process; per-recording
+results are merged into one report.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .. import plugin_logger
+
+logger = plugin_logger(__name__)
+
+# An activation shorter than this (recorded seconds) counts as a flap.
+DEFAULT_FLAP_WINDOW_SECONDS = 2.0
+
+
+@dataclass
+class RuleStats:
+    """Statistics for one rule, accumulated over one or more recordings."""
+    rule_id: str
+    title: str
+    activations: int = 0
+    active_seconds: float = 0.0
+    flaps: int = 0
+    evaluations: int = 0
+    eval_seconds: float = 0.0
+
+    @property
+    def flap_rate(self) -> float:
+        """Fraction of activations that ended within the flap window."""
+        return self.flaps / self.activations if self.activations else 0.0
+
+    @property
+    def mean_eval_us(self) -> float:
+        return self.eval_seconds / self.evaluations * 1e6 if self.evaluations else 0.0
+
+    def merge(self, other: "RuleStats") -> None:
+        self.activations += other.activations
+        self.active_seconds += other.active_seconds
+        self.flaps += other.flaps
+        self.evaluations += other.evaluations
+        self.eval_seconds += other.eval_seconds
+
+
+@dataclass
+class RecordingResult:
+    """Backtest outcome for a single recording."""
+    recording: str
+    events: int = 0
+    recorded_seconds: float = 0.0
+    handle_seconds: float = 0.0
+    rules: Dict[str, RuleStats] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BacktestReport:
+    """Merged backtest results across all recordings."""
+    recordings: int
+    events: int
+    recorded_seconds: float
+    handle_seconds: float
+    wall_seconds: float
+    rules: Dict[str, RuleStats]
+    failures: List[Tuple[str, str]]
+
+    @property
+    def never_fired(self) -> List[RuleStats]:
+        return [stats for stats in self.rules.values() if stats.activations == 0]
+
+    @property
+    def per_event_cost_us(self) -> float:
+        """Mean EventHandler.handle_event time per event."""
+        return self.handle_seconds / self.events * 1e6 if self.events else 0.0
+
+    def format_summary(self) -> str:
+        lines = [
+            f"Backtested {self.recordings} recording(s), {self.events} events, "
+            f"{self.recorded_seconds / 3600:.1f}h of gameplay in {self.wall_seconds:.2f}s "
+            f"({self.per_event_cost_us:.1f} us/event)",
+            f"{'rule':<40} {'activations':>11} {'active':>10} {'flap rate':>9} {'us/eval':>8}",
+        ]
+        for stats in sorted(self.rules.values(), key=lambda s: (-s.activations, s.title)):
+            lines.append(
+                f"{stats.title[:40]:<40} {stats.activations:>11} {stats.active_seconds:>9.0f}s "
+                f"{stats.flap_rate:>9.0%} {stats.mean_eval_us:>8.1f}"
+            )
+        if self.never_fired:
+            lines.append("Never fired: " + ", ".join(stats.title for stats in self.never_fired))
+        for recording, error in self.failures:
+            lines.append(f"FAILED {recording}: {error}")
+        return "\n".join(lines)
+
+
+def find_recordings(directory: Path | str) -> List[Path]:
+    """Return the ``.jsonl``/``.jsonl.gz`` recordings in ``directory``, sorted by name."""
+    directory = Path(directory)
+    return sorted(
+        path for path in directory.iterdir()
+        if path.is_file() and (path.name.endswith(".jsonl") or path.name.endswith(".jsonl.gz"))
+    )
+
+
+def backtest_recording(
+    rules_path: str,
+    recording: str,
+    plugin_dir: str,
+    flap_window_seconds: float = DEFAULT_FLAP_WINDOW_SECONDS,
+    timer: Callable[[], float] = time.perf_counter,
+) -> RecordingResult:
+    """Evaluate one recording with a fresh handler and rule engine (runs in a worker)."""
+    from ..events.event_handler import EventHandler
+    from ..events.replay import NullEndpoint, ReplayConfig, iter_recording
+    from ..utils.clock import VirtualClock
+    from ..utils.metrics import MetricsRegistry
+
+    result = RecordingResult(recording=recording)
+    clock = VirtualClock()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": rules_path}),
+        endpoints=[NullEndpoint()],
+        plugin_dir=plugin_dir,
+        clock=clock,
+        # Private registry: per-rule evaluation cost comes from its histograms
+        metrics=MetricsRegistry(timer=timer),
+    )
+    engine = handler.rule_engine
+    if engine is None:
+        result.error = "rules could not be loaded"
+        return result
+
+    stats = {rule["id"]: RuleStats(rule["id"], rule["title"]) for rule in engine.rules}
+    result.rules = stats
+
+    active_since: Dict[str, float] = {}
+    first_timestamp: Optional[float] = None
+    last_timestamp = 0.0
+    try:
+        for event in iter_recording(recording):
+            if first_timestamp is None:
+                first_timestamp = event.timestamp
+            last_timestamp = max(last_timestamp, event.timestamp)
+            now = clock.advance_to(event.timestamp)
+
+            started = timer()
+            handler.handle_event(event.event_type, event.data, source=event.source)
+            result.handle_seconds += timer() - started
+            result.events += 1
+
+            matched = engine.matched_rule_ids()
+            for rule_id in matched - active_since.keys():
+                active_since[rule_id] = now
+                stats[rule_id].activations += 1
+            for rule_id in set(active_since) - matched:
+                duration = now - active_since.pop(rule_id)
+                stats[rule_id].active_seconds += duration
+                if duration < flap_window_seconds:
+                    stats[rule_id].flaps += 1
+    except Exception as e:
+        result.error = str(e)
+        logger.warning(f"Backtest of {recording} failed: {e}")
+
+    for rule_id, since in active_since.items():
+        stats[rule_id].active_seconds += last_timestamp - since
+    for latency in engine.rule_latencies():
+        rule_stats = stats.get(latency.name[len("rule."):])
+        if rule_stats is not None:
+            rule_stats.evaluations = latency.count
+            rule_stats.eval_seconds = latency.sum_ms / 1000.0
+    result.recorded_seconds = max(0.0, last_timestamp - (first_timestamp or last_timestamp))
+    return result
+
+
+def _backtest_task(task: Tuple[str, str, str, float]) -> RecordingResult:
+    return backtest_recording(*task)
+
+
+def run_backtest(
+    rules_path: Path | str,
+    recordings: Iterable[Path | str],
+    *,
+    plugin_dir: Path | str,
+    workers: Optional[int] = None,
+    flap_window_seconds: float = DEFAULT_FLAP_WINDOW_SECONDS,
+) -> BacktestReport:
+    """
+    Backtest ``rules_path`` against each recording and merge the results.
+
+    ``workers`` is the process pool size (default: CPU count); ``1`` evaluates
+    in-process, which is also used when there is only one recording.
+    """
+    tasks = [(str(rules_path), str(path), str(plugin_dir), flap_window_seconds) for path in recordings]
+    started = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        results = [_backtest_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_backtest_task, tasks))
+    wall = time.perf_counter() - started
+
+    merged: Dict[str, RuleStats] = {}
+    failures: List[Tuple[str, str]] = []
+    for result in results:
+        if result.error:
+            failures.append((result.recording, result.error))
+        for rule_id, stats in result.rules.items():
+            if rule_id not in merged:
+                merged[rule_id] = RuleStats(rule_id, stats.title)
+            merged[rule_id].merge(stats)
+
+    return BacktestReport(
+        recordings=len(results),
+        events=sum(r.events for r in results),
+        recorded_seconds=sum(r.recorded_seconds for r in results),
+        handle_seconds=sum(r.handle_seconds for r in results),
+        wall_seconds=wall,
+        rules=merged,
+        failures=failures,
+    )
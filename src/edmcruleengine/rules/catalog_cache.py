@@ -0,0 +1,84 @@
+"""
+Compiled signals catalog cache.
+
+Parsing, validating, flattening and indexing ``signals_catalog.json`` is
+repeated by every component that loads the catalog.  The compiled result is
+stored next to the JSON as a ``marshal`` artifact keyed by the source hash,
+the plugin version and the Python version, and rebuilt automatically whenever
+any of them changes.  A missing, stale or unreadable cache is never an error;
+the catalog is simply compiled from JSON again.
+
+The runtime core and the UI metadata are stored in separate files
+(``signals_catalog.cache`` and ``signals_catalog.ui.cache``) so the engine
+never reads the UI half unless a UI asks for it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .. import plugin_logger
+from ..config.version import __version__
+
+logger = plugin_logger(__name__)
+
+CACHE_SUFFIX = ".cache"
+CACHE_FORMAT = 3
+# Section holding UI metadata, cached separately so runtime loads skip it
+UI_CACHE_SECTION = "ui"
+
+
+def cache_path_for(catalog_path: Path, section: str = "") -> Path:
+    """Return the cache file for ``section`` stored next to ``catalog_path``."""
+    name = f"{catalog_path.stem}.{section}" if section else catalog_path.stem
+    return catalog_path.with_name(name + CACHE_SUFFIX)
+
+
+def cache_key(source: bytes) -> str:
+    """Key for a compiled catalog built from ``source`` by this plugin/Python."""
+    digest = hashlib.blake2b(source, digest_size=16).hexdigest()
+    return f"{CACHE_FORMAT}:{__version__}:{sys.version_info[0]}.{sys.version_info[1]}:{digest}"
+
+
+def read_cache(cache_path: Path, key: str) -> Optional[Dict[str, Any]]:
+    """Return the compiled payload if ``cache_path`` holds one for ``key``."""
+    try:
+        # marshal.load() on a file object reads in small chunks; loads() is
+        # several times faster for a file this size.
+        payload = marshal.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable catalog cache {cache_path}: {e}")
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != key:
+        return None
+    return payload
+
+
+def write_cache(cache_path: Path, key: str, payload: Dict[str, Any]) -> bool:
+    """Store ``payload`` under ``key`` atomically; failures are only logged."""
+    tmp_path: Optional[Path] = None
+    try:
+        # A unique temp file per writer: several processes (e.g. backtest
+        # workers) may rebuild the same cache at once.
+        fd, tmp_name = tempfile.mkstemp(prefix=cache_path.name + ".", suffix=".tmp", dir=cache_path.parent)
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump({**payload, "key": key}, f)
+        os.replace(tmp_path, cache_path)
+        return True
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write catalog cache {cache_path}: {e}")
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        return False
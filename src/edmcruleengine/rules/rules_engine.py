@@ -11,10 +11,15 @@ Implements the rule schema with:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
 from .. import plugin_logger
+from ..utils.clock import Clock
+from ..utils.metrics import METRICS, Histogram, HistogramSnapshot, MetricsRegistry
+from ..utils.hot_path_log import CONDITIONS, PAYLOAD, RULES, SIGNALS, EventLog, HotPathLog
+from ..utils.tracing import TRACER, SpanTracer
 from .signal_derivation import SignalDerivation
+from .state_ingest import StateIngest
 from .signals_catalog import SignalsCatalog, generate_id_from_title
 
 logger = plugin_logger(__name__)
@@ -177,7 +182,7 @@ class RuleValidator:
                     )
             
             elif signal_type == "enum":
-                allowed_values = self.catalog.get_signal_values(signal)
+                allowed_set = self.catalog.get_signal_value_set(signal) or frozenset()
                 
                 if op in ["eq", "ne"]:
                     if not isinstance(value, str):
@@ -185,10 +190,10 @@ class RuleValidator:
                             f"Rule '{title}': enum signal '{signal}' at {path} "
                             f"requires string value, got {type(value).__name__}"
                         )
-                    if value not in allowed_values:
+                    if value not in allowed_set:
                         raise RuleValidationError(
                             f"Rule '{title}': invalid value '{value}' for signal '{signal}' "
-                            f"at {path}. Allowed: {allowed_values}"
+                            f"at {path}. Allowed: {self.catalog.get_signal_values(signal)}"
                         )
                 
                 elif op in ["in", "nin"]:
@@ -202,10 +207,10 @@ class RuleValidator:
                                 f"Rule '{title}': enum signal '{signal}' at {path} "
                                 f"requires string values in list"
                             )
-                        if v not in allowed_values:
+                        if v not in allowed_set:
                             raise RuleValidationError(
                                 f"Rule '{title}': invalid value '{v}' in list for signal "
-                                f"'{signal}' at {path}. Allowed: {allowed_values}"
+                                f"'{signal}' at {path}. Allowed: {self.catalog.get_signal_values(signal)}"
                             )
     
     def _validate_actions(
@@ -239,6 +244,10 @@ class RuleEngine:
         catalog: SignalsCatalog,
         *,
         action_handler: Callable[[MatchResult], None],
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[SpanTracer] = None,
+        hot_log: Optional[HotPathLog] = None,
     ) -> None:
         """
         Initialize rules engine.
@@ -247,10 +256,27 @@ class RuleEngine:
             rules: List of rule dicts
             catalog: Signals catalog
             action_handler: Callback for handling matched rules
+            clock: Time source for time-window signals (defaults to real time)
+            metrics: Registry for stage latencies (defaults to the process-wide one)
+            tracer: Span tracer for derivation and per-rule spans (defaults to the process-wide one)
+            hot_log: Sampled per-event debug detail and explain buffer
+                (defaults to DEBUG-level logging only)
         """
         self.catalog = catalog
         self.action_handler = action_handler
-        self.signal_derivation = SignalDerivation(catalog._data)
+        self.metrics = metrics or METRICS
+        self.tracer = tracer or TRACER
+        self.hot_log = hot_log or HotPathLog(logger)
+        # Detail for the event being processed; None unless DEBUG or the
+        # explain buffer wants it, so hot paths test it once.
+        self._event_log: Optional[EventLog] = None
+        self._derive_latency = self.metrics.histogram("rules.derive")
+        self._evaluate_latency = self.metrics.histogram("rules.evaluate")
+        self._dispatch_latency = self.metrics.histogram("rules.dispatch")
+        self._dispatched = self.metrics.counter("rules.dispatched")
+        self.signal_derivation = SignalDerivation(
+            catalog.runtime_data, clock=clock, enum_values=catalog.enum_value_sets
+        )
         
         # Validate and normalize rules
         validator = RuleValidator(catalog)
@@ -276,6 +302,31 @@ class RuleEngine:
         # Track previous match state for edge triggering
         # Key: (commander, is_beta, rule_id)
         self._prev_match_state: Dict[Tuple[str, bool, str], bool] = {}
+
+        # Last known value of every persistent signal (for snapshots).  Signals
+        # that only describe the current event ("event"/"recent") are excluded.
+        plan = catalog.derivation_plan
+        self._momentary_signals: Set[str] = set(plan["momentary"])
+        self.last_known_signals: Dict[str, Any] = {}
+        self.last_identity: Optional[Tuple[str, bool]] = None
+        # Snapshot values standing in for signals the live derivation has not
+        # resolved yet; each is dropped once its live value is known.
+        self._restored_signals: Dict[str, Any] = {}
+
+        # Signals that read only EDMC state sections are derived when their
+        # sections change (see state_ingest.py) and cached in between.
+        self._state_section_signals: Dict[str, List[str]] = plan["state_sections"]
+        self._state_signal_names: Set[str] = {
+            name for names in self._state_section_signals.values() for name in names
+        }
+        self._state_ingest = StateIngest(self._state_section_signals)
+        self._state_signals: Dict[str, Any] = {}
+        self.metrics.gauge("rules.loaded").set(len(self.rules))
+        # Per-rule evaluation time, kept out of the registry (see rule_latencies)
+        self._rule_latency: Dict[str, Histogram] = {
+            rule["id"]: Histogram(f"rule.{rule['id']}", self.metrics) for rule in self.rules
+        }
+        self._state_ingested = False
     
     def _extract_required_signals(self, rule: Dict[str, Any]) -> Set[str]:
         """Return the set of signal names referenced by a rule's conditions."""
@@ -329,6 +380,7 @@ class RuleEngine:
         event_type: str,
         entry: Dict[str, Any],
         context: Optional[Dict[str, Any]] = None,
+        state: Optional[Mapping[str, Any]] = None,
     ) -> None:
         """
         Process a notification and evaluate all rules.
@@ -340,11 +392,14 @@ class RuleEngine:
             event_type: Event type
             entry: Raw event data
             context: Additional context (recent_events, trigger_source, etc.)
+            state: EDMC's state dict (journal events); read in place, never copied
         """
         if context is None:
             context = {}
-        
-        logger.debug(f"Raw event payload: {entry}")
+
+        event_log = self._event_log = self.hot_log.begin_event(source, event_type)
+        if event_log is not None:
+            event_log.add(PAYLOAD, "Raw event payload: %r", entry)
 
         # Enrich payload with notification metadata so catalog signals can
         # target source/event uniformly across journal, dashboard, and CAPI.
@@ -352,41 +407,184 @@ class RuleEngine:
         enriched_entry.setdefault("event", event_type)
         enriched_entry["__edmc_source"] = source
         enriched_entry["__edmc_event_type"] = event_type
-        logger.debug(f"Enriched event payload: {enriched_entry}")
-        logger.debug(f"Derivation context: {context}")
+        if event_log is not None and event_log.wants(PAYLOAD):
+            # Copy: EDMC's state dict is attached to enriched_entry below
+            event_log.add(PAYLOAD, "Enriched event payload: %r", dict(enriched_entry))
+            event_log.add(PAYLOAD, "Derivation context: %r", context)
+
+        started = self.metrics.start()
+        trace_started = self.tracer.begin()
+        if state is not None:
+            self._ingest_state(state)
+            enriched_entry["state"] = state
 
-        # Derive all signals from entry (pass context for recent operator)
-        signals = self.signal_derivation.derive_all_signals(enriched_entry, context)
-        logger.debug(f"Derived signals: {signals}")
+        # Derive all signals from entry (pass context for recent operator);
+        # once state has been ingested, pure state signals come from the cache.
+        if self._state_ingested:
+            signals = self.signal_derivation.derive_all_signals(
+                enriched_entry, context, skip=self._state_signal_names
+            )
+            signals.update(self._state_signals)
+        else:
+            signals = self.signal_derivation.derive_all_signals(enriched_entry, context)
+        if self._restored_signals:
+            self._merge_restored_signals(signals)
+        self._derive_latency.observe_since(started)
+        if trace_started is not None:
+            self.tracer.end("rules.derive", trace_started, args={"event": event_type})
+        if event_log is not None:
+            event_log.add(SIGNALS, "Derived signals: %r", signals)
 
         # Build the set of signals that are resolved (not 'unknown') so we can
         # quickly skip rules that reference unavailable signals.
         available_signals: Set[str] = {
             k for k, v in signals.items() if v != "unknown" and v is not None
         }
+        self.last_identity = (cmdr, is_beta)
+        for name in available_signals - self._momentary_signals:
+            self.last_known_signals[name] = signals[name]
 
-        # Evaluate each rule whose required signals are all available
+        # Evaluate each rule whose required signals are all available;
+        # evaluation latency excludes the time spent dispatching actions.
+        started = self.metrics.start()
+        dispatch_seconds = 0.0
         for rule in self.rules:
             if not rule.get("enabled", True):
                 continue
 
             required = self._rule_required_signals.get(rule["id"], set())
             if not required.issubset(available_signals):
-                missing = required - available_signals
-                logger.debug(
-                    f"Skipping rule '{rule['title']}' [{rule['id']}]: "
-                    f"signals not yet available: {missing}"
-                )
+                if event_log is not None and event_log.wants(RULES):
+                    event_log.add(
+                        RULES, "Skipping rule '%s' [%s]: signals not yet available: %s",
+                        rule["title"], rule["id"], sorted(required - available_signals),
+                    )
                 continue
             
             try:
+                rule_started = self.metrics.start()
+                trace_started = self.tracer.begin()
                 result = self._evaluate_rule(cmdr, is_beta, rule, signals)
+                self._rule_latency[rule["id"]].observe_since(rule_started)
+                if trace_started is not None:
+                    self.tracer.end(f"rule.{rule['id']}", trace_started, "rule", args={"fired": result is not None})
                 if result:
+                    dispatch_started = self.metrics.start()
                     self.action_handler(result)
+                    if dispatch_started is not None:
+                        elapsed = self.metrics.timer() - dispatch_started
+                        dispatch_seconds += elapsed
+                        self._dispatch_latency.observe(elapsed)
+                    self._dispatched.inc()
             except Exception as e:
                 rule_id = rule.get("id", "<unknown>")
                 logger.error(f"Error evaluating rule '{rule_id}': {e}")
-    
+        if started is not None:
+            self._evaluate_latency.observe(self.metrics.timer() - started - dispatch_seconds)
+        self._event_log = None
+
+    def matched_rule_ids(self) -> Set[str]:
+        """Ids of rules whose last evaluation matched (for any commander)."""
+        return {rule_id for (_, _, rule_id), matched in self._prev_match_state.items() if matched}
+
+    def required_signals(self) -> Set[str]:
+        """Names of the signals read by the enabled rules."""
+        names: Set[str] = set()
+        for rule in self.rules:
+            if rule.get("enabled", True):
+                names |= self._rule_required_signals.get(rule["id"], set())
+        return names
+
+    def edge_states(self) -> List[Tuple[str, bool, str, bool]]:
+        """Edge state as ``(cmdr, is_beta, rule_id, matched)`` entries (see ``restore_state``)."""
+        return [(cmdr, is_beta, rule_id, matched) for (cmdr, is_beta, rule_id), matched in list(self._prev_match_state.items())]
+
+    def rule_latencies(self) -> List[HistogramSnapshot]:
+        """Per-rule evaluation latency snapshots, slowest p95 first."""
+        snapshots = [histogram.snapshot() for histogram in list(self._rule_latency.values())]
+        snapshots.sort(key=lambda snapshot: (snapshot.p95_ms, snapshot.max_ms), reverse=True)
+        return snapshots
+
+    def reset_rule_latencies(self) -> None:
+        """Zero the per-rule latencies (they live outside the metrics registry)."""
+        for histogram in list(self._rule_latency.values()):
+            histogram.reset()
+
+    def _ingest_state(self, state: Mapping[str, Any]) -> None:
+        """Re-derive the cached state signals under sections that changed."""
+        changed = self._state_ingest.changed_sections(state)
+        self._state_ingested = True
+        if not changed:
+            return
+        names = {name for section in changed for name in self._state_section_signals[section]}
+        self._state_signals.update(
+            self.signal_derivation.derive_signals(names, {"state": state})
+        )
+        if self._event_log is not None:
+            self._event_log.add(SIGNALS, "State sections changed: %s; re-derived %d signal(s)", sorted(changed), len(names))
+
+    def _merge_restored_signals(self, signals: Dict[str, Any]) -> None:
+        """Fill still-unknown signals from the restored snapshot."""
+        for name, value in list(self._restored_signals.items()):
+            live = signals.get(name, "unknown")
+            if live == "unknown" or live is None:
+                signals[name] = value
+            else:
+                del self._restored_signals[name]
+
+    def restore_state(
+        self,
+        signals: Dict[str, Any],
+        edges: List[Tuple[str, bool, str, bool]],
+    ) -> int:
+        """
+        Restore last known signals and edge state from a snapshot.
+
+        Restored signals are used in evaluation until the live derivation
+        resolves them.  Edge entries for rules that no longer exist are
+        dropped.  Returns the number of edge entries restored.
+        """
+        rule_ids = {rule["id"] for rule in self.rules}
+        persistent = {
+            name: value for name, value in signals.items()
+            if name not in self._momentary_signals and value != "unknown" and value is not None
+        }
+        self.last_known_signals.update(persistent)
+        self._restored_signals.update(persistent)
+        restored = 0
+        for cmdr, is_beta, rule_id, matched in edges:
+            if rule_id in rule_ids:
+                self._prev_match_state[(cmdr, is_beta, rule_id)] = matched
+                restored += 1
+        return restored
+
+    def reapply_edge_actions(self, cmdr: str, is_beta: bool) -> int:
+        """
+        Re-send the branch actions of every rule with a known edge state.
+
+        Endpoints start empty after a restart while restored edge state would
+        suppress the actions until the next transition, so the current branch
+        is sent once.  Returns the number of rules whose actions were sent.
+        """
+        sent = 0
+        for rule in self.rules:
+            if not rule.get("enabled", True):
+                continue
+            matched = self._prev_match_state.get((cmdr, is_beta, rule["id"]))
+            if matched is None:
+                continue
+            actions = rule.get("then" if matched else "else", [])
+            if not actions:
+                continue
+            self.action_handler(MatchResult(
+                rule_id=rule["id"],
+                rule_title=rule["title"],
+                matched=matched,
+                actions_to_execute=actions,
+            ))
+            sent += 1
+        return sent
+
     def _evaluate_rule(
         self,
         cmdr: str,
@@ -409,11 +607,9 @@ class RuleEngine:
         rule_id = rule["id"]
         rule_title = rule["title"]
         
-        # Debug: log rule conditions
-        when = rule.get("when", {})
-        logger.debug(f"Evaluating rule '{rule_title}' [{rule_id}]")
-        logger.debug(f"  Conditions: {when}")
-        
+        if self._event_log is not None:
+            self._event_log.add(RULES, "Evaluating rule '%s' [%s]: %r", rule_title, rule_id, rule.get("when", {}))
+
         # Check current match state
         current_matched = self._check_rule_conditions(rule, signals)
         
@@ -510,12 +706,9 @@ class RuleEngine:
         # Get current signal value
         signal_value = signals.get(signal)
         
-        # Debug: log condition evaluation
-        logger.debug(f"  Condition: {signal} {op} {value}")
-        logger.debug(f"    Signal value: {signal_value} (type: {type(signal_value).__name__})")
-        
         if signal_value is None or signal_value == "unknown":
-            logger.debug("    Result: False (unknown signal value)")
+            if self._event_log is not None:
+                self._event_log.add(CONDITIONS, "  %s %s %r -> False (signal value unknown)", signal, op, value)
             return False
 
         # Apply operator
@@ -546,7 +739,8 @@ class RuleEngine:
         else:
             logger.warning(f"Unknown operator: {op}")
             result = False
-        
-        logger.debug(f"    Result: {result}")
+
+        if self._event_log is not None:
+            self._event_log.add(CONDITIONS, "  %s %s %r -> %s (signal value %r)", signal, op, value, result, signal_value)
         return result
 
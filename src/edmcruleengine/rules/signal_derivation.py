@@ -7,14 +7,42 @@ according to the catalog's derivation specifications.
 
 from __future__ import annotations
 
-import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Set
 
 from .. import plugin_logger
+from ..utils.clock import SYSTEM_CLOCK, Clock
 
 logger = plugin_logger(__name__)
 
 
+def _derive_ops(spec: Any, ops: Set[str]) -> Set[str]:
+    """Collect the ops and data references used anywhere in a derive spec."""
+    if isinstance(spec, dict):
+        if isinstance(spec.get("op"), str):
+            ops.add(spec["op"])
+        if "path" in spec or "field_ref" in spec:
+            ops.add("path")
+        for value in spec.values():
+            _derive_ops(value, ops)
+    elif isinstance(spec, list):
+        for value in spec:
+            _derive_ops(value, ops)
+    return ops
+
+
+def _enum_value_set(signal_def: Dict[str, Any]) -> FrozenSet[str]:
+    """Allowed values of an enum signal definition."""
+    return frozenset(
+        v["value"] for v in signal_def.get("values", []) if isinstance(v, dict) and "value" in v
+    )
+
+
+def is_momentary_spec(spec: Any) -> bool:
+    """Whether a derive spec only describes the current event or a time window."""
+    ops = _derive_ops(spec, set())
+    return bool(ops & {"event", "recent"}) and not ops & {"path", "flag", "count", "exists", "any", "sum"}
+
+
 class SignalDerivation:
     """
     Derives signal values from raw dashboard/status data.
@@ -26,21 +54,40 @@ class SignalDerivation:
     - first_match: return first matching case value
     """
     
-    def __init__(self, catalog_data: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        catalog_data: Dict[str, Any],
+        *,
+        clock: Optional[Clock] = None,
+        enum_values: Optional[Mapping[str, FrozenSet[str]]] = None,
+    ) -> None:
         """
         Initialize derivation engine with catalog data.
         
         Args:
             catalog_data: Catalog dict containing signals and bitfields
+            clock: Time source for ``recent`` windows (defaults to real time)
+            enum_values: Allowed values per enum signal (``SignalsCatalog.enum_value_sets``);
+                built from ``catalog_data`` when omitted
         """
+        self.clock = clock or SYSTEM_CLOCK
         self.signals = catalog_data.get("signals", {})
         self.bitfields = catalog_data.get("bitfields", {})
         self.catalog_data = catalog_data
+        if enum_values is None:
+            enum_values = {
+                name: _enum_value_set(signal_def)
+                for name, signal_def in self.signals.items()
+                if isinstance(signal_def, dict) and signal_def.get("type") == "enum"
+            }
+        self._enum_values = enum_values
     
     def derive_all_signals(
         self,
         entry: Dict[str, Any],
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        skip: Optional[Set[str]] = None,
     ) -> Dict[str, Any]:
         """
         Derive all signal values from entry data.
@@ -48,14 +95,29 @@ class SignalDerivation:
         Args:
             entry: Raw dashboard/status entry
             context: Additional context (recent_events, trigger_source, etc.)
+            skip: Signal names to leave out (e.g. cached state signals)
             
         Returns:
             Dict mapping signal names to derived values
         """
+        return self.derive_signals(self.signals.keys(), entry, context, skip=skip)
+
+    def derive_signals(
+        self,
+        names: Iterable[str],
+        entry: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        skip: Optional[Set[str]] = None,
+    ) -> Dict[str, Any]:
+        """Derive the named signals from entry data (unknown names are ignored)."""
         if context is None:
             context = {}
         result = {}
-        for signal_name, signal_def in self.signals.items():
+        for signal_name in names:
+            if skip and signal_name in skip:
+                continue
+            signal_def = self.signals.get(signal_name)
             # Skip comment fields (starting with underscore) and non-dict values
             if signal_name.startswith("_") or not isinstance(signal_def, dict):
                 continue
@@ -106,8 +168,13 @@ class SignalDerivation:
             return bool(value)
         elif signal_type == "enum":
             # Validate enum value; unknown if not a recognised value
-            allowed_values = [v.get("value") for v in signal_def.get("values", [])]
-            if value not in allowed_values:
+            allowed_values = self._enum_values.get(signal_name)
+            if allowed_values is None:
+                allowed_values = _enum_value_set(signal_def)
+            try:
+                if value not in allowed_values:
+                    return "unknown"
+            except TypeError:  # unhashable (dict/list) can never be an enum value
                 return "unknown"
             return value
         
@@ -467,7 +534,7 @@ class SignalDerivation:
         
         if event_name in recent_events:
             event_time = recent_events[event_name]
-            current_time = time.time()
+            current_time = self.clock.time()
             if current_time - event_time <= within_seconds:
                 return True
         
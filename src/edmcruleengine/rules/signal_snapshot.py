@@ -0,0 +1,164 @@
+"""
+Persisted signal snapshot for restoring rule state across restarts.
+
+The snapshot holds the last known value of every persistent signal and the
+rule engine's edge-trigger state.  It is stamped with hashes of the catalog
+and rules files and with the commander it was taken for; it is only restored
+when both hashes still match, so a changed catalog or rules file never
+resurrects state that no longer applies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import plugin_logger
+
+logger = plugin_logger(__name__)
+
+SNAPSHOT_FILE_NAME = "signal_snapshot.json"
+SNAPSHOT_VERSION = 1
+# Delay before a queued snapshot is written; later snapshots replace it
+SNAPSHOT_WRITE_DELAY_SECONDS = 1.0
+
+
+def file_hash(path: Path | str) -> str:
+    """Return a short content hash of ``path`` ("" if it cannot be read)."""
+    try:
+        return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return ""
+
+
+@dataclass
+class SignalSnapshot:
+    """Last known signals and edge state of one rule engine."""
+    catalog_hash: str
+    rules_hash: str
+    cmdr: str
+    is_beta: bool
+    signals: Dict[str, Any] = field(default_factory=dict)
+    edges: List[Tuple[str, bool, str, bool]] = field(default_factory=list)
+    saved_at: float = 0.0
+
+    def matches(self, catalog_hash: str, rules_hash: str) -> bool:
+        return bool(catalog_hash) and self.catalog_hash == catalog_hash and self.rules_hash == rules_hash
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "catalog_hash": self.catalog_hash,
+            "rules_hash": self.rules_hash,
+            "cmdr": self.cmdr,
+            "is_beta": self.is_beta,
+            "saved_at": self.saved_at,
+            "signals": self.signals,
+            "edges": [list(edge) for edge in self.edges],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["SignalSnapshot"]:
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return None
+        try:
+            edges = [(str(c), bool(b), str(r), bool(m)) for c, b, r, m in data.get("edges", [])]
+            return cls(
+                catalog_hash=str(data["catalog_hash"]),
+                rules_hash=str(data["rules_hash"]),
+                cmdr=str(data.get("cmdr", "")),
+                is_beta=bool(data.get("is_beta", False)),
+                signals=dict(data.get("signals", {})),
+                edges=edges,
+                saved_at=float(data.get("saved_at", 0.0)),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def save_snapshot(path: Path | str, snapshot: SignalSnapshot) -> bool:
+    """Write ``snapshot`` atomically (temp file + replace)."""
+    path = Path(path)
+    if not snapshot.saved_at:
+        snapshot.saved_at = time.time()
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot.to_dict(), f, separators=(",", ":"), default=str)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to save signal snapshot to {path}: {e}")
+        return False
+
+
+def load_snapshot(path: Path | str) -> Optional[SignalSnapshot]:
+    """Read a snapshot, returning None if it is missing, unreadable or outdated."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return SignalSnapshot.from_dict(json.load(f))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable signal snapshot {path}: {e}")
+        return None
+
+
+class SnapshotWriter:
+    """
+    Debounced background writer for periodic snapshots.
+
+    ``submit()`` queues the latest snapshot and returns immediately; a timer
+    thread writes it after ``delay_seconds``.  ``flush()`` writes
+    synchronously (used on shutdown) and supersedes anything still queued.
+    """
+
+    def __init__(self, delay_seconds: float = SNAPSHOT_WRITE_DELAY_SECONDS) -> None:
+        self.delay_seconds = max(0.0, float(delay_seconds))
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # orders timer writes against flush()
+        self._pending: Optional[Tuple[Path, SignalSnapshot]] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(self, path: Path | str, snapshot: SignalSnapshot) -> None:
+        with self._lock:
+            self._pending = (Path(path), snapshot)
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.delay_seconds, self._write_pending)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self, path: Path | str, snapshot: SignalSnapshot) -> bool:
+        """Write ``snapshot`` now, dropping any queued one."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._pending = None
+            return save_snapshot(path, snapshot)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until a queued write (if any) has finished."""
+        with self._lock:
+            timer = self._timer
+        if timer is not None:
+            timer.join(timeout)
+        with self._write_lock:
+            pass
+
+    def _write_pending(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._timer = None
+                pending, self._pending = self._pending, None
+            if pending is not None:
+                save_snapshot(*pending)
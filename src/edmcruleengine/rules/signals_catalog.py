@@ -6,6 +6,11 @@ Loads and validates the signals catalog which defines:
 - Signal derivation specifications
 - Operators for rule conditions
 - UI tiers for signal organization
+
+The catalog is held in two tiers: a runtime core (types, enum value sets,
+derive specs, sources) used by derivation and rule validation, and UI
+metadata (titles, labels, tiers, categories, hierarchy) that catalogs loaded
+from the compiled cache only read on first access.
 """
 
 from __future__ import annotations
@@ -14,10 +19,14 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 
 from .. import plugin_logger
 from ..config.paths import data_path
+from .catalog_cache import UI_CACHE_SECTION, cache_key, cache_path_for, read_cache, write_cache
+from .signal_derivation import is_momentary_spec
+from .state_ingest import signals_by_section
 
 logger = plugin_logger(__name__)
 
@@ -36,6 +45,9 @@ class SignalsCatalog:
     """
     
     REQUIRED_KEYS = ["ui_tiers", "operators", "bitfields", "signals"]
+    # Signal/enum value keys kept in the runtime core
+    RUNTIME_SIGNAL_KEYS = ("type", "derive", "sources")
+    RUNTIME_VALUE_KEYS = ("value", "recent_event")
     
     def __init__(self, catalog_data: Dict[str, Any]) -> None:
         """
@@ -48,19 +60,45 @@ class SignalsCatalog:
             CatalogError: If catalog is invalid or incompatible
         """
         self._validate_catalog(catalog_data)
-        self._data = catalog_data
-        # Flatten nested signals into dot-notation keys
-        self._flattened_signals: Dict[str, Any] = self._flatten_signals(catalog_data["signals"])
-        # Build hierarchical structure for UI navigation
-        self._signal_hierarchy: Dict[str, Any] = self._build_signal_hierarchy(catalog_data["signals"])
+        # UI metadata: full data, flattened full definitions, the hierarchy
+        # for UI navigation and tier/category indexes.  Catalogs loaded from
+        # the compiled cache leave this unset until first use (see _ui_metadata).
+        flattened = self._flatten_signals(catalog_data["signals"])
+        self._ui: Optional[Dict[str, Any]] = {
+            "data": catalog_data,
+            "flattened": flattened,
+            "hierarchy": self._build_signal_hierarchy(catalog_data["signals"]),
+            "by_tier": self._index_by_ui_key(flattened, "tier"),
+            "by_category": self._index_by_ui_key(flattened, "category"),
+        }
+        self._ui_loader: Optional[Callable[[], Dict[str, Any]]] = None
+        # Runtime core: only what derivation and rule validation read
+        runtime_signals = self._runtime_signal_tree(catalog_data["signals"])
+        self._runtime_data: Dict[str, Any] = {
+            "operators": catalog_data["operators"],
+            "bitfields": catalog_data["bitfields"],
+            "signals": runtime_signals,
+        }
+        self._runtime_signals: Dict[str, Any] = self._flatten_signals(runtime_signals)
+        # Precomputed derivation plan used by the rule engine
+        self._derivation_plan: Dict[str, Any] = self._compile_derivation_plan(runtime_signals)
+        self._runtime_indexes: Dict[str, Any] = self._build_runtime_indexes(self._runtime_signals)
+        self._freeze_runtime_indexes()
         
     @classmethod
-    def from_file(cls, path: Path) -> SignalsCatalog:
+    def from_file(cls, path: Path, *, use_cache: bool = True) -> SignalsCatalog:
         """
         Load catalog from a JSON file.
         
+        The compiled catalog is cached next to the file (see
+        ``catalog_cache.py``) and reused while the source and plugin version
+        are unchanged; ``use_cache=False`` always parses and validates.
+        A catalog loaded from the cache holds only the runtime core; UI
+        metadata is loaded from its own cache file on first access.
+        
         Args:
             path: Path to signals_catalog.json
+            use_cache: Read/write the compiled catalog cache
             
         Returns:
             SignalsCatalog instance
@@ -68,18 +106,104 @@ class SignalsCatalog:
         Raises:
             CatalogError: If file is missing, invalid JSON, or incompatible
         """
+        path = Path(path)
         if not path.exists():
             raise CatalogError(f"Catalog file not found: {path}")
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise CatalogError(f"Invalid JSON in catalog: {e}")
+            source = path.read_bytes()
         except Exception as e:
             raise CatalogError(f"Failed to read catalog: {e}")
+
+        key = cache_key(source) if use_cache else ""
+        if use_cache:
+            payload = read_cache(cache_path_for(path), key)
+            if payload is not None:
+                return cls._from_compiled(payload, lambda: cls._load_ui_metadata(path, key))
+
+        try:
+            data = json.loads(source.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise CatalogError(f"Invalid JSON in catalog: {e}")
         
-        return cls(data)
+        catalog = cls(data)
+        if use_cache and write_cache(cache_path_for(path), key, catalog._compiled_payload()) and write_cache(
+            cache_path_for(path, UI_CACHE_SECTION), key, catalog._ui_metadata()
+        ):
+            logger.info(f"Compiled signals catalog cache for {path.name}")
+        return catalog
+
+    @classmethod
+    def _from_compiled(cls, payload: Dict[str, Any], ui_loader: Callable[[], Dict[str, Any]]) -> SignalsCatalog:
+        """Rebuild a runtime catalog from a cached payload (already validated)."""
+        catalog = cls.__new__(cls)
+        catalog._ui = None
+        catalog._ui_loader = ui_loader
+        catalog._runtime_data = payload["runtime"]
+        catalog._runtime_signals = payload["flattened"]
+        catalog._derivation_plan = payload["plan"]
+        catalog._runtime_indexes = payload["indexes"]
+        catalog._freeze_runtime_indexes()
+        return catalog
+
+    @classmethod
+    def _load_ui_metadata(cls, path: Path, key: str) -> Dict[str, Any]:
+        payload = read_cache(cache_path_for(path, UI_CACHE_SECTION), key)
+        if payload is not None:
+            return payload
+        # UI cache missing, or the JSON changed since the runtime core loaded
+        logger.info(f"Signals catalog UI metadata not cached, reading {path.name}")
+        return cls.from_file(path, use_cache=False)._ui_metadata()
+
+    def _compiled_payload(self) -> Dict[str, Any]:
+        return {
+            "runtime": self._runtime_data,
+            "flattened": self._runtime_signals,
+            "plan": self._derivation_plan,
+            "indexes": self._runtime_indexes,
+        }
+
+    def _build_runtime_indexes(self, signals: Dict[str, Any]) -> Dict[str, Any]:
+        """Enum values in catalog order and known event names, for the cache."""
+        return {
+            "enum_values": {
+                name: tuple(v["value"] for v in sig.get("values", []) if isinstance(v, dict) and "value" in v)
+                for name, sig in signals.items()
+                if sig.get("type") == "enum"
+            },
+            "known_events": frozenset(self._collect_known_events(signals)),
+        }
+
+    def _freeze_runtime_indexes(self) -> None:
+        enum_values = self._runtime_indexes["enum_values"]
+        self._enum_values: Mapping[str, Tuple[str, ...]] = MappingProxyType(enum_values)
+        self._enum_value_sets: Mapping[str, FrozenSet[str]] = MappingProxyType(
+            {name: frozenset(values) for name, values in enum_values.items()}
+        )
+        self._known_events: FrozenSet[str] = self._runtime_indexes["known_events"]
+
+    @staticmethod
+    def _index_by_ui_key(signals: Dict[str, Any], key: str) -> Dict[str, Tuple[str, ...]]:
+        """Map each value of ``ui[key]`` (tier, category) to its signal names."""
+        index: Dict[str, List[str]] = {}
+        for name, sig in signals.items():
+            value = sig.get("ui", {}).get(key)
+            if isinstance(value, str):
+                index.setdefault(value, []).append(name)
+        return {value: tuple(names) for value, names in index.items()}
+
+    def _ui_metadata(self) -> Dict[str, Any]:
+        """Return UI metadata, loading it on first use."""
+        if self._ui is None:
+            self._ui = self._ui_loader()
+            self._ui_loader = None
+            logger.debug("Loaded signals catalog UI metadata")
+        return self._ui
+
+    @property
+    def ui_loaded(self) -> bool:
+        """True once UI metadata (labels, tiers, hierarchy) is in memory."""
+        return self._ui is not None
     
     @classmethod
     def from_plugin_dir(cls, plugin_dir: Optional[str] = None) -> SignalsCatalog:
@@ -229,6 +353,51 @@ class SignalsCatalog:
         
         return flattened
     
+    def _runtime_signal_tree(self, signals: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Strip signal definitions down to what the runtime engine reads.
+        
+        Keeps the nesting, ``type``, ``derive`` and ``sources`` of each signal,
+        and only ``value``/``recent_event`` of enum values; drops titles, UI
+        metadata, labels and comments.
+        """
+        tree: Dict[str, Any] = {}
+        for key, value in signals.items():
+            if key.startswith("_") or not isinstance(value, dict):
+                continue
+            if "type" not in value:
+                tree[key] = self._runtime_signal_tree(value)
+                continue
+            runtime_def = {k: value[k] for k in self.RUNTIME_SIGNAL_KEYS if k in value}
+            if isinstance(value.get("values"), list):
+                runtime_def["values"] = [
+                    {k: v[k] for k in self.RUNTIME_VALUE_KEYS if k in v} if isinstance(v, dict) else v
+                    for v in value["values"]
+                ]
+            tree[key] = runtime_def
+        return tree
+
+    def _compile_derivation_plan(self, signals: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute how derivation treats each top-level signal.
+
+        ``state_sections`` maps each EDMC state section to the signals that
+        read only from it; ``momentary`` lists signals that only describe the
+        current event or a time window.
+        """
+        return {
+            "state_sections": signals_by_section(signals),
+            "momentary": sorted(
+                name for name, signal_def in signals.items()
+                if isinstance(signal_def, dict) and is_momentary_spec(signal_def.get("derive"))
+            ),
+        }
+
+    @property
+    def derivation_plan(self) -> Dict[str, Any]:
+        """Precomputed derivation plan (see ``_compile_derivation_plan``)."""
+        return self._derivation_plan
+
     def _build_signal_hierarchy(self, signals: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
         """
         Build a hierarchical tree structure for UI navigation.
@@ -293,15 +462,30 @@ class SignalsCatalog:
         
         return hierarchy
     
+    @property
+    def _data(self) -> Dict[str, Any]:
+        """Full parsed catalog JSON (loads UI metadata)."""
+        return self._ui_metadata()["data"]
+
+    @property
+    def runtime_data(self) -> Dict[str, Any]:
+        """Runtime core in catalog layout (signals, operators, bitfields) for derivation."""
+        return self._runtime_data
+
+    @property
+    def runtime_signals(self) -> Dict[str, Any]:
+        """Flattened runtime signal definitions (type, derive, sources, enum values)."""
+        return self._runtime_signals
+
     @property
     def signals(self) -> Dict[str, Any]:
-        """Get all signal definitions (flattened from nested structure)."""
-        return self._flattened_signals
+        """Get all signal definitions (flattened from nested structure, loads UI metadata)."""
+        return self._ui_metadata()["flattened"]
     
     @property
     def operators(self) -> Dict[str, Any]:
         """Get all operator definitions."""
-        return self._data["operators"]
+        return self._runtime_data["operators"]
     
     @property
     def ui_tiers(self) -> Dict[str, Any]:
@@ -311,16 +495,16 @@ class SignalsCatalog:
     @property
     def bitfields(self) -> Dict[str, str]:
         """Get bitfield references."""
-        return self._data["bitfields"]
+        return self._runtime_data["bitfields"]
     
     @property
     def signal_hierarchy(self) -> Dict[str, Any]:
         """Get signal hierarchy for UI navigation (groups and signals)."""
-        return self._signal_hierarchy
+        return self._ui_metadata()["hierarchy"]
     
     def get_signal(self, name: str) -> Optional[Dict[str, Any]]:
         """
-        Get signal definition by name.
+        Get the full signal definition by name (loads UI metadata).
         
         Args:
             name: Signal name
@@ -328,11 +512,11 @@ class SignalsCatalog:
         Returns:
             Signal definition dict, or None if not found
         """
-        return self._flattened_signals.get(name)
+        return self.signals.get(name)
     
     def signal_exists(self, name: str) -> bool:
         """Check if a signal exists in the catalog."""
-        return name in self._flattened_signals
+        return name in self._runtime_signals
 
     def resolve_signal_name(self, name: str) -> str:
         """Return the signal name as-is (dot-notation canonical form)."""
@@ -344,7 +528,7 @@ class SignalsCatalog:
     
     def get_signal_type(self, name: str) -> Optional[str]:
         """Get signal type (bool, enum, etc.)."""
-        signal = self.get_signal(name)
+        signal = self._runtime_signals.get(name)
         return signal.get("type") if signal else None
     
     def get_signal_values(self, name: str) -> Optional[List[str]]:
@@ -357,19 +541,21 @@ class SignalsCatalog:
         Returns:
             List of allowed value strings, or None if not an enum signal
         """
-        signal = self.get_signal(name)
-        if not signal or signal.get("type") != "enum":
-            return None
-        
-        values = signal.get("values", [])
-        return [v["value"] for v in values if isinstance(v, dict) and "value" in v]
+        values = self._enum_values.get(name)
+        return list(values) if values is not None else None
+
+    def get_signal_value_set(self, name: str) -> Optional[FrozenSet[str]]:
+        """Get allowed values of an enum signal as a frozenset, or None if not an enum."""
+        return self._enum_value_sets.get(name)
+
+    @property
+    def enum_value_sets(self) -> Mapping[str, FrozenSet[str]]:
+        """Allowed values per enum signal (read-only)."""
+        return self._enum_value_sets
     
     def get_signals_by_tier(self, tier: str) -> List[str]:
         """Get list of signal names for the given UI tier (e.g. 'core', 'detail')."""
-        return [
-            name for name, sig in self.signals.items()
-            if not name.startswith("_") and isinstance(sig, dict) and sig.get("ui", {}).get("tier") == tier
-        ]
+        return list(self._ui_metadata()["by_tier"].get(tier, ()))
 
     def get_core_signals(self) -> List[str]:
         """Get list of core-tier signal names."""
@@ -381,14 +567,16 @@ class SignalsCatalog:
 
     def get_signals_by_category(self, category: str) -> List[str]:
         """Get signal names filtered by UI category."""
-        return [
-            name for name, sig in self.signals.items()
-            if sig.get("ui", {}).get("category") == category
-        ]
+        return list(self._ui_metadata()["by_category"].get(category, ()))
     
-    def get_all_known_events(self) -> Set[str]:
+    def get_all_known_events(self) -> FrozenSet[str]:
+        """Get all event names the catalog references (derive ops, sources, recent events)."""
+        return self._known_events
+
+    @staticmethod
+    def _collect_known_events(signals: Dict[str, Any]) -> Set[str]:
         """
-        Extract all known event names from the catalog.
+        Extract all known event names from flattened signal definitions.
         
         Scans through all signals to find event names referenced in:
         - Signal derive.op == "event" (event_name field)
@@ -400,7 +588,7 @@ class SignalsCatalog:
         """
         known_events = set()
         
-        for signal_name, signal_def in self.signals.items():
+        for signal_name, signal_def in signals.items():
             if not isinstance(signal_def, dict):
                 continue
             
@@ -0,0 +1,111 @@
+"""
+Incremental ingestion of EDMC's ``state`` dict.
+
+EDMC passes its (large, in-place mutated) ``state`` dict with every journal
+event.  Copying it per event is too expensive, so ``StateIngest`` keeps a
+shallow fingerprint of every top-level section the catalog reads and reports
+which sections changed since the previous event.  A section whose identity
+or length changed is reported straight away; only sections that may have
+been mutated in place are compared against their fingerprint, and a new
+fingerprint is taken only when a section changed.  Only the signals that
+read exclusively from changed sections are re-derived; everything else keeps
+its cached value.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Deep enough to compare every value a catalog path reaches
+# (e.g. state.Route.0.StarSystem) without walking whole sections.
+FINGERPRINT_DEPTH = 2
+
+_MISSING = object()
+
+
+def fingerprint(value: Any, depth: int = FINGERPRINT_DEPTH) -> Any:
+    """
+    Return a comparable copy of ``value`` down to ``depth`` levels.
+
+    Containers are copied level by level; anything deeper is kept by
+    reference, so comparing a live value against its fingerprint with ``==``
+    runs in C and short-circuits on every object that is still the same one.
+    Scalars (and tuples of scalars, as EDMC stores ranks) compare by value.
+    """
+    if isinstance(value, Mapping):
+        if depth <= 0:
+            return dict(value)
+        return {key: fingerprint(item, depth - 1) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if depth <= 0:
+            return value if isinstance(value, tuple) else list(value)
+        items = [fingerprint(item, depth - 1) for item in value]
+        return tuple(items) if isinstance(value, tuple) else items
+    return value
+
+
+def state_sections(spec: Any) -> Optional[Set[str]]:
+    """
+    Return the state sections a derive spec reads, if it reads nothing else.
+
+    Returns None when the spec also depends on the current entry (event
+    fields, dashboard flags, event names or time windows).
+    """
+    sections: Set[str] = set()
+
+    def _walk(node: Any) -> bool:
+        if isinstance(node, dict):
+            if node.get("op") in ("flag", "event", "recent", "match") or "field_ref" in node:
+                return False
+            path = node.get("path")
+            if path is not None:
+                if not isinstance(path, str) or not path.startswith("state."):
+                    return False
+                sections.add(path.split(".", 2)[1])
+            return all(_walk(value) for value in node.values())
+        if isinstance(node, list):
+            return all(_walk(value) for value in node)
+        return True
+
+    if not _walk(spec) or not sections:
+        return None
+    return sections
+
+
+class StateIngest:
+    """Tracks which top-level sections of EDMC's state changed between events."""
+
+    def __init__(self, sections: Iterable[str]) -> None:
+        self.sections = frozenset(sections)
+        # section -> ((id, len) of the container, or None for scalars, fingerprint)
+        self._fingerprints: Dict[str, Tuple[Optional[Tuple[int, int]], Any]] = {}
+
+    def changed_sections(self, state: Mapping[str, Any]) -> Set[str]:
+        """Return the tracked sections that changed since last time."""
+        changed: Set[str] = set()
+        for section in self.sections:
+            value = state.get(section, _MISSING)
+            identity = (id(value), len(value)) if isinstance(value, (Mapping, list, tuple)) else None
+            previous = self._fingerprints.get(section)
+            # Identity and length can only prove a change; an equal pair may
+            # still hide an in-place mutation, so the contents are compared.
+            if previous is not None and previous[0] == identity and value == previous[1]:
+                continue
+            self._fingerprints[section] = (identity, fingerprint(value))
+            changed.add(section)
+        return changed
+
+    def reset(self) -> None:
+        self._fingerprints.clear()
+
+
+def signals_by_section(signals: Mapping[str, Any]) -> Dict[str, List[str]]:
+    """Map each state section to the pure state signals that read it."""
+    by_section: Dict[str, List[str]] = {}
+    for name, signal_def in signals.items():
+        if name.startswith("_") or not isinstance(signal_def, dict):
+            continue
+        sections = state_sections(signal_def.get("derive"))
+        for section in sections or ():
+            by_section.setdefault(section, []).append(name)
+    return by_section
@@ -20,7 +20,6 @@ from .ui_components import (
     create_colored_button,
     create_icon_action_button,
 )
-from ..utils.plugin_update_manager import PluginUpdateManager
 from ..config.version import __version__ as PLUGIN_VERSION
 
 
@@ -101,8 +100,10 @@ def build_plugin_prefs_panel(parent, cmdr: str, is_beta: bool, deps: PrefsPanelD
 
     settings_tab = ttk.Frame(notebook)
     events_tab = ttk.Frame(notebook)
+    diagnostics_tab = ttk.Frame(notebook)
     notebook.add(settings_tab, text="Settings")
     notebook.add(events_tab, text="Events")
+    notebook.add(diagnostics_tab, text="Diagnostics")
 
     settings_tab.columnconfigure(0, weight=1, uniform="settings-top")
     settings_tab.columnconfigure(1, weight=1, uniform="settings-top")
@@ -243,6 +244,8 @@ def build_plugin_prefs_panel(parent, cmdr: str, is_beta: bool, deps: PrefsPanelD
         plugin_update_btn.configure(state=tk.DISABLED, text="Checking...")
 
         def _worker() -> None:
+            from ..utils.plugin_update_manager import PluginUpdateManager
+
             plugin_install_dir = Path(_plugin_dir) if _plugin_dir else deps.plugin_root
             updater = PluginUpdateManager(plugin_install_dir, logger=logger)
             current_version = plugin_version_var.get().strip().lstrip("v") or PLUGIN_VERSION
@@ -943,6 +946,8 @@ def build_plugin_prefs_panel(parent, cmdr: str, is_beta: bool, deps: PrefsPanelD
                 output_file = output_dir / f"recorded_events_{timestamp}_{suffix:02d}.jsonl"
                 suffix += 1
             try:
+                if _config:
+                    _event_recorder.configure(_config)
                 _event_recorder.start(output_file)
                 rec_btn.configure(text="Stop Recording")
                 apply_colored_button_style(rec_btn, "danger")
@@ -1643,5 +1648,159 @@ def build_plugin_prefs_panel(parent, cmdr: str, is_beta: bool, deps: PrefsPanelD
     # Initial population of event counts
     _refresh_unregistered_events()
 
+    # Diagnostics Tab
+    # Collection only copies metric snapshots, so it runs in the Tk poll
+    # itself and only while the tab is visible.
+    from ..utils.diagnostics import DiagnosticsCollector, report_sections
+
+    diagnostics_tab.columnconfigure(0, weight=1)
+    diagnostics_collector = DiagnosticsCollector(
+        get_event_handler=deps.get_event_handler,
+        get_vkb_manager=deps.get_vkb_manager,
+        get_event_recorder=deps.get_event_recorder,
+    )
+    diagnostics_refresh_ms = 1000
+    diagnostics_status_var = tk.StringVar(value="Collecting...")
+    diagnostics_sections: dict[str, tk.StringVar] = {}
+
+    for section_row, title in enumerate(
+        ("Event rate", "Stage latency", "Queues", "VKB sends", "Slowest rules", "Memory")
+    ):
+        section_frame = ttk.LabelFrame(diagnostics_tab, text=title, padding=6)
+        section_frame.grid(row=section_row, column=0, sticky="ew", padx=4, pady=(6, 0))
+        section_var = tk.StringVar(value="")
+        ttk.Label(section_frame, textvariable=section_var, font=("TkFixedFont", 9), justify="left").grid(
+            row=0, column=0, sticky="w"
+        )
+        diagnostics_sections[title] = section_var
+
+    diagnostics_footer = ttk.Frame(diagnostics_tab)
+    diagnostics_footer.grid(row=6, column=0, sticky="ew", padx=4, pady=6)
+    ttk.Label(diagnostics_footer, textvariable=diagnostics_status_var, foreground="gray").grid(
+        row=0, column=0, sticky="w"
+    )
+
+    def _reset_diagnostics() -> None:
+        diagnostics_collector.reset()
+        _refresh_diagnostics(force=True)
+
+    create_colored_button(diagnostics_footer, text="Reset", command=_reset_diagnostics, style="info").grid(
+        row=0, column=1, sticky="e", padx=(12, 0)
+    )
+
+    # Opt-in span tracer (utils/tracing.py), saved as Chrome Trace Event JSON
+    trace_enabled_var = tk.BooleanVar(value=bool(_config.get("trace_enabled", False)) if _config else False)
+
+    def _on_trace_enabled_changed(*_args) -> None:
+        if _config:
+            _config.set("trace_enabled", trace_enabled_var.get())
+
+    trace_enabled_var.trace_add("write", _on_trace_enabled_changed)
+    ttk.Checkbutton(diagnostics_footer, text="Record trace", variable=trace_enabled_var).grid(
+        row=0, column=2, sticky="e", padx=(12, 0)
+    )
+
+    def _save_trace() -> None:
+        from ..utils.tracing import TRACER, trace_file_path
+
+        tracer = getattr(_event_handler, "tracer", None) or TRACER
+        target = trace_file_path(_plugin_dir or deps.plugin_root)
+
+        def _worker() -> None:
+            try:
+                message = f"Trace saved: {tracer.dump(target)}"
+            except Exception as e:
+                logger.error(f"Failed to save trace: {e}")
+                message = f"Failed to save trace: {e}"
+            if frame.winfo_exists():
+                frame.after(0, lambda: diagnostics_status_var.set(message))
+
+        diagnostics_status_var.set("Saving trace...")
+        threading.Thread(target=_worker, name="TraceExport", daemon=True).start()
+
+    create_colored_button(diagnostics_footer, text="Save Trace", command=_save_trace, style="info").grid(
+        row=0, column=3, sticky="e", padx=(6, 0)
+    )
+
+    # On-demand sampling profiler (utils/profiling.py); load.py starts it when
+    # profiling_enabled is set and clears the flag once the files are written.
+    profile_memory_var = tk.BooleanVar(
+        value=bool(_config.get("profiling_tracemalloc", False)) if _config else False
+    )
+    ttk.Checkbutton(diagnostics_footer, text="Include memory", variable=profile_memory_var).grid(
+        row=1, column=2, sticky="e", padx=(12, 0), pady=(4, 0)
+    )
+
+    def _start_profile() -> None:
+        if not _config:
+            return
+        if _config.get("profiling_enabled", False):
+            diagnostics_status_var.set("Profiling already running")
+            return
+        from ..utils.profiling import PROFILE_DIR_NAME
+
+        _config.set("profiling_tracemalloc", profile_memory_var.get())
+        _config.set("profiling_enabled", True)
+        seconds = _config.get("profiling_duration_seconds", 30)
+        profiles_dir = Path(_plugin_dir or deps.plugin_root) / PROFILE_DIR_NAME
+        diagnostics_status_var.set(f"Profiling for {seconds}s; results in {profiles_dir}")
+
+    create_colored_button(diagnostics_footer, text="Profile", command=_start_profile, style="info").grid(
+        row=1, column=3, sticky="e", padx=(6, 0), pady=(4, 0)
+    )
+
+    def _explain_recent_events() -> None:
+        """Show the rule engine detail buffered for recent events."""
+        lines = _event_handler.explain_recent_events() if _event_handler else []
+        if not lines:
+            lines = [
+                "No events buffered.",
+                "Set debug_explain_events to the number of events to keep (e.g. 50).",
+            ]
+        from .scrolled_text import ScrolledText
+
+        explain_window = tk.Toplevel(frame)
+        explain_window.title("Recent Events Explained")
+        explain_window.geometry("900x600")
+        text = ScrolledText(explain_window, wrap="none", font=("TkFixedFont", 9))
+        text.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+        text.insert("1.0", "\n".join(lines))
+        text.text.configure(state="disabled")
+
+    create_colored_button(diagnostics_footer, text="Explain Events", command=_explain_recent_events, style="info").grid(
+        row=1, column=1, sticky="e", padx=(12, 0), pady=(4, 0)
+    )
+
+    def _render_diagnostics(report) -> None:
+        if not frame.winfo_exists():
+            return
+        for title, rows in report_sections(report):
+            width = max((len(label) for label, _value in rows), default=0)
+            diagnostics_sections[title].set("\n".join(f"{label:<{width}}  {value}" for label, value in rows))
+        if report.metrics_enabled:
+            diagnostics_status_var.set(f"Updated {datetime.now().strftime('%H:%M:%S')}")
+        else:
+            diagnostics_status_var.set("Metrics are disabled (metrics_enabled = false)")
+
+    def _refresh_diagnostics(force: bool = False) -> None:
+        # Only collect while the tab is visible
+        if not force and notebook.select() != str(diagnostics_tab):
+            return
+        try:
+            report = diagnostics_collector.collect()
+        except Exception as e:
+            logger.debug(f"Diagnostics collection failed: {e}", exc_info=True)
+            return
+        _render_diagnostics(report)
+
+    def _poll_diagnostics() -> None:
+        if not frame.winfo_exists():
+            return
+        _refresh_diagnostics()
+        frame.after(diagnostics_refresh_ms, _poll_diagnostics)
+
+    notebook.bind("<<NotebookTabChanged>>", lambda _event: _refresh_diagnostics(), add="+")
+    frame.after(diagnostics_refresh_ms, _poll_diagnostics)
+
     return frame
 
@@ -0,0 +1,86 @@
+"""
+Clock abstraction for EDMC VKB Connector.
+
+Components that measure time windows take a ``Clock`` instead of calling the
+``time`` module directly, so recorded sessions can be replayed faster than
+real time and tests can control time deterministically.  The EventHandler
+shares its clock with the RuleEngine/SignalDerivation and the unregistered
+events tracker; VKBLinkManager uses it for its waits, polls and send
+scheduling.
+"""
+
+from __future__ import annotations
+
+import abc
+import threading
+import time
+
+
+class Clock(abc.ABC):
+    """Time source: wall clock, monotonic clock and sleep."""
+
+    @abc.abstractmethod
+    def time(self) -> float:
+        """Wall-clock time in epoch seconds."""
+
+    @abc.abstractmethod
+    def monotonic(self) -> float:
+        """Monotonic seconds for measuring intervals."""
+
+    @abc.abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Block for ``seconds`` (or advance virtual time by it)."""
+
+
+class SystemClock(Clock):
+    """Real time from the ``time`` module."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    Manually driven clock for replays and simulations.
+
+    Time only moves when ``advance``/``advance_to``/``sleep`` is called, so
+    hours of recorded gameplay can be evaluated in milliseconds.  ``time()``
+    and ``monotonic()`` read the same counter and never go backwards.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = float(start)
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> float:
+        """Move time forward by ``seconds`` (negative values are ignored)."""
+        with self._lock:
+            if seconds > 0:
+                self._now += seconds
+            return self._now
+
+    def advance_to(self, timestamp: float) -> float:
+        """Move time forward to ``timestamp`` if it is later than now."""
+        with self._lock:
+            if timestamp > self._now:
+                self._now = float(timestamp)
+            return self._now
+
+
+SYSTEM_CLOCK = SystemClock()
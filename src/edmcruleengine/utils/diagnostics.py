@@ -0,0 +1,191 @@
+"""
+Diagnostics reports for EDMC VKB Connector.
+
+``DiagnosticsCollector`` turns the pipeline metrics (see ``metrics.py``) and
+a few component stats into an immutable ``DiagnosticsReport``: event rate per
+source, per-stage latency percentiles, queue depths, VKB send counts, the
+slowest rules and the memory held by the unregistered events tracker and the
+event recorder.
+
+Collection only reads snapshot copies, so the preferences panel runs it
+from its Tk poll and renders the report with ``report_sections``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .metrics import METRICS, HistogramSnapshot, MetricsRegistry
+
+# Pipeline stages in the order an event flows through them.
+STAGES = (
+    "event.handle",
+    "rules.reload_check",
+    "rules.derive",
+    "rules.evaluate",
+    "rules.dispatch",
+    "vkb.shift_send",
+    "vkb.send_event",
+    "recorder.record",
+    "recorder.write",
+)
+
+SOURCE_COUNTER_PREFIX = "events.source."
+SLOWEST_RULES = 5
+
+
+@dataclass(frozen=True)
+class DiagnosticsReport:
+    """Point-in-time diagnostics; every field is a copy."""
+    metrics_enabled: bool
+    event_rates: Dict[str, float]  # events/second per source since the previous report
+    event_totals: Dict[str, int]
+    stages: List[HistogramSnapshot]
+    queues: Dict[str, float]
+    vkb: Dict[str, int]
+    slowest_rules: List[HistogramSnapshot]
+    memory_bytes: Dict[str, int]
+    collected_at: float = field(default=0.0)
+
+
+class DiagnosticsCollector:
+    """
+    Build ``DiagnosticsReport`` objects from live components.
+
+    Components are looked up through callables on every collection so the
+    collector keeps working across plugin restarts and rule reloads.  Event
+    rates are computed from counter deltas between consecutive reports.
+    """
+
+    def __init__(
+        self,
+        *,
+        get_event_handler: Callable[[], Any] = lambda: None,
+        get_vkb_manager: Callable[[], Any] = lambda: None,
+        get_event_recorder: Callable[[], Any] = lambda: None,
+        metrics: Optional[MetricsRegistry] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._get_event_handler = get_event_handler
+        self._get_vkb_manager = get_vkb_manager
+        self._get_event_recorder = get_event_recorder
+        self.metrics = metrics or METRICS
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._previous: Optional[Tuple[float, Dict[str, int]]] = None
+
+    def collect(self) -> DiagnosticsReport:
+        snapshot = self.metrics.snapshot()
+        now = self._clock()
+        totals = {
+            name[len(SOURCE_COUNTER_PREFIX):]: value
+            for name, value in snapshot.counters.items()
+            if name.startswith(SOURCE_COUNTER_PREFIX)
+        }
+        with self._lock:
+            previous, self._previous = self._previous, (now, totals)
+        rates: Dict[str, float] = {}
+        if previous is not None and now > previous[0]:
+            elapsed = now - previous[0]
+            rates = {
+                source: max(0, total - previous[1].get(source, 0)) / elapsed
+                for source, total in totals.items()
+            }
+
+        gauges = snapshot.gauges
+        counters = snapshot.counters
+        queues = {
+            "recorder": gauges.get("recorder.queue_depth", 0.0),
+            "recent events window": gauges.get("events.recent_window", 0.0),
+        }
+        vkb = {
+            "sent": counters.get("vkb.shift_sent", 0),
+            "failed": counters.get("vkb.shift_failed", 0),
+            "send errors": counters.get("vkb.send_errors", 0),
+            "reconnects": counters.get("vkb.reconnects", 0),
+        }
+        send_stats = self._send_stats()
+        if send_stats is not None:
+            vkb["suppressed"] = send_stats.suppressed
+            queues["vkb send pending"] = 1.0 if send_stats.pending else 0.0
+
+        recorder = self._get_event_recorder()
+        memory = {
+            "tracker": int(gauges.get("tracker.bytes", 0)),
+            "recorder": int(gauges.get("recorder.batch_bytes", 0)) if recorder is not None else 0,
+        }
+        return DiagnosticsReport(
+            metrics_enabled=snapshot.enabled,
+            event_rates=rates,
+            event_totals=totals,
+            stages=[snapshot.histograms[name] for name in STAGES if name in snapshot.histograms],
+            queues=queues,
+            vkb=vkb,
+            slowest_rules=self._slowest_rules(),
+            memory_bytes=memory,
+            collected_at=now,
+        )
+
+    def reset(self) -> None:
+        """Zero the registry and the rule engine's per-rule latencies."""
+        self.metrics.reset()
+        handler = self._get_event_handler()
+        reset_rule_latencies = getattr(getattr(handler, "rule_engine", None), "reset_rule_latencies", None)
+        if callable(reset_rule_latencies):
+            reset_rule_latencies()
+        with self._lock:
+            self._previous = None
+
+    def _send_stats(self):
+        manager = self._get_vkb_manager()
+        get_send_stats = getattr(manager, "get_send_stats", None)
+        if not callable(get_send_stats):
+            return None
+        try:
+            return get_send_stats()
+        except Exception:
+            return None
+
+    def _slowest_rules(self) -> List[HistogramSnapshot]:
+        handler = self._get_event_handler()
+        engine = getattr(handler, "rule_engine", None)
+        rule_latencies = getattr(engine, "rule_latencies", None)
+        if not callable(rule_latencies):
+            return []
+        return [snapshot for snapshot in rule_latencies() if snapshot.count][:SLOWEST_RULES]
+
+
+def _format_bytes(value: int) -> str:
+    if value >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.1f} MB"
+    if value >= 1024:
+        return f"{value / 1024:.1f} KB"
+    return f"{value} B"
+
+
+def _format_latency(snapshot: HistogramSnapshot) -> str:
+    return (
+        f"p50 {snapshot.p50_ms:.3f}  p95 {snapshot.p95_ms:.3f}  p99 {snapshot.p99_ms:.3f}  "
+        f"max {snapshot.max_ms:.3f} ms  (n={snapshot.count})"
+    )
+
+
+def report_sections(report: DiagnosticsReport) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    """Return ``[(section title, [(label, value), ...]), ...]`` for display."""
+    events = [
+        (source, f"{report.event_rates.get(source, 0.0):.1f}/s  ({total} total)")
+        for source, total in sorted(report.event_totals.items())
+    ]
+    stages = [(snapshot.name, _format_latency(snapshot)) for snapshot in report.stages if snapshot.count]
+    rules = [(snapshot.name[len("rule."):], _format_latency(snapshot)) for snapshot in report.slowest_rules]
+    return [
+        ("Event rate", events or [("-", "no events yet")]),
+        ("Stage latency", stages or [("-", "no samples yet")]),
+        ("Queues", [(name, f"{value:g}") for name, value in report.queues.items()]),
+        ("VKB sends", [(name, str(value)) for name, value in report.vkb.items()]),
+        ("Slowest rules", rules or [("-", "no samples yet")]),
+        ("Memory", [(name, _format_bytes(value)) for name, value in report.memory_bytes.items()]),
+    ]
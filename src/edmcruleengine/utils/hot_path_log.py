@@ -0,0 +1,179 @@
+"""
+Lazy, sampled debug logging for the event hot path.
+
+Building debug messages for every event (full payloads, contexts, derived
+signals, per-condition results) costs more than evaluating the rules when
+the text is formatted eagerly and then discarded.  ``HotPathLog`` keeps that
+detail off the hot path:
+
+* ``begin_event()`` checks the logger level and the explain buffer once per
+  event and returns None when neither wants detail, so callers hoist one
+  ``is not None`` check out of their loops and pay nothing else.
+* Records are stored as ``(category, format, args)`` and only formatted
+  with ``%`` when logged at DEBUG or read back with ``explain()``.
+* Each category has a sampling rate; a rate of 0.25 keeps detail for every
+  fourth event.  Sampling is per event, so a sampled event is complete.
+* The last ``capacity`` events are kept in a bounded ring buffer for
+  "explain the last N events", independent of the log level.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+PAYLOAD = "payload"        # raw/enriched event payload and derivation context
+SIGNALS = "signals"        # derived signal values
+RULES = "rules"            # rule evaluation and skipped rules
+CONDITIONS = "conditions"  # individual condition results
+
+CATEGORIES = (PAYLOAD, SIGNALS, RULES, CONDITIONS)
+DEFAULT_SAMPLE_RATES: Dict[str, float] = {category: 1.0 for category in CATEGORIES}
+
+
+def parse_sample_rates(spec: Any) -> Dict[str, float]:
+    """
+    Parse ``"payload=0.1,conditions=0.25"`` (or a mapping) into sample rates.
+
+    Unknown categories and malformed entries are ignored; categories not
+    mentioned keep their default rate of 1.0.
+    """
+    rates = dict(DEFAULT_SAMPLE_RATES)
+    if isinstance(spec, Mapping):
+        items = list(spec.items())
+    else:
+        items = [part.split("=", 1) for part in str(spec or "").split(",") if "=" in part]
+    for category, rate in items:
+        category = str(category).strip()
+        if category not in rates:
+            continue
+        try:
+            rates[category] = min(1.0, max(0.0, float(rate)))
+        except (TypeError, ValueError):
+            continue
+    return rates
+
+
+def _period(rate: float) -> int:
+    """Keep one event in ``period`` (0 = never)."""
+    return 0 if rate <= 0 else max(1, round(1.0 / rate))
+
+
+class EventLog:
+    """Detail recorded for one sampled event."""
+
+    __slots__ = ("index", "source", "event_type", "timestamp", "categories", "records", "_keep", "_logger")
+
+    def __init__(
+        self,
+        index: int,
+        source: str,
+        event_type: str,
+        timestamp: float,
+        categories: FrozenSet[str],
+        logger: Optional[logging.Logger],
+        keep: bool,
+    ) -> None:
+        self.index = index
+        self.source = source
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.categories = categories
+        self.records: List[Tuple[str, str, Tuple[Any, ...]]] = []
+        self._logger = logger  # set only when DEBUG is enabled
+        self._keep = keep  # False when the explain buffer is off
+
+    def wants(self, category: str) -> bool:
+        return category in self.categories
+
+    def add(self, category: str, message: str, *args: Any) -> None:
+        """Record ``message % args`` under ``category`` if it is sampled for this event."""
+        if category not in self.categories:
+            return
+        if self._keep:
+            self.records.append((category, message, args))
+        if self._logger is not None:
+            self._logger.debug(message, *args, stacklevel=2)
+
+    def lines(self) -> List[str]:
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.timestamp))
+        lines = [f"#{self.index} {stamp} {self.source}/{self.event_type}"]
+        for category, message, args in self.records:
+            try:
+                text = message % args if args else message
+            except Exception as e:
+                text = f"{message} <format error: {e}>"
+            lines.append(f"  [{category}] {text}")
+        return lines
+
+
+class HotPathLog:
+    """Per-event debug detail with level checks, sampling and an explain buffer."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        capacity: int = 0,
+        sample_rates: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._logger = logger
+        self._clock = clock
+        self._counter = itertools.count(1)
+        self._buffer: Deque[EventLog] = deque(maxlen=1)
+        self.configure(capacity=capacity, sample_rates=sample_rates or DEFAULT_SAMPLE_RATES)
+
+    def configure(
+        self,
+        *,
+        capacity: Optional[int] = None,
+        sample_rates: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Resize the explain buffer (0 disables it) and/or change sample rates."""
+        if capacity is not None:
+            self.capacity = max(0, int(capacity))
+            self._buffer = deque(self._buffer if self.capacity else (), maxlen=self.capacity or 1)
+        if sample_rates is not None:
+            rates = parse_sample_rates(sample_rates)
+            self._periods = {category: _period(rate) for category, rate in rates.items()}
+
+    def begin_event(self, source: str, event_type: str) -> Optional[EventLog]:
+        """
+        Start recording detail for an event.
+
+        Returns None (the common case) when DEBUG is off and the explain
+        buffer is disabled, or when no category is sampled for this event.
+        """
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if not debug and not self.capacity:
+            return None
+        index = next(self._counter)
+        categories = frozenset(
+            category for category, period in self._periods.items() if period and index % period == 0
+        )
+        if not categories:
+            return None
+        event_log = EventLog(
+            index, source, event_type, self._clock(), categories,
+            self._logger if debug else None, bool(self.capacity),
+        )
+        if self.capacity:
+            self._buffer.append(event_log)
+        return event_log
+
+    def explain(self, count: Optional[int] = None) -> List[str]:
+        """Formatted detail for the last ``count`` buffered events, oldest first."""
+        events = list(self._buffer) if self.capacity else []
+        if count is not None:
+            events = events[-count:] if count > 0 else []
+        lines: List[str] = []
+        for event_log in events:
+            lines.extend(event_log.lines())
+        return lines
+
+    def clear(self) -> None:
+        self._buffer.clear()
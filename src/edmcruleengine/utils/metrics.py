@@ -0,0 +1,244 @@
+"""
+In-process pipeline metrics for EDMC VKB Connector.
+
+A ``MetricsRegistry`` holds named counters, gauges and latency histograms for
+the event pipeline (rules reload check, derivation, rule evaluation, action
+dispatch, VKB send, recorder write).  Histograms use fixed quarter-octave
+buckets stored in an ``array`` so recording is a bisect and an increment, and
+p50/p95/p99 are estimated from the bucket counts.
+
+Instrumented code resolves its metrics once and times a stage with::
+
+    started = self.metrics.start()
+    ...
+    self._derive_latency.observe_since(started)
+
+``start()`` returns None while the registry is disabled, so the cost of a
+disabled stage is two method calls.  Updates are not locked: the GIL keeps
+them consistent enough for diagnostics, and a rare lost increment under
+contention is accepted in exchange for a lock-free hot path.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+# Bucket upper bounds in seconds: 1 µs to ~16.8 s in quarter-octave steps
+# (each bound ~19% above the previous one), plus an overflow bucket.
+BUCKET_MIN_SECONDS = 1e-6
+BUCKETS_PER_OCTAVE = 4
+BUCKET_COUNT = 24 * BUCKETS_PER_OCTAVE + 1
+
+_BOUNDS = array("d", (BUCKET_MIN_SECONDS * 2 ** (i / BUCKETS_PER_OCTAVE) for i in range(BUCKET_COUNT)))
+
+DEFAULT_PERCENTILES = (0.50, 0.95, 0.99)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time copy of a histogram, with latencies in milliseconds."""
+    name: str
+    count: int
+    sum_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of every metric in a registry."""
+    enabled: bool
+    counters: Dict[str, int]
+    gauges: Dict[str, float]
+    histograms: Dict[str, HistogramSnapshot]
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    __slots__ = ("name", "value", "_registry")
+
+    def __init__(self, name: str, registry: "MetricsRegistry") -> None:
+        self.name = name
+        self.value = 0
+        self._registry = registry
+
+    def inc(self, amount: int = 1) -> None:
+        if self._registry.enabled:
+            self.value += amount
+
+
+class Gauge:
+    """Last reported value."""
+
+    __slots__ = ("name", "value", "_registry")
+
+    def __init__(self, name: str, registry: "MetricsRegistry") -> None:
+        self.name = name
+        self.value = 0.0
+        self._registry = registry
+
+    def set(self, value: float) -> None:
+        if self._registry.enabled:
+            self.value = value
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (values in seconds)."""
+
+    __slots__ = ("name", "count", "total", "max", "_counts", "_registry")
+
+    def __init__(self, name: str, registry: "MetricsRegistry") -> None:
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._counts = array("Q", bytes(8 * (BUCKET_COUNT + 1)))
+        self._registry = registry
+
+    def observe(self, seconds: float) -> None:
+        if not self._registry.enabled:
+            return
+        if seconds < 0:
+            seconds = 0.0
+        self._counts[bisect_left(_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def observe_since(self, started: Optional[float]) -> None:
+        """Record the time since ``started`` (a ``MetricsRegistry.start()`` value)."""
+        if started is not None:
+            self.observe(self._registry.timer() - started)
+
+    def percentile(self, fraction: float) -> float:
+        """Estimated latency in seconds below which ``fraction`` of samples fall."""
+        return _percentile(self._counts, self.count, self.max, fraction)
+
+    def reset(self) -> None:
+        self._counts = array("Q", bytes(8 * (BUCKET_COUNT + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def snapshot(self) -> HistogramSnapshot:
+        counts = self._counts[:]
+        count = sum(counts)
+        p50, p95, p99 = (_percentile(counts, count, self.max, q) * 1000.0 for q in DEFAULT_PERCENTILES)
+        return HistogramSnapshot(
+            name=self.name,
+            count=count,
+            sum_ms=self.total * 1000.0,
+            max_ms=self.max * 1000.0,
+            p50_ms=p50,
+            p95_ms=p95,
+            p99_ms=p99,
+        )
+
+
+def _percentile(counts: array, count: int, max_seconds: float, fraction: float) -> float:
+    if count <= 0:
+        return 0.0
+    rank = max(1.0, min(1.0, fraction) * count)
+    seen = 0
+    for index, bucket_count in enumerate(counts):
+        if not bucket_count:
+            continue
+        if seen + bucket_count >= rank:
+            lower = _BOUNDS[index - 1] if index > 0 else 0.0
+            upper = _BOUNDS[index] if index < BUCKET_COUNT else max_seconds
+            # Linear interpolation within the bucket, never above the observed max
+            value = lower + (upper - lower) * ((rank - seen) / bucket_count)
+            return min(value, max_seconds)
+        seen += bucket_count
+    return max_seconds
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and histograms.
+
+    Metrics are created on first request and live for the registry's
+    lifetime; callers should keep the returned objects rather than looking
+    them up per event.  ``enabled`` can be flipped at any time.
+    """
+
+    def __init__(self, *, enabled: bool = True, timer: Callable[[], float] = time.perf_counter) -> None:
+        self.enabled = enabled
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def start(self) -> Optional[float]:
+        """Timer reading for ``Histogram.observe_since``, or None when disabled."""
+        return self.timer() if self.enabled else None
+
+    def counter(self, name: str) -> Counter:
+        with self._lock:
+            metric = self._counters.get(name)
+            if metric is None:
+                metric = self._counters[name] = Counter(name, self)
+            return metric
+
+    def gauge(self, name: str) -> Gauge:
+        with self._lock:
+            metric = self._gauges.get(name)
+            if metric is None:
+                metric = self._gauges[name] = Gauge(name, self)
+            return metric
+
+    def histogram(self, name: str) -> Histogram:
+        with self._lock:
+            metric = self._histograms.get(name)
+            if metric is None:
+                metric = self._histograms[name] = Histogram(name, self)
+            return metric
+
+    def percentiles(self, name: str) -> Optional[Tuple[float, float, float]]:
+        """Return (p50, p95, p99) in milliseconds for histogram ``name``, if it exists."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            return None
+        snapshot = histogram.snapshot()
+        return snapshot.p50_ms, snapshot.p95_ms, snapshot.p99_ms
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Copy every metric; safe to read from another thread."""
+        with self._lock:
+            counters = list(self._counters.values())
+            gauges = list(self._gauges.values())
+            histograms = list(self._histograms.values())
+        return MetricsSnapshot(
+            enabled=self.enabled,
+            counters={c.name: c.value for c in counters},
+            gauges={g.name: g.value for g in gauges},
+            histograms={h.name: h.snapshot() for h in histograms},
+        )
+
+    def reset(self) -> None:
+        """Zero every metric (the metric objects stay valid)."""
+        with self._lock:
+            for counter in self._counters.values():
+                counter.value = 0
+            for gauge in self._gauges.values():
+                gauge.value = 0.0
+            for histogram in self._histograms.values():
+                histogram.reset()
+
+
+# Process-wide registry used by components that are not given one.
+METRICS = MetricsRegistry()
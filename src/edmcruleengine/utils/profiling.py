@@ -0,0 +1,304 @@
+"""
+On-demand profiling for EDMC VKB Connector.
+
+``ProfilingSession`` runs for a fixed number of seconds inside the live
+plugin and writes its results to ``<plugin_dir>/profiles`` for offline
+analysis:
+
+``profile-<stamp>.collapsed``
+    Collapsed stacks (``thread;frame;frame count``) for flamegraph.pl,
+    speedscope or https://www.speedscope.app.
+``profile-<stamp>.pstats``
+    The same samples as a ``pstats`` file (``python -m pstats``, snakeviz).
+    Call counts are sample counts and times are samples x interval.
+``profile-<stamp>.tracemalloc.txt`` / ``.tracemalloc``
+    Optional: the top allocation growth between the start and end of the
+    session, plus the final ``tracemalloc`` snapshot.
+
+``SamplingProfiler`` is a statistical sampler: a daemon thread reads
+``sys._current_frames()`` every interval and counts the stacks of threads
+that are running plugin code, so the plugin is never instrumented and the
+cost is bounded by the interval rather than by how busy the plugin is.
+Threads blocked in a wait show up as the frame that is waiting.
+"""
+
+from __future__ import annotations
+
+import marshal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .. import plugin_logger
+
+logger = plugin_logger(__name__)
+
+PROFILE_DIR_NAME = "profiles"
+DEFAULT_INTERVAL_SECONDS = 0.005
+DEFAULT_DURATION_SECONDS = 30.0
+MAX_STACK_DEPTH = 128
+TRACEMALLOC_FRAMES = 10
+TRACEMALLOC_TOP = 50
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+# (filename, first line, function name), as used by cProfile/pstats
+FunctionKey = Tuple[str, int, str]
+StackKey = Tuple[str, Tuple[FunctionKey, ...]]  # (thread name, frames root -> leaf)
+
+
+class SamplingProfiler:
+    """
+    Count the stacks of threads running code under ``roots``.
+
+    Only stacks with at least one frame from a file under ``roots`` are
+    kept (by default the ``edmcruleengine`` package), so EDMC's own threads
+    appear only while they are calling into the plugin.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        *,
+        roots: Optional[Sequence[Path | str]] = None,
+    ) -> None:
+        self.interval_seconds = max(0.001, float(interval_seconds))
+        self._roots = tuple(str(Path(root).resolve()) for root in (roots or (PACKAGE_ROOT,)))
+        self._stacks: Counter[StackKey] = Counter()
+        self._in_roots: Dict[CodeType, bool] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.sample_count = 0
+        self.started_at = 0.0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="VKBConnectorProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.elapsed_seconds = time.perf_counter() - self.started_at
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = self._stack(frame)
+                if stack is not None:
+                    self._stacks[(names.get(thread_id, str(thread_id)), stack)] += 1
+            self.sample_count += 1
+
+    def _stack(self, frame: Optional[FrameType]) -> Optional[Tuple[FunctionKey, ...]]:
+        frames: List[FunctionKey] = []
+        relevant = False
+        while frame is not None and len(frames) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            in_roots = self._in_roots.get(code)
+            if in_roots is None:
+                in_roots = self._in_roots[code] = code.co_filename.startswith(self._roots)
+            relevant = relevant or in_roots
+            frames.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        if not relevant:
+            return None
+        frames.reverse()
+        return tuple(frames)
+
+    def stacks(self) -> Dict[StackKey, int]:
+        """Sampled ``{(thread, frames root -> leaf): count}``."""
+        return dict(self._stacks)
+
+    def write_collapsed(self, path: Path) -> Path:
+        """Write ``thread;frame;...;frame count`` lines (one per distinct stack)."""
+        lines = []
+        for (thread_name, frames), count in sorted(self._stacks.items(), key=lambda item: -item[1]):
+            labels = [thread_name.replace(";", ":").replace(" ", "_")]
+            labels.extend(
+                f"{name} ({Path(filename).name}:{line})".replace(";", ":").replace(" ", "_")
+                for filename, line, name in frames
+            )
+            lines.append(f"{';'.join(labels)} {count}\n")
+        path.write_text("".join(lines), encoding="utf-8")
+        return path
+
+    def pstats_data(self) -> Dict[FunctionKey, tuple]:
+        """Samples as a ``pstats`` stats dict (calls = samples, times = samples x interval)."""
+        interval = self.interval_seconds
+        # func -> [samples on stack, samples as leaf, {caller: samples}]
+        totals: Dict[FunctionKey, list] = {}
+        for (_thread, frames), count in self._stacks.items():
+            for func in set(frames):
+                totals.setdefault(func, [0, 0, Counter()])[0] += count
+            totals[frames[-1]][1] += count
+            for caller, callee in set(zip(frames, frames[1:])):
+                totals[callee][2][caller] += count
+        stats: Dict[FunctionKey, tuple] = {}
+        for func, (inclusive, own, callers) in totals.items():
+            stats[func] = (
+                inclusive,
+                inclusive,
+                own * interval,
+                inclusive * interval,
+                {caller: (n, n, 0.0, n * interval) for caller, n in callers.items()},
+            )
+        return stats
+
+    def write_pstats(self, path: Path) -> Path:
+        """Write a file readable by ``pstats.Stats(path)``."""
+        with open(path, "wb") as f:
+            marshal.dump(self.pstats_data(), f)
+        return path
+
+
+class MemoryProfiler:
+    """``tracemalloc`` snapshots at start and stop, with the growth between them."""
+
+    def __init__(self, *, frames: int = TRACEMALLOC_FRAMES, top: int = TRACEMALLOC_TOP) -> None:
+        self.frames = frames
+        self.top = top
+        self._started_tracing = False
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        if self._baseline is None:
+            return
+        self.snapshot = tracemalloc.take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def diff(self) -> List[tracemalloc.StatisticDiff]:
+        if self._baseline is None or self.snapshot is None:
+            return []
+        return self.snapshot.compare_to(self._baseline, "lineno")
+
+    def write(self, report_path: Path, snapshot_path: Path) -> List[Path]:
+        if self.snapshot is None:
+            return []
+        current = sum(stat.size for stat in self.snapshot.statistics("filename"))
+        lines = [f"Traced memory at end: {current / 1024:.1f} KiB", f"Top {self.top} changes since start:", ""]
+        lines.extend(str(stat) for stat in self.diff()[: self.top])
+        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self.snapshot.dump(str(snapshot_path))
+        return [report_path, snapshot_path]
+
+
+@dataclass
+class ProfileResult:
+    """Files written by a finished session."""
+    paths: List[Path] = field(default_factory=list)
+    samples: int = 0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class ProfilingSession:
+    """
+    Sample the plugin (and optionally trace allocations) for ``duration_seconds``.
+
+    ``start()`` returns immediately; results are written by a background
+    thread when the time is up (or on ``stop()``), then ``on_finished`` is
+    called with the ``ProfileResult``.
+    """
+
+    def __init__(
+        self,
+        plugin_dir: Path | str,
+        *,
+        duration_seconds: float = DEFAULT_DURATION_SECONDS,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        memory: bool = False,
+        roots: Optional[Sequence[Path | str]] = None,
+        on_finished: Optional[Callable[[ProfileResult], None]] = None,
+    ) -> None:
+        self.output_dir = Path(plugin_dir) / PROFILE_DIR_NAME
+        self.duration_seconds = max(0.0, float(duration_seconds))
+        self.sampler = SamplingProfiler(interval_seconds, roots=roots)
+        self.memory = MemoryProfiler() if memory else None
+        self._on_finished = on_finished
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.result: Optional[ProfileResult] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        if self.memory is not None:
+            self.memory.start()
+        self.sampler.start()
+        self._thread = threading.Thread(target=self._run, name="VKBConnectorProfileSession", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Profiling for {self.duration_seconds:g}s "
+            f"(interval {self.sampler.interval_seconds * 1000:g} ms, tracemalloc {'on' if self.memory else 'off'})"
+        )
+
+    def stop(self) -> None:
+        """End the session early; results are still written."""
+        self._stop.set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[ProfileResult]:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.result
+
+    def _run(self) -> None:
+        self._stop.wait(self.duration_seconds)
+        self.sampler.stop()
+        if self.memory is not None:
+            self.memory.stop()
+        result = ProfileResult(samples=self.sampler.sample_count, elapsed_seconds=self.sampler.elapsed_seconds)
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            base = self.output_dir / time.strftime("profile-%Y%m%d-%H%M%S")
+            result.paths.append(self.sampler.write_collapsed(base.with_suffix(".collapsed")))
+            result.paths.append(self.sampler.write_pstats(base.with_suffix(".pstats")))
+            if self.memory is not None:
+                result.paths.extend(
+                    self.memory.write(base.with_suffix(".tracemalloc.txt"), base.with_suffix(".tracemalloc"))
+                )
+            logger.info(
+                f"Profile written ({result.samples} samples over {result.elapsed_seconds:.1f}s): "
+                f"{', '.join(path.name for path in result.paths)}"
+            )
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"Failed to write profile: {e}", exc_info=True)
+        self.result = result
+        if self._on_finished is not None:
+            try:
+                self._on_finished(result)
+            except Exception as e:
+                logger.error(f"Error in profiling completion callback: {e}", exc_info=True)
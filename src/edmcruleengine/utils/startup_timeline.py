@@ -0,0 +1,118 @@
+"""
+Startup timeline for EDMC VKB Connector.
+
+Records the duration of each plugin startup stage (config, catalog load,
+rules compile, VKB-Link process discovery, INI resolution, connect) so
+cold-start time can be measured.  Stages may run on different threads; each
+stage is stamped with the thread that executed it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class StartupStage:
+    """A single completed startup stage."""
+    name: str
+    thread: str
+    start_seconds: float  # offset from timeline origin
+    duration_seconds: float
+    ok: bool = True
+
+    @property
+    def end_seconds(self) -> float:
+        return self.start_seconds + self.duration_seconds
+
+
+class StartupTimeline:
+    """
+    Thread-safe recorder of startup stage durations.
+
+    Startup is split into independent branches (e.g. the EDMC main thread and
+    the VKB-Link startup thread).  Each branch calls ``mark_branch_done`` when
+    finished; the call that completes the last branch returns True so the
+    caller can emit the summary exactly once.
+    """
+
+    def __init__(
+        self,
+        branches: Iterable[str] = ("main",),
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._stages: list[StartupStage] = []
+        self._pending_branches: set[str] = set(branches)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a named stage (recorded even on error)."""
+        start = self._clock()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(name, start, self._clock(), ok=ok)
+
+    def record(self, name: str, start: float, end: float, *, ok: bool = True) -> None:
+        """Record a stage from raw clock readings."""
+        stage = StartupStage(
+            name=name,
+            thread=threading.current_thread().name,
+            start_seconds=max(0.0, start - self._origin),
+            duration_seconds=max(0.0, end - start),
+            ok=ok,
+        )
+        with self._lock:
+            self._stages.append(stage)
+
+    def mark_branch_done(self, branch: str) -> bool:
+        """Mark a startup branch complete. Returns True when all branches are done."""
+        with self._lock:
+            if branch not in self._pending_branches:
+                return False
+            self._pending_branches.discard(branch)
+            return not self._pending_branches
+
+    @property
+    def complete(self) -> bool:
+        with self._lock:
+            return not self._pending_branches
+
+    def stages(self) -> list[StartupStage]:
+        """Return recorded stages ordered by start offset."""
+        with self._lock:
+            return sorted(self._stages, key=lambda s: s.start_seconds)
+
+    def get_stage(self, name: str) -> Optional[StartupStage]:
+        for stage in self.stages():
+            if stage.name == name:
+                return stage
+        return None
+
+    def total_seconds(self) -> float:
+        """Wall-clock span from the timeline origin to the end of the last stage."""
+        stages = self.stages()
+        if not stages:
+            return 0.0
+        return max(s.end_seconds for s in stages)
+
+    def format_summary(self) -> str:
+        """Return a single-line human readable summary for the log."""
+        parts = []
+        for stage in self.stages():
+            marker = "" if stage.ok else " FAILED"
+            parts.append(
+                f"{stage.name}={stage.duration_seconds * 1000:.1f}ms"
+                f"@+{stage.start_seconds * 1000:.0f}ms[{stage.thread}]{marker}"
+            )
+        return f"total={self.total_seconds() * 1000:.1f}ms " + " ".join(parts)
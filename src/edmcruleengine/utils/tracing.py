@@ -0,0 +1,151 @@
+"""
+Opt-in span tracer with Chrome Trace Event export.
+
+``SpanTracer`` records begin/end spans for each event as it moves through the
+pipeline (``handle_event`` -> rules reload check -> derivation -> each rule ->
+endpoint actions -> socket send) into a fixed-size ring buffer, keeping only
+the most recent ``capacity`` spans.  ``to_chrome_trace()`` / ``dump()`` write
+the buffer as Chrome Trace Event JSON, which ``chrome://tracing`` and
+https://ui.perfetto.dev show as a timeline per thread.
+
+Instrumented code follows the same pattern as the metrics registry::
+
+    started = self.tracer.begin()
+    ...
+    self.tracer.end("rules.derive", started, args={"event": event_type})
+
+``begin()`` returns None while tracing is off, so a disabled span costs one
+attribute check and two method calls.  Recording takes no lock: slots are
+claimed from an ``itertools.count`` (atomic under the GIL) and each slot is
+replaced with a single tuple assignment.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_CAPACITY = 20000
+TRACE_DIR_NAME = "traces"
+
+# (name, category, start_seconds, end_seconds, thread_id, args)
+_Span = Tuple[str, str, float, float, int, Optional[Dict[str, Any]]]
+
+
+class SpanTracer:
+    """Ring buffer of completed spans, exportable as Chrome Trace Event JSON."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        *,
+        enabled: bool = False,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.enabled = enabled
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._thread_names: Dict[int, str] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self._buffer: List[Optional[_Span]] = [None] * self.capacity
+        self._slots = itertools.count()
+
+    def configure(self, *, enabled: Optional[bool] = None, capacity: Optional[int] = None) -> None:
+        """Switch tracing on/off or resize the buffer (resizing drops recorded spans)."""
+        with self._lock:
+            if capacity is not None and max(1, int(capacity)) != self.capacity:
+                self._allocate(capacity)
+            if enabled is not None:
+                self.enabled = enabled
+
+    def begin(self) -> Optional[float]:
+        """Span start time for ``end``, or None when tracing is off."""
+        return self.timer() if self.enabled else None
+
+    def end(
+        self,
+        name: str,
+        started: Optional[float],
+        category: str = "pipeline",
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a span that began at ``started`` (a ``begin()`` value) and ends now."""
+        if started is None:
+            return
+        ended = self.timer()
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        buffer = self._buffer  # stays consistent if configure() swaps it meanwhile
+        buffer[next(self._slots) % len(buffer)] = (name, category, started, ended, thread_id, args)
+
+    @contextmanager
+    def span(self, name: str, category: str = "pipeline", args: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+        """Context manager form of ``begin``/``end`` for code off the hot path."""
+        started = self.begin()
+        try:
+            yield
+        finally:
+            self.end(name, started, category, args)
+
+    def spans(self) -> List[_Span]:
+        """Recorded spans, oldest first."""
+        with self._lock:
+            recorded = [span for span in list(self._buffer) if span is not None]
+        recorded.sort(key=lambda span: span[2])
+        return recorded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._allocate(self.capacity)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the buffer as a Chrome Trace Event JSON object."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "EDMC VKB Connector"}},
+        ]
+        for thread_id, thread_name in list(self._thread_names.items()):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+        for name, category, started, ended, thread_id, args in self.spans():
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": started * 1e6,
+                "dur": max(0.0, ended - started) * 1e6,
+                "pid": pid,
+                "tid": thread_id,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: Path) -> Path:
+        """Write the Chrome trace to ``path`` atomically and return it."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        os.replace(tmp_path, path)
+        return path
+
+
+def trace_file_path(plugin_dir: Path | str) -> Path:
+    """Timestamped trace file under ``<plugin_dir>/traces``."""
+    return Path(plugin_dir) / TRACE_DIR_NAME / time.strftime("trace-%Y%m%d-%H%M%S.json")
+
+
+# Process-wide tracer used by components that are not given one.
+TRACER = SpanTracer()
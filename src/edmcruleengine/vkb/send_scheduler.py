@@ -0,0 +1,196 @@
+"""
+Outbound shift-state send scheduling for VKB-Link.
+
+Signals that oscillate (GUI focus changes, Flags toggling while docking) can
+produce bursts of bitmaps that are superseded milliseconds later.  The
+scheduler enforces a minimum interval between packets, always flushes the
+final state on the trailing edge, and can require a changed bit to hold its
+new value for a hysteresis period before it is sent.  Superseded states are
+counted as suppressed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from .. import plugin_logger
+
+logger = plugin_logger(__name__)
+
+# Combined state layout: subshift in bits 0-7, shift in bits 8-9.
+_SHIFT_OFFSET = 8
+
+
+def _combine(shift: int, subshift: int) -> int:
+    return (shift << _SHIFT_OFFSET) | subshift
+
+
+def _split(state: int) -> tuple[int, int]:
+    return state >> _SHIFT_OFFSET, state & ((1 << _SHIFT_OFFSET) - 1)
+
+
+@dataclass(frozen=True)
+class SendStats:
+    """Counters for outbound shift-state packets."""
+    sent: int
+    suppressed: int
+    pending: bool
+
+
+class ShiftSendScheduler:
+    """
+    Rate-limits and debounces shift-state sends.
+
+    ``transmit(shift, subshift)`` performs the actual send and must call
+    ``record_sent`` on success (the manager does this for every send,
+    including forced resends that bypass the scheduler).  With both the
+    interval and hysteresis at zero the scheduler transmits synchronously.
+    """
+
+    def __init__(
+        self,
+        transmit: Callable[[int, int], bool],
+        *,
+        min_interval_seconds: float = 0.0,
+        hysteresis_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._transmit = transmit
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._min_interval = 0.0
+        self._hysteresis = 0.0
+        self.configure(min_interval_seconds=min_interval_seconds, hysteresis_seconds=hysteresis_seconds)
+
+        self._desired: Optional[int] = None
+        self._sent: Optional[int] = None
+        self._last_send_time: Optional[float] = None
+        self._bit_changed_at: Dict[int, float] = {}
+        self._unsent_request = False
+        self._timer: Optional[threading.Timer] = None
+
+        self._sent_count = 0
+        self._suppressed_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._min_interval > 0 or self._hysteresis > 0
+
+    def configure(self, *, min_interval_seconds: float, hysteresis_seconds: float) -> None:
+        with self._lock:
+            self._min_interval = max(0.0, float(min_interval_seconds))
+            self._hysteresis = max(0.0, float(hysteresis_seconds))
+
+    def submit(self, shift: int, subshift: int) -> bool:
+        """
+        Request that ``(shift, subshift)`` becomes the device state.
+
+        Returns False only if an immediate transmit was attempted and failed.
+        """
+        with self._lock:
+            desired = _combine(shift, subshift)
+            if desired == self._desired and not self._unsent_request:
+                return True
+            if self._unsent_request and desired != self._desired:
+                # The previous request never reached the device.
+                self._suppressed_count += 1
+            self._desired = desired
+            self._unsent_request = desired != self._sent
+
+            now = self._clock()
+            changed = desired ^ (self._sent or 0) if self._sent is not None else 0
+            for bit in list(self._bit_changed_at):
+                if not changed & (1 << bit):
+                    del self._bit_changed_at[bit]
+            bit = 0
+            while changed >> bit:
+                if changed & (1 << bit):
+                    self._bit_changed_at.setdefault(bit, now)
+                bit += 1
+            return self._evaluate(now)
+
+    def record_sent(self, shift: int, subshift: int) -> None:
+        """Record a successful transmit (scheduled or forced)."""
+        with self._lock:
+            state = _combine(shift, subshift)
+            self._sent = state
+            self._last_send_time = self._clock()
+            self._sent_count += 1
+            if self._desired is None or not self.enabled:
+                self._desired = state
+            changed = self._desired ^ state
+            self._bit_changed_at = {
+                bit: since for bit, since in self._bit_changed_at.items() if changed & (1 << bit)
+            }
+            self._unsent_request = self._desired != state
+
+    def cancel(self) -> None:
+        """Drop any scheduled flush (a forced send is about to supersede it)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._unsent_request:
+                self._suppressed_count += 1
+            self._unsent_request = False
+            self._desired = None
+            self._bit_changed_at.clear()
+
+    def stats(self) -> SendStats:
+        with self._lock:
+            return SendStats(
+                sent=self._sent_count,
+                suppressed=self._suppressed_count,
+                pending=self._timer is not None,
+            )
+
+    def _evaluate(self, now: float) -> bool:
+        """Transmit what is eligible now and schedule the next flush. Lock must be held."""
+        if self._desired is None:
+            return True
+        if self._sent is None:
+            stable_state = self._desired
+            waiting_until = None
+        else:
+            stable_mask = 0
+            waiting_until = None
+            for bit, since in self._bit_changed_at.items():
+                ready_at = since + self._hysteresis
+                if ready_at <= now:
+                    stable_mask |= 1 << bit
+                elif waiting_until is None or ready_at < waiting_until:
+                    waiting_until = ready_at
+            stable_state = self._sent ^ stable_mask
+
+        ok = True
+        if stable_state != self._sent:
+            earliest = (self._last_send_time or 0.0) + self._min_interval
+            if self._last_send_time is None or now >= earliest:
+                ok = self._transmit(*_split(stable_state))
+            else:
+                waiting_until = earliest if waiting_until is None else min(waiting_until, earliest)
+
+        if waiting_until is not None and ok:
+            self._schedule(max(0.0, waiting_until - now))
+        elif waiting_until is None and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return ok
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._timer = None
+            try:
+                self._evaluate(self._clock())
+            except Exception as e:
+                logger.error(f"Error flushing scheduled VKB shift state: {e}", exc_info=True)
@@ -4,13 +4,21 @@ TCP/IP socket client for VKB-Link communication.
 Uses the current VKB-Link `VKBShiftBitmap` message format by default.
 Socket lifecycle management is intentionally driven by process workflow in
 EventHandler/VKBLinkManager, not by aggressive socket retry loops.
+
+While connected, a lightweight watcher thread selects on the socket for
+readability so that EOF/RST from VKB-Link is noticed immediately rather than
+on the next failed send.  TCP keepalive covers peers that vanish silently.
 """
 
+import selectors
 import socket
+import sys
 import threading
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from .. import plugin_logger
+from ..utils.metrics import METRICS, MetricsRegistry
+from ..utils.tracing import TRACER, SpanTracer
 
 if TYPE_CHECKING:
     from .message_formatter import MessageFormatter
@@ -26,6 +34,10 @@ class VKBClient:
     """
 
     DEFAULT_SOCKET_TIMEOUT = 5  # seconds
+    WATCH_INTERVAL_SECONDS = 0.5  # selector wake-up to notice local disconnects
+    KEEPALIVE_IDLE_SECONDS = 10
+    KEEPALIVE_INTERVAL_SECONDS = 5
+    KEEPALIVE_PROBE_COUNT = 3
 
     def __init__(
         self,
@@ -37,6 +49,9 @@ class VKBClient:
         command_byte: int = 13,
         socket_timeout: int = DEFAULT_SOCKET_TIMEOUT,
         on_connected: Optional[callable] = None,
+        on_disconnected: Optional[callable] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[SpanTracer] = None,
     ):
         """
         Initialize VKB client.
@@ -50,6 +65,11 @@ class VKBClient:
             command_byte: VKB protocol command byte (default: 13)
             socket_timeout: Socket timeout in seconds (default: 5)
             on_connected: Optional callback function to invoke after successful connection
+            on_disconnected: Optional callback invoked with a reason string when
+                             the socket watcher detects that the peer went away
+            metrics: Registry for send latency and errors (defaults to the
+                     process-wide one)
+            tracer: Span tracer for socket sends (defaults to the process-wide one)
         """
         self.host = host
         self.port = port
@@ -58,6 +78,9 @@ class VKBClient:
 
         # Connection callback for resending state after reconnection
         self._on_connected_callback = on_connected
+        # Peer-loss callback, invoked from the socket watcher thread
+        self._on_disconnected_callback = on_disconnected
+        self._watch_stop: Optional[threading.Event] = None
         # Terminal error: if set, stop all reconnection attempts
         self._terminal_error = False
         self._terminal_error_message = ""
@@ -75,6 +98,11 @@ class VKBClient:
 
         self._send_lock = threading.Lock()
 
+        self.metrics = metrics or METRICS
+        self._send_latency = self.metrics.histogram("vkb.send_event")
+        self._send_errors = self.metrics.counter("vkb.send_errors")
+        self.tracer = tracer or TRACER
+
     def connect(self) -> bool:
         """
         Establish connection to VKB hardware.
@@ -92,8 +120,10 @@ class VKBClient:
 
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.settimeout(self.SOCKET_TIMEOUT)
+                self._configure_socket(self.socket)
                 self.socket.connect((self.host, self.port))
                 self.connected = True
+                self._start_watcher(self.socket)
                 logger.info(f"Connected to VKB device at {self.host}:{self.port}")
 
                 # Store that we should invoke callback (after releasing lock)
@@ -125,8 +155,108 @@ class VKBClient:
         """
         self._on_connected_callback = callback
 
+    def set_on_disconnected(self, callback: Optional[callable]) -> None:
+        """
+        Set or update the callback invoked when the peer closes or resets the socket.
+
+        The callback receives a short reason string and runs on the watcher
+        thread, outside the connection lock.  It is not invoked for local
+        disconnects.
+
+        Args:
+            callback: Callable taking a reason string, or None to remove callback.
+        """
+        self._on_disconnected_callback = callback
+
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """Enable TCP_NODELAY and keepalive (with platform-specific tuning where available)."""
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as e:
+            logger.debug(f"Unable to set VKB socket options: {e}")
+            return
+
+        try:
+            if sys.platform == "win32" and hasattr(socket, "SIO_KEEPALIVE_VALS"):
+                sock.ioctl(
+                    socket.SIO_KEEPALIVE_VALS,
+                    (1, self.KEEPALIVE_IDLE_SECONDS * 1000, self.KEEPALIVE_INTERVAL_SECONDS * 1000),
+                )
+                return
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEPALIVE_IDLE_SECONDS)
+            elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS name for the idle time
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.KEEPALIVE_IDLE_SECONDS)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.KEEPALIVE_INTERVAL_SECONDS)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.KEEPALIVE_PROBE_COUNT)
+        except OSError as e:
+            logger.debug(f"Unable to tune VKB socket keepalive: {e}")
+
+    def _start_watcher(self, sock: socket.socket) -> None:
+        """Start the read-side watcher for ``sock``. Must be called with _send_lock held."""
+        stop = threading.Event()
+        self._watch_stop = stop
+        threading.Thread(
+            target=self._watch_socket,
+            args=(sock, stop),
+            name="VKBSocketWatcher",
+            daemon=True,
+        ).start()
+
+    def _watch_socket(self, sock: socket.socket, stop: threading.Event) -> None:
+        """
+        Detect peer EOF/RST on ``sock`` without waiting for the next send.
+
+        VKB-Link may write acknowledgements; those are drained and discarded.
+        The watcher exits silently once the socket is replaced or closed locally.
+        """
+        reason = None
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(sock, selectors.EVENT_READ)
+                while not stop.is_set():
+                    if not selector.select(self.WATCH_INTERVAL_SECONDS):
+                        continue
+                    if stop.is_set():
+                        return
+                    try:
+                        data = sock.recv(4096)
+                    except (socket.timeout, BlockingIOError, InterruptedError):
+                        continue
+                    if not data:
+                        reason = "peer_closed"
+                        break
+        except (ConnectionResetError, ConnectionAbortedError):
+            reason = "connection_reset"
+        except (OSError, ValueError) as e:
+            if stop.is_set():
+                return
+            reason = f"socket_error: {e}"
+
+        if reason is None:
+            return
+        with self._send_lock:
+            if self.socket is not sock or stop.is_set():
+                return
+            self._close_socket()
+            self.connected = False
+        logger.warning(f"VKB-Link connection lost ({reason})")
+
+        callback = self._on_disconnected_callback
+        if callback:
+            try:
+                callback(reason)
+            except Exception as e:
+                logger.error(f"Error in on_disconnected callback: {e}", exc_info=True)
+
     def _close_socket(self) -> None:
         """Close socket without locking. Must be called with _send_lock held."""
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
         if self.socket:
             try:
                 self.socket.close()
@@ -162,21 +292,39 @@ class VKBClient:
                 logger.debug("Cannot send event: not connected to VKB-Link")
                 return False
 
+            # Timed in finally so a send that stalls until the socket timeout
+            # and then fails still shows up as a latency sample and a span.
+            started = self.metrics.start()
+            trace_started = self.tracer.begin()
+            message_size = 0
+            error: Optional[str] = None
             try:
                 # Format the event using the message formatter
                 message_bytes = self.message_formatter.format_event(event_type, event_data)
+                message_size = len(message_bytes)
 
                 self.socket.sendall(message_bytes)
                 return True
             except (socket.error, socket.timeout, OSError, BrokenPipeError, TimeoutError) as e:
+                error = str(e) or type(e).__name__
                 logger.warning(f"Failed to send event (connection lost): {e}")
+                self._send_errors.inc()
                 self.connected = False
                 self._close_socket()
 
                 return False
             except Exception as e:
+                error = str(e) or type(e).__name__
                 logger.error(f"Error formatting or sending event: {e}")
+                self._send_errors.inc()
                 return False
+            finally:
+                self._send_latency.observe_since(started)
+                if trace_started is not None:
+                    args: Dict[str, Any] = {"bytes": message_size}
+                    if error is not None:
+                        args["error"] = error
+                    self.tracer.end("vkb.sendall", trace_started, "io", args=args)
 
     def is_connected(self) -> bool:
         """Check if currently connected to VKB-Link."""
@@ -4,31 +4,33 @@ VKB-Link lifecycle management (process control, INI sync, download/update).
 
 from __future__ import annotations
 
-import base64
 import csv
+import errno
 import io
 import json
 import re
+import selectors
 import shutil
 import socket
 import subprocess
 import sys
-import tempfile
 import threading
 import time
-import zipfile
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, TYPE_CHECKING
-from urllib.request import Request, urlopen
+from typing import Any, Callable, Optional, TypeVar, TYPE_CHECKING
 
 from .. import plugin_logger
-from ..utils.downloaders import DownloadItem, Downloader
-from ..utils.mega_downloader import MegaDownloader
+from ..utils.clock import SYSTEM_CLOCK, Clock
+from ..utils.metrics import METRICS, MetricsRegistry
 from ..events.endpoint import Endpoint
+from .send_scheduler import SendStats, ShiftSendScheduler
 
 if TYPE_CHECKING:
+    from ..utils.downloaders import DownloadItem, Downloader
     from ..rules.rules_engine import MatchResult
+    from ..utils.startup_timeline import StartupTimeline
     from .vkb_client import VKBClient
 
 logger = plugin_logger(__name__)
@@ -46,6 +48,15 @@ VKB_LINK_VERSION_RE = re.compile(r"VKB[- ]?Link\s*v?(\d+(?:\.\d+)+)", re.IGNOREC
 
 VKB_LINK_MANUAL_MODE_STATUS = "VKB needs to be downloaded and run manually"
 
+# connect_ex() results meaning "connection attempt still in flight".
+# 10035 is WSAEWOULDBLOCK, which Windows returns for non-blocking connects.
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}
+
+# First sleep used by backoff polling loops before growing to the configured poll interval.
+_POLL_INITIAL_INTERVAL_SECONDS = 0.01
+
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class VKBLinkProcessInfo:
@@ -97,6 +108,72 @@ def _is_path_within(path: Path, root: Path) -> bool:
         return False
 
 
+def _probe_listener(host: str, port: int, *, timeout: float) -> bool:
+    """
+    Probe a TCP listener with a non-blocking connect.
+
+    Returns True the instant the connection is accepted (writability with no
+    pending SO_ERROR), False if it is refused or does not complete within
+    ``timeout`` seconds.  The probe socket is closed immediately.
+    """
+    try:
+        addresses = socket.getaddrinfo(host, int(port), type=socket.SOCK_STREAM)
+    except (OSError, ValueError):
+        return False
+
+    for family, socktype, proto, _canonname, address in addresses:
+        try:
+            probe = socket.socket(family, socktype, proto)
+        except OSError:
+            continue
+        try:
+            probe.setblocking(False)
+            result = probe.connect_ex(address)
+            if result == 0:
+                return True
+            if result not in _CONNECT_IN_PROGRESS:
+                continue
+            with selectors.DefaultSelector() as selector:
+                selector.register(probe, selectors.EVENT_WRITE)
+                if not selector.select(max(0.0, timeout)):
+                    continue
+            if probe.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                return True
+        except OSError:
+            continue
+        finally:
+            probe.close()
+    return False
+
+
+def _poll_until(
+    check: Callable[[], _T],
+    *,
+    timeout: float,
+    max_interval: float,
+    initial_interval: float = _POLL_INITIAL_INTERVAL_SECONDS,
+    clock: Clock = SYSTEM_CLOCK,
+) -> _T:
+    """
+    Call ``check`` until it returns a truthy value or ``timeout`` elapses.
+
+    Sleeps between attempts start at ``initial_interval`` and double up to
+    ``max_interval``, so fast transitions are observed almost immediately
+    while slow ones do not spin.  Returns the last value produced by ``check``.
+    """
+    deadline = clock.monotonic() + max(0.0, timeout)
+    interval = min(initial_interval, max_interval)
+    while True:
+        result = check()
+        if result:
+            return result
+        remaining = deadline - clock.monotonic()
+        if remaining <= 0:
+            return result
+        clock.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+
+
 def _format_status(status: "VKBLinkStatus") -> str:
     return (
         "running="
@@ -319,6 +396,8 @@ def _popen_subprocess(*args, **kwargs):
 
 def _mega_b64(s: str) -> bytes:
     """Decode MEGA's base64url (no padding, - and _ instead of + and /)."""
+    import base64
+
     s = s.replace("-", "+").replace("_", "/")
     s += "=" * ((-len(s)) % 4)
     return base64.b64decode(s)
@@ -420,6 +499,8 @@ def _mega_decrypt_attr(enc_attr_b64: str, attr_key16: bytes) -> str:
 
 def _mega_api_post(payload: list, *, n: str = "") -> object:
     """POST to MEGA API and return parsed JSON response."""
+    from urllib.request import Request, urlopen
+
     url = MEGA_API_URL + "?id=1" + (f"&n={n}" if n else "")
     body = json.dumps(payload).encode()
     req = Request(url, data=body, headers=MEGA_API_HEADERS)
@@ -472,7 +553,14 @@ class VKBLinkManager(Endpoint):
     """Manage VKB-Link process, configuration INI, and update/download flow."""
 
     @classmethod
-    def from_config(cls, config, plugin_dir: Path) -> "VKBLinkManager":
+    def from_config(
+        cls,
+        config,
+        plugin_dir: Path,
+        *,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> "VKBLinkManager":
         """
         Create a fully-initialized VKBLinkManager from a config object.
 
@@ -486,17 +574,26 @@ class VKBLinkManager(Endpoint):
             header_byte=config.get("vkb_header_byte", 0xA5),
             command_byte=config.get("vkb_command_byte", 13),
             socket_timeout=config.get("socket_timeout", 5),
+            metrics=metrics,
         )
-        return cls(config, plugin_dir, client=client)
+        return cls(config, plugin_dir, client=client, clock=clock, metrics=metrics)
 
     def __init__(
         self,
         config,
         plugin_dir: Path,
         downloader: Optional[Downloader] = None,
-        client: Optional["VKBClient"] = None
+        client: Optional["VKBClient"] = None,
+        clock: Optional[Clock] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ) -> None:
         self.config = config
+        self._clock = clock or SYSTEM_CLOCK
+        self.metrics = metrics or METRICS
+        self._shift_send_latency = self.metrics.histogram("vkb.shift_send")
+        self._shift_sent = self.metrics.counter("vkb.shift_sent")
+        self._shift_failed = self.metrics.counter("vkb.shift_failed")
+        self._reconnects = self.metrics.counter("vkb.reconnects")
         self.plugin_dir = Path(plugin_dir)
         self.managed_dir = self.plugin_dir / "vkb-link"
         self.client = client
@@ -522,26 +619,48 @@ class VKBLinkManager(Endpoint):
         # Lifecycle ownership: True when this manager started the VKB-Link process
         self._started_by_manager = False
 
+        # React to peer loss as soon as the client's socket watcher sees it
+        if self.client is not None:
+            self.client.set_on_disconnected(self._on_socket_lost)
+
         # VKB Shift State
         self._shift_bitmap = 0
         self._subshift_bitmap = 0
         self._last_sent_shift = None
         self._last_sent_subshift = None
+        self._send_scheduler = ShiftSendScheduler(self._transmit_shift_state, clock=self._clock.monotonic)
+        self._configure_send_scheduler()
+        # While startup() is connecting, state changes are only applied to the
+        # bitmaps; _on_socket_connected sends them (see defer_sends_until_connected).
+        self._defer_sends = False
+        self._deferred_send = False
+        subscribe = getattr(config, "subscribe", None)
+        if callable(subscribe):
+            subscribe(self._on_config_changed)
+
+        # Default MEGA downloader is created on first use (see ``downloader``)
+        # so download/crypto code is not imported at EDMC startup.
+        self._downloader = downloader
 
-        # Folder constants for default downloader
-        MEGA_FOLDER_NODE = "980CgDDL"
-        MEGA_FOLDER_KEY_B64 = "AuSb0tItSbEQCmIIcA8U7w"
-
-        # Initialize default downloader if none provided
-        if downloader is None:
-            self.downloader = MegaDownloader(
+    @property
+    def downloader(self) -> "Downloader":
+        if self._downloader is None:
+            from ..utils.mega_downloader import MegaDownloader
+
+            # Folder constants for default downloader
+            MEGA_FOLDER_NODE = "980CgDDL"
+            MEGA_FOLDER_KEY_B64 = "AuSb0tItSbEQCmIIcA8U7w"
+            self._downloader = MegaDownloader(
                 folder_node=MEGA_FOLDER_NODE,
                 folder_key_b64=MEGA_FOLDER_KEY_B64,
-                config=config,
+                config=self.config,
                 logger=logger
             )
-        else:
-            self.downloader = downloader
+        return self._downloader
+
+    @downloader.setter
+    def downloader(self, downloader: "Downloader") -> None:
+        self._downloader = downloader
 
     def _cfg_int(self, key: str, default: int, *, minimum: int = 0) -> int:
         value = default
@@ -648,14 +767,18 @@ class VKBLinkManager(Endpoint):
             minimum_seconds=0.01,
             legacy_ms_key="vkb_link_poll_interval_ms",
         )
-        deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
-            try:
-                with socket.create_connection((host, int(port)), timeout=0.5):
-                    logger.info(f"VKB-Link listener is ready at {host}:{port}")
-                    return True
-            except OSError:
-                time.sleep(poll_interval)
+        deadline = self._clock.monotonic() + timeout_seconds
+
+        def _attempt() -> bool:
+            # Each probe may wait for the remainder of the deadline: a pending
+            # connect completes the moment VKB-Link accepts.  Backoff only
+            # applies after an immediate refusal (listener not bound yet).
+            remaining = max(0.0, deadline - self._clock.monotonic())
+            return _probe_listener(host, int(port), timeout=remaining)
+
+        if _poll_until(_attempt, timeout=timeout_seconds, max_interval=poll_interval, clock=self._clock):
+            logger.info(f"VKB-Link listener is ready at {host}:{port}")
+            return True
         logger.warning(
             "Timed out waiting for VKB-Link listener readiness at "
             f"{host}:{port} (timeout={timeout_seconds:.1f}s)"
@@ -722,7 +845,11 @@ class VKBLinkManager(Endpoint):
     # Plugin lifecycle helpers — called by load.py
     # ------------------------------------------------------------------
 
-    def startup(self, stop_event: Optional[threading.Event] = None) -> bool:
+    def startup(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        timeline: Optional["StartupTimeline"] = None,
+    ) -> bool:
         """
         Perform the full plugin startup sequence.
 
@@ -730,9 +857,13 @@ class VKBLinkManager(Endpoint):
         the TCP socket connection.  Designed to run in a background daemon
         thread so it never blocks the EDMC UI.
 
+        Process discovery and INI resolution are independent of each other and
+        run concurrently; each stage is recorded on ``timeline`` if provided.
+
         Args:
             stop_event: Optional event that signals the caller is shutting
                         down.  Checked before each blocking step.
+            timeline: Optional startup timeline receiving per-stage durations.
 
         Returns:
             True if the socket connection was established, False otherwise.
@@ -740,6 +871,9 @@ class VKBLinkManager(Endpoint):
         def _cancelled() -> bool:
             return stop_event is not None and stop_event.is_set()
 
+        def _stage(name: str):
+            return timeline.stage(name) if timeline is not None else nullcontext()
+
         try:
             if _cancelled():
                 return False
@@ -748,7 +882,18 @@ class VKBLinkManager(Endpoint):
                 return False
 
             auto_manage = self.config.get("vkb_link_auto_manage", True)
-            status = self.get_status(check_running=True)
+            # INI resolution walks the install directories on a helper thread
+            # while process discovery runs here; neither depends on the other.
+            ini_thread = threading.Thread(
+                target=self._prefetch_ini_resolution_stage,
+                args=(_stage,),
+                name="VKB-LinkIniResolve",
+                daemon=True,
+            )
+            ini_thread.start()
+            with _stage("process_discovery"):
+                status = self.get_status(check_running=True)
+            ini_thread.join()
             logger.info(
                 "VKB-Link startup: "
                 f"running={status.running} exe_path={status.exe_path or 'none'} "
@@ -764,7 +909,8 @@ class VKBLinkManager(Endpoint):
                 if _cancelled():
                     return False
                 logger.info("VKB-Link startup: not running; starting now")
-                result = self.ensure_running(reason="startup")
+                with _stage("ensure_running"):
+                    result = self.ensure_running(reason="startup")
                 logger.info(f"VKB-Link startup: ensure_running result: {result.message}")
                 if result.success and result.action_taken in ("started", "restarted"):
                     self._started_by_manager = True
@@ -773,7 +919,8 @@ class VKBLinkManager(Endpoint):
                 return False
 
             self.set_connection_status_override("Connecting to VKB-Link...")
-            connected = self.connect()
+            with _stage("vkb_connect"):
+                connected = self.connect()
             if connected:
                 logger.info("VKB-Link startup: connected successfully")
             else:
@@ -784,6 +931,45 @@ class VKBLinkManager(Endpoint):
             return False
         finally:
             self.set_connection_status_override(None)
+            self._end_deferred_sends(retry=not _cancelled())
+
+    def defer_sends_until_connected(self) -> None:
+        """
+        Hold shift-state sends until ``startup()`` has connected.
+
+        Called before the startup thread is started so actions from the warm
+        start or a restored snapshot only update the bitmaps instead of failing
+        on the unconnected socket and starting a recovery that races
+        ``startup()``.  The connect callback sends the accumulated state.
+        """
+        self._defer_sends = True
+
+    def _end_deferred_sends(self, *, retry: bool) -> None:
+        self._defer_sends = False
+        if self._deferred_send:
+            self._deferred_send = False
+            if retry and self.client and not self.client.is_connected():
+                # Startup could not connect: fail the send now so recovery starts
+                self._send_shift_state_if_changed()
+
+    def _prefetch_ini_resolution_stage(self, stage_factory: Callable[[str], Any]) -> None:
+        try:
+            with stage_factory("ini_resolution"):
+                self._prefetch_ini_resolution()
+        except Exception as e:
+            logger.debug(f"VKB-Link startup: INI pre-resolution failed: {e}")
+
+    def _prefetch_ini_resolution(self) -> Optional[Path]:
+        """
+        Resolve the VKB-Link executable and INI paths ahead of ensure/connect.
+
+        Resolution walks the install directories and persists what it finds,
+        so the later ensure_running() call only has to confirm cached paths.
+        """
+        exe_path = self._resolve_known_exe_path()
+        if exe_path:
+            return self._resolve_or_default_ini_path(exe_path)
+        return self._resolve_ini_path(None)
 
     def shutdown(self) -> None:
         """
@@ -909,6 +1095,7 @@ class VKBLinkManager(Endpoint):
             if self._recovery_inflight:
                 return
             self._recovery_inflight = True
+        self._reconnects.inc()
 
         host = self.config.get("vkb_host", "127.0.0.1")
         port = self.config.get("vkb_port", 50995)
@@ -1128,6 +1315,11 @@ class VKBLinkManager(Endpoint):
         if not self._send_shift_state_if_changed(force=True):
             logger.warning("Failed to resend shift/subshift state after socket connection")
 
+    def _on_socket_lost(self, reason: str) -> None:
+        """Start recovery when the socket watcher reports that VKB-Link went away."""
+        logger.info(f"VKB socket lost ({reason}); starting recovery before next state change")
+        self._attempt_recovery(reason="socket_closed", on_connected_callback=self._on_socket_connected)
+
     def _apply_shift_tokens(self, rule_id: str, tokens: list, *, set_bits: bool) -> None:
         if not isinstance(tokens, list):
             logger.warning(f"[{rule_id}] Tokens must be a list, got {type(tokens)}")
@@ -1140,6 +1332,10 @@ class VKBLinkManager(Endpoint):
 
             match = _SHIFT_TOKEN_PATTERN.match(token)
             if not match:
+                if ":" in token:
+                    # Target-scoped token ("name:Shift1") handled by VKBTargetPool
+                    logger.debug(f"[{rule_id}] Skipping target-scoped shift token: {token}")
+                    continue
                 logger.warning(f"[{rule_id}] Unknown shift token: {token}")
                 continue
 
@@ -1167,31 +1363,63 @@ class VKBLinkManager(Endpoint):
     def _send_shift_state_if_changed(self, *, force: bool = False, allow_recovery: bool = True) -> bool:
         if not self.client:
             return False
+        if self._defer_sends and not self.client.is_connected():
+            self._deferred_send = True
+            return True
 
-        payload = {
-            "shift": self._shift_bitmap & VKB_SHIFT_MASK,
-            "subshift": self._subshift_bitmap & VKB_SUBSHIFT_MASK,
-        }
-        
-        if force or payload["shift"] != self._last_sent_shift or payload["subshift"] != self._last_sent_subshift:
-            if not self.client.send_event("VKBShiftBitmap", payload):
-                logger.warning("Failed to send VKB shift/subshift bitmap")
-                if allow_recovery:
-                    self._attempt_recovery(reason="send_failure", on_connected_callback=self._on_socket_connected)
-                return False
-            
-            self._last_sent_shift = payload["shift"]
-            self._last_sent_subshift = payload["subshift"]
-            
-            active_shifts = [
-                shift_num
-                for shift_num, bit_pos in ((1, 0), (2, 1))
-                if payload["shift"] & (1 << bit_pos)
-            ]
-            active_subshifts = [i + 1 for i in range(7) if payload["subshift"] & (1 << i)]
-            logger.info(f"VKB-Link <- Shift {active_shifts} Subshift {active_subshifts}")
+        shift = self._shift_bitmap & VKB_SHIFT_MASK
+        subshift = self._subshift_bitmap & VKB_SUBSHIFT_MASK
+        if force or not self._send_scheduler.enabled:
+            # Forced resends (reconnect, session reset) supersede anything scheduled.
+            self._send_scheduler.cancel()
+            if force or shift != self._last_sent_shift or subshift != self._last_sent_subshift:
+                return self._transmit_shift_state(shift, subshift, allow_recovery=allow_recovery)
+            return True
+        return self._send_scheduler.submit(shift, subshift)
+
+    def _transmit_shift_state(self, shift: int, subshift: int, *, allow_recovery: bool = True) -> bool:
+        payload = {"shift": shift, "subshift": subshift}
+        started = self.metrics.start()
+        sent = self.client.send_event("VKBShiftBitmap", payload)
+        self._shift_send_latency.observe_since(started)
+        if not sent:
+            self._shift_failed.inc()
+            logger.warning("Failed to send VKB shift/subshift bitmap")
+            if allow_recovery:
+                self._attempt_recovery(reason="send_failure", on_connected_callback=self._on_socket_connected)
+            return False
+
+        self._shift_sent.inc()
+        self._last_sent_shift = shift
+        self._last_sent_subshift = subshift
+        self._send_scheduler.record_sent(shift, subshift)
+
+        active_shifts = [
+            shift_num
+            for shift_num, bit_pos in ((1, 0), (2, 1))
+            if shift & (1 << bit_pos)
+        ]
+        active_subshifts = [i + 1 for i in range(7) if subshift & (1 << i)]
+        logger.info(f"VKB-Link <- Shift {active_shifts} Subshift {active_subshifts}")
         return True
 
+    def _configure_send_scheduler(self) -> None:
+        """Apply the configured send interval / per-bit hysteresis (milliseconds)."""
+        if not self.config:
+            return
+        self._send_scheduler.configure(
+            min_interval_seconds=self._cfg_int("vkb_send_min_interval_ms", 0) / 1000.0,
+            hysteresis_seconds=self._cfg_int("vkb_send_hysteresis_ms", 0) / 1000.0,
+        )
+
+    def _on_config_changed(self, _snapshot, changed_keys: frozenset) -> None:
+        if changed_keys & {"vkb_send_min_interval_ms", "vkb_send_hysteresis_ms"}:
+            self._configure_send_scheduler()
+
+    def get_send_stats(self) -> SendStats:
+        """Return counters for sent vs suppressed shift-state packets."""
+        return self._send_scheduler.stats()
+
     def get_status(self, *, check_running: bool = False) -> VKBLinkStatus:
         exe_path = (self.config.get("vkb_link_exe_path", "") or "").strip() if self.config else ""
         install_dir = (self.config.get("vkb_link_install_dir", "") or "").strip() if self.config else ""
@@ -1815,7 +2043,6 @@ class VKBLinkManager(Endpoint):
             minimum_seconds=0.01,
             legacy_ms_key="vkb_link_poll_interval_ms",
         )
-        post_stop_settle_seconds = min(1.0, max(0.25, poll_interval_seconds))
 
         before_inis: dict[str, float] = {}
         for ini in self._list_ini_near_exe(exe):
@@ -1833,13 +2060,12 @@ class VKBLinkManager(Endpoint):
             )
             return
 
-        deadline = time.time() + operation_timeout_seconds
-        generated_ini: Optional[Path] = None
-        while time.time() < deadline:
-            generated_ini = self._find_ini_near_exe(exe)
-            if generated_ini:
-                break
-            time.sleep(poll_interval_seconds)
+        generated_ini: Optional[Path] = _poll_until(
+            lambda: self._find_ini_near_exe(exe),
+            timeout=operation_timeout_seconds,
+            max_interval=poll_interval_seconds,
+            clock=self._clock,
+        )
 
         process = self._find_running_process()
         if process:
@@ -1847,23 +2073,23 @@ class VKBLinkManager(Endpoint):
                 "Stopping VKB-Link bootstrap process before applying managed INI settings"
             )
             self._stop_process(process)
-            if post_stop_settle_seconds:
-                time.sleep(post_stop_settle_seconds)
+            # VKB-Link writes its INI on exit; wait for the exit itself rather
+            # than a fixed settle delay.
+            self._wait_for_no_running_process()
         else:
             logger.info("Bootstrap process already exited before stop request")
 
         logger.info("Waiting for VKB-Link INI to appear/update after shutdown")
-        post_deadline = time.time() + operation_timeout_seconds
-        while time.time() < post_deadline:
-            changed_ini = self._select_new_or_touched_ini(exe, before_inis)
-            if changed_ini:
-                generated_ini = changed_ini
-                break
-            if not generated_ini:
-                generated_ini = self._find_ini_near_exe(exe)
-            time.sleep(poll_interval_seconds)
+        changed_ini = _poll_until(
+            lambda: self._select_new_or_touched_ini(exe, before_inis),
+            timeout=operation_timeout_seconds,
+            max_interval=poll_interval_seconds,
+            clock=self._clock,
+        )
+        if changed_ini:
+            generated_ini = changed_ini
         if not generated_ini:
-            generated_ini = self._select_new_or_touched_ini(exe, before_inis) or self._find_ini_near_exe(exe)
+            generated_ini = self._find_ini_near_exe(exe)
 
         if generated_ini and self.config:
             self.config.set("vkb_ini_path", str(generated_ini))
@@ -2011,13 +2237,12 @@ class VKBLinkManager(Endpoint):
             minimum_seconds=0.01,
             legacy_ms_key="vkb_link_poll_interval_ms",
         )
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            process = self._find_running_process()
-            if process:
-                return process
-            time.sleep(poll_interval_seconds)
-        return self._find_running_process()
+        return _poll_until(
+            self._find_running_process,
+            timeout=timeout,
+            max_interval=poll_interval_seconds,
+            clock=self._clock,
+        )
 
     def _wait_for_no_running_process(self) -> bool:
         timeout = max(2.0, self._cfg_float("vkb_link_operation_timeout_seconds", 10.0, minimum=0.1))
@@ -2027,12 +2252,12 @@ class VKBLinkManager(Endpoint):
             minimum_seconds=0.01,
             legacy_ms_key="vkb_link_poll_interval_ms",
         )
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self._find_running_processes():
-                return True
-            time.sleep(poll_interval_seconds)
-        return not self._find_running_processes()
+        return _poll_until(
+            lambda: not self._find_running_processes(),
+            timeout=timeout,
+            max_interval=poll_interval_seconds,
+            clock=self._clock,
+        )
 
     def wait_for_post_start_settle(self) -> None:
         """Wait for configurable post-start settle delay, if a recent start occurred."""
@@ -2041,7 +2266,7 @@ class VKBLinkManager(Endpoint):
     def _record_running_observation(self, is_running: bool) -> None:
         """Track process transition to running for consistent connect warmup."""
         if is_running and self._last_observed_process_running is not True:
-            self._last_running_detected_monotonic = time.monotonic()
+            self._last_running_detected_monotonic = self._clock.monotonic()
         self._last_observed_process_running = is_running
 
     def _wait_after_running_ack(self) -> None:
@@ -2052,11 +2277,11 @@ class VKBLinkManager(Endpoint):
         reference_start = max(self._last_start_monotonic, self._last_running_detected_monotonic)
         if reference_start <= 0:
             return
-        elapsed = time.monotonic() - reference_start
+        elapsed = self._clock.monotonic() - reference_start
         remaining = settle_seconds - elapsed
         if remaining > 0:
             logger.info(f"VKB-Link process settle delay: waiting {remaining:.1f}s")
-            time.sleep(remaining)
+            self._clock.sleep(remaining)
 
     def _find_running_processes(self) -> list[VKBLinkProcessInfo]:
         if sys.platform == "win32":
@@ -2261,12 +2486,12 @@ class VKBLinkManager(Endpoint):
             minimum_seconds=0.01,
             legacy_ms_key="vkb_link_poll_interval_ms",
         )
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self._is_target_process_running(target):
-                return True
-            time.sleep(poll_interval_seconds)
-        return not self._is_target_process_running(target)
+        return _poll_until(
+            lambda: not self._is_target_process_running(target),
+            timeout=timeout,
+            max_interval=poll_interval_seconds,
+            clock=self._clock,
+        )
 
     def _stop_process(self, process: VKBLinkProcessInfo) -> bool:
         operation_timeout = self._cfg_float(
@@ -2394,7 +2619,7 @@ class VKBLinkManager(Endpoint):
             return stopped
         restart_delay = self._cfg_float("vkb_link_restart_delay_seconds", 0.25, minimum=0.0)
         if restart_delay:
-            time.sleep(restart_delay)
+            self._clock.sleep(restart_delay)
         started = self._start_process(exe_path)
         if started:
             logger.info("VKB-Link restart completed successfully")
@@ -2424,7 +2649,7 @@ class VKBLinkManager(Endpoint):
                 popen_kwargs["start_new_session"] = True
 
             process = _popen_subprocess([str(exe)], **popen_kwargs)
-            self._last_start_monotonic = time.monotonic()
+            self._last_start_monotonic = self._clock.monotonic()
             logger.info("VKB-Link launch mode: detached")
             logger.info(f"Started VKB-Link process pid={process.pid}")
             return True
@@ -2444,6 +2669,9 @@ class VKBLinkManager(Endpoint):
         return None
 
     def _install_release(self, item: DownloadItem) -> Optional[str]:
+        import tempfile
+        import zipfile
+
         install_dir = self._resolve_install_dir()
         logger.info(f"Installing VKB-Link v{item.version} into {install_dir}")
         install_dir.mkdir(parents=True, exist_ok=True)
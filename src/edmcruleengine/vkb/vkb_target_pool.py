@@ -0,0 +1,398 @@
+"""
+Multi-target VKB endpoint backed by a pool of persistent VKB-Link clients.
+
+Each configured target (``vkb_targets`` entries of the form ``name=host:port``
+or ``host:port``) owns its own socket, send worker, shift-state slice and
+health record.  Unscoped shift tokens (``Shift1``) are mirrored to every
+target; scoped tokens (``name:Subshift3``) only change that target's slice.
+
+Sends are handed to per-target worker threads with latest-state-wins
+coalescing, so a slow or dead target never delays the others.  Process
+management (install, INI, restart) remains the job of ``VKBLinkManager`` for
+the primary local VKB-Link; pool targets are socket-only.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .. import plugin_logger
+from ..events.endpoint import Endpoint
+
+if TYPE_CHECKING:
+    from ..rules.rules_engine import MatchResult
+    from .vkb_client import VKBClient
+
+logger = plugin_logger(__name__)
+
+VKB_SHIFT_MASK = 0x03
+VKB_SUBSHIFT_MASK = 0x7F   # 7 bits for Subshift1-7
+
+_SCOPED_TOKEN_PATTERN = re.compile(r"^(?:(?P<target>[^:]+):)?(?P<kind>Subshift|Shift)(?P<index>\d+)$")
+_TARGET_SPEC_PATTERN = re.compile(r"^(?:(?P<name>[^=]+)=)?(?P<host>[^:=]+):(?P<port>\d+)$")
+
+
+@dataclass(frozen=True)
+class VKBTarget:
+    """A configured VKB-Link endpoint."""
+    name: str
+    host: str
+    port: int
+
+
+@dataclass(frozen=True)
+class VKBTargetHealth:
+    """Point-in-time health of a pool target."""
+    name: str
+    host: str
+    port: int
+    connected: bool
+    sent: int
+    failed: int
+    consecutive_failures: int
+    last_error: str
+    last_send_latency_ms: Optional[float]
+
+
+def parse_vkb_targets(entries: Any) -> List[VKBTarget]:
+    """
+    Parse ``vkb_targets`` config entries.
+
+    Accepts a list of strings (or a comma-separated string).  Invalid entries
+    and duplicate names are logged and skipped.  Unnamed targets are named
+    ``target<N>`` by position.
+    """
+    if isinstance(entries, str):
+        entries = [part for part in entries.split(",")]
+    if not isinstance(entries, (list, tuple)):
+        return []
+
+    targets: List[VKBTarget] = []
+    seen: set[str] = set()
+    for position, raw in enumerate(entries, start=1):
+        spec = str(raw).strip()
+        if not spec:
+            continue
+        match = _TARGET_SPEC_PATTERN.match(spec)
+        if not match:
+            logger.warning(f"Ignoring invalid VKB target '{spec}' (expected name=host:port)")
+            continue
+        port = int(match.group("port"))
+        if not 1 <= port <= 65535:
+            logger.warning(f"Ignoring VKB target '{spec}': port out of range")
+            continue
+        name = (match.group("name") or f"target{position}").strip()
+        if name in seen:
+            logger.warning(f"Ignoring duplicate VKB target name '{name}'")
+            continue
+        seen.add(name)
+        targets.append(VKBTarget(name=name, host=match.group("host").strip(), port=port))
+    return targets
+
+
+class _TargetConnection:
+    """Socket, shift slice, health and send worker for one pool target."""
+
+    def __init__(self, target: VKBTarget, client: "VKBClient", *, reconnect_interval: float) -> None:
+        self.target = target
+        self.client = client
+        self.reconnect_interval = reconnect_interval
+
+        self.shift_bitmap = 0
+        self.subshift_bitmap = 0
+        self._last_sent: Optional[tuple[int, int]] = None
+
+        self._cond = threading.Condition()
+        self._pending: Optional[tuple[int, int]] = None
+        self._pending_force = False
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+        self._next_connect_attempt = 0.0
+
+        self._health_lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._consecutive_failures = 0
+        self._last_error = ""
+        self._last_latency_ms: Optional[float] = None
+
+        client.set_on_disconnected(self._on_disconnected)
+
+    def start(self) -> None:
+        with self._cond:
+            self._stop = False
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"VKBTarget-{self.target.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, *, flush_timeout: float = 1.0) -> None:
+        """Stop the worker, first giving a queued state up to ``flush_timeout`` to go out."""
+        deadline = time.monotonic() + flush_timeout
+        with self._cond:
+            while self._pending is not None and self.client.is_connected():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._thread is None or not self._thread.is_alive():
+                    break
+                self._cond.wait(timeout=remaining)
+            self._stop = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+        self.client.disconnect()
+
+    def submit(self, *, force: bool = False) -> None:
+        """Queue the current slice for sending; superseded states are dropped."""
+        state = (self.shift_bitmap & VKB_SHIFT_MASK, self.subshift_bitmap & VKB_SUBSHIFT_MASK)
+        with self._cond:
+            if not force and self._pending is None and state == self._last_sent:
+                return
+            self._pending = state
+            self._pending_force = self._pending_force or force
+            self._cond.notify()
+
+    def connect_now(self) -> bool:
+        """Connect synchronously (bypassing the reconnect interval) and resend the slice."""
+        if self.client.connect():
+            self._next_connect_attempt = 0.0
+            self.submit(force=True)
+            return True
+        self._record_failure(f"connect to {self.target.host}:{self.target.port} failed")
+        self._next_connect_attempt = time.monotonic() + self.reconnect_interval
+        return False
+
+    def health(self) -> VKBTargetHealth:
+        with self._health_lock:
+            return VKBTargetHealth(
+                name=self.target.name,
+                host=self.target.host,
+                port=self.target.port,
+                connected=self.client.is_connected(),
+                sent=self._sent,
+                failed=self._failed,
+                consecutive_failures=self._consecutive_failures,
+                last_error=self._last_error,
+                last_send_latency_ms=self._last_latency_ms,
+            )
+
+    def _on_disconnected(self, reason: str) -> None:
+        self._record_failure(f"connection lost ({reason})")
+        # Wake the worker so the slice is resent once the target is reachable again.
+        self.submit(force=True)
+
+    def _record_failure(self, message: str) -> None:
+        with self._health_lock:
+            self._failed += 1
+            self._consecutive_failures += 1
+            self._last_error = message
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                state = self._pending
+                force = self._pending_force
+
+            if not self.client.is_connected():
+                wait = self._next_connect_attempt - time.monotonic()
+                if wait > 0:
+                    with self._cond:
+                        self._cond.wait(timeout=wait)
+                    continue
+                if not self.client.connect():
+                    self._record_failure(f"connect to {self.target.host}:{self.target.port} failed")
+                    self._next_connect_attempt = time.monotonic() + self.reconnect_interval
+                    continue
+                force = True
+
+            with self._cond:
+                # Only clear the slot if nothing newer arrived while connecting.
+                if self._pending == state:
+                    self._pending = None
+                    self._pending_force = False
+            if not force and state == self._last_sent:
+                continue
+
+            started = time.perf_counter()
+            ok = self.client.send_event("VKBShiftBitmap", {"shift": state[0], "subshift": state[1]})
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            if ok:
+                self._last_sent = state
+                with self._health_lock:
+                    self._sent += 1
+                    self._consecutive_failures = 0
+                    self._last_error = ""
+                    self._last_latency_ms = latency_ms
+            else:
+                self._record_failure("send failed")
+                with self._cond:
+                    if self._pending is None:
+                        self._pending = state
+                        self._pending_force = True
+            with self._cond:
+                self._cond.notify_all()
+
+
+class VKBTargetPool(Endpoint):
+    """Endpoint that fans shift state out to several VKB-Link instances."""
+
+    @classmethod
+    def from_config(cls, config) -> Optional["VKBTargetPool"]:
+        """Create a pool from ``vkb_targets``; returns None when no targets are configured."""
+        targets = parse_vkb_targets(config.get("vkb_targets", []))
+        if not targets:
+            return None
+
+        from .vkb_client import VKBClient
+        clients = {
+            target.name: VKBClient(
+                host=target.host,
+                port=target.port,
+                header_byte=config.get("vkb_header_byte", 0xA5),
+                command_byte=config.get("vkb_command_byte", 13),
+                socket_timeout=config.get("socket_timeout", 5),
+            )
+            for target in targets
+        }
+        reconnect_interval = config.get("vkb_target_reconnect_interval_seconds", 5)
+        return cls(targets, clients, reconnect_interval=reconnect_interval)
+
+    def __init__(
+        self,
+        targets: List[VKBTarget],
+        clients: Dict[str, "VKBClient"],
+        *,
+        reconnect_interval: float = 5.0,
+    ) -> None:
+        try:
+            interval = max(0.1, float(reconnect_interval))
+        except (TypeError, ValueError):
+            interval = 5.0
+        self._connections: Dict[str, _TargetConnection] = {
+            target.name: _TargetConnection(target, clients[target.name], reconnect_interval=interval)
+            for target in targets
+        }
+
+    @property
+    def name(self) -> str:
+        return "VKB-Link Pool"
+
+    @property
+    def targets(self) -> List[VKBTarget]:
+        return [conn.target for conn in self._connections.values()]
+
+    def get_health(self) -> List[VKBTargetHealth]:
+        """Return per-target health snapshots in configuration order."""
+        return [conn.health() for conn in self._connections.values()]
+
+    def get_shift_state(self, target_name: str) -> Optional[tuple[int, int]]:
+        conn = self._connections.get(target_name)
+        if conn is None:
+            return None
+        return conn.shift_bitmap & VKB_SHIFT_MASK, conn.subshift_bitmap & VKB_SUBSHIFT_MASK
+
+    def connect(self) -> bool:
+        """
+        Connect every target in parallel and start the send workers.
+
+        Returns True if at least one target connected.  Targets that fail keep
+        retrying from their worker at ``vkb_target_reconnect_interval_seconds``.
+        """
+        results: Dict[str, bool] = {}
+
+        def _connect(conn: _TargetConnection) -> None:
+            results[conn.target.name] = conn.connect_now()
+
+        threads = []
+        for conn in self._connections.values():
+            conn.start()
+            thread = threading.Thread(target=_connect, args=(conn,), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+        for name, ok in results.items():
+            conn = self._connections[name]
+            if ok:
+                logger.info(f"VKB target '{name}' connected at {conn.target.host}:{conn.target.port}")
+            else:
+                logger.warning(f"VKB target '{name}' unavailable at {conn.target.host}:{conn.target.port}")
+        return any(results.values())
+
+    def disconnect(self) -> None:
+        """Clear every target's shift state, then close the pool."""
+        for conn in self._connections.values():
+            conn.shift_bitmap = 0
+            conn.subshift_bitmap = 0
+            conn.submit()
+        for conn in self._connections.values():
+            conn.stop()
+
+    def handle_action(self, action_key: str, action_value: Any, result: "MatchResult") -> bool:
+        """Apply shift tokens to the addressed target slices and queue sends."""
+        if action_key not in ("vkb_set_shift", "vkb_clear_shift"):
+            return False
+        if not isinstance(action_value, list):
+            logger.warning(f"[{result.rule_id}] {action_key} must be a list")
+            return False
+
+        set_bits = action_key == "vkb_set_shift"
+        touched: set[str] = set()
+        for token in action_value:
+            if not isinstance(token, str):
+                continue
+            match = _SCOPED_TOKEN_PATTERN.match(token)
+            if not match:
+                continue
+            scope = match.group("target")
+            if scope is None:
+                conns = list(self._connections.values())
+            elif scope in self._connections:
+                conns = [self._connections[scope]]
+            else:
+                logger.warning(f"[{result.rule_id}] Unknown VKB target in token: {token}")
+                continue
+
+            idx = int(match.group("index"))
+            if match.group("kind") == "Shift":
+                if idx < 1 or idx > 2:
+                    logger.warning(f"[{result.rule_id}] Shift index {idx} out of range (1-2): {token}")
+                    continue
+                mask, attr = 1 << (idx - 1), "shift_bitmap"
+            else:
+                if idx < 1 or idx > 7:
+                    logger.warning(f"[{result.rule_id}] Subshift index {idx} out of range (1-7): {token}")
+                    continue
+                mask, attr = 1 << (idx - 1), "subshift_bitmap"
+
+            for conn in conns:
+                value = getattr(conn, attr)
+                setattr(conn, attr, (value | mask) if set_bits else (value & ~mask))
+                touched.add(conn.target.name)
+
+        for name in touched:
+            self._connections[name].submit()
+        return True
+
+    def on_session_event(self, event_type: str) -> None:
+        """Reset every target slice on session boundaries (Commander, LoadGame, Shutdown)."""
+        if event_type not in ("Commander", "LoadGame", "Shutdown"):
+            return
+        for conn in self._connections.values():
+            conn.shift_bitmap = 0
+            conn.subshift_bitmap = 0
+            conn.submit(force=True)
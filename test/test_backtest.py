@@ -0,0 +1,100 @@
+"""
+Tests for backtesting rules against recorded sessions.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from edmcruleengine.rules.backtest import backtest_recording, find_recordings, run_backtest
+
+ROOT = Path(__file__).parent.parent
+RULES = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+
+# (recorded second, dashboard Flags): docked 10-100 and briefly 101-102
+DOCKING_SESSION = [(0, 0), (10, 1), (100, 0), (101, 1), (102, 0), (200, 0)]
+
+
+def _write_recording(path: Path, samples) -> Path:
+    lines = [
+        json.dumps({
+            "ts": f"2026-01-01T00:{t // 60:02d}:{t % 60:02d}+00:00",
+            "source": "dashboard",
+            "event": "Status",
+            "data": {"event": "Status", "Flags": flags},
+        })
+        for t, flags in samples
+    ]
+    text = "\n".join(lines) + "\n"
+    if path.name.endswith(".gz"):
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_single_recording_rule_statistics(tmp_path):
+    recording = _write_recording(tmp_path / "session.jsonl", DOCKING_SESSION)
+    result = backtest_recording(str(RULES), str(recording), str(ROOT))
+
+    assert result.error is None
+    assert result.events == 6
+    assert result.recorded_seconds == 200.0
+
+    docked = result.rules["docked-state-control"]
+    assert docked.activations == 2
+    assert docked.active_seconds == pytest.approx(91.0)
+    assert docked.flaps == 1
+    assert docked.flap_rate == 0.5
+    assert docked.evaluations == 6
+
+    in_flight = result.rules["in-flight-indicator"]
+    assert in_flight.activations == 3
+    assert in_flight.active_seconds == pytest.approx(10.0 + 1.0 + 98.0)
+
+
+def test_pool_merges_recordings_and_reports_never_fired(tmp_path):
+    _write_recording(tmp_path / "a.jsonl", DOCKING_SESSION)
+    _write_recording(tmp_path / "b.jsonl.gz", [(0, 0), (50, 0)])
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    recordings = find_recordings(tmp_path)
+    assert [p.name for p in recordings] == ["a.jsonl", "b.jsonl.gz"]
+
+    report = run_backtest(RULES, recordings, plugin_dir=ROOT, workers=2)
+
+    assert report.recordings == 2
+    assert report.events == 8
+    assert report.failures == []
+    assert report.rules["docked-state-control"].activations == 2
+    assert report.rules["in-flight-indicator"].activations == 4
+    assert report.per_event_cost_us > 0
+    assert "Docked State Control" in report.format_summary()
+
+    quiet = run_backtest(RULES, [recordings[1]], plugin_dir=ROOT, workers=1)
+    assert [stats.rule_id for stats in quiet.never_fired] == ["docked-state-control"]
+
+
+def test_unloadable_rules_are_reported_as_failures(tmp_path):
+    recording = _write_recording(tmp_path / "a.jsonl", DOCKING_SESSION)
+    report = run_backtest(tmp_path / "missing_rules.json", [recording], plugin_dir=ROOT, workers=1)
+    assert report.failures == [(str(recording), "rules could not be loaded")]
+
+
+def test_rule_cost_comes_from_engine_latency_histograms(tmp_path):
+    recording = _write_recording(tmp_path / "session.jsonl", DOCKING_SESSION)
+    now = [0.0]
+
+    def _ticking_timer() -> float:
+        now[0] += 0.001
+        return now[0]
+
+    result = backtest_recording(str(RULES), str(recording), str(ROOT), timer=_ticking_timer)
+    for stats in result.rules.values():
+        assert stats.evaluations == 6
+        assert stats.mean_eval_us == pytest.approx(1000.0)
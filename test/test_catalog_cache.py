@@ -0,0 +1,138 @@
+"""
+Tests for the compiled signals catalog cache.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from edmcruleengine.rules import catalog_cache
+from edmcruleengine.rules.catalog_cache import UI_CACHE_SECTION, cache_path_for
+from edmcruleengine.rules.rules_engine import RuleEngine
+from edmcruleengine.rules.signal_derivation import SignalDerivation
+from edmcruleengine.rules.signals_catalog import SignalsCatalog
+
+ROOT = Path(__file__).parent.parent
+
+
+def _catalog(tmp_path: Path) -> Path:
+    path = tmp_path / "signals_catalog.json"
+    shutil.copyfile(ROOT / "data" / "signals_catalog.json", path)
+    return path
+
+
+def _assert_same(left: SignalsCatalog, right: SignalsCatalog) -> None:
+    assert left.signals == right.signals
+    assert left.signal_hierarchy == right.signal_hierarchy
+    assert left.runtime_signals == right.runtime_signals
+    assert left.derivation_plan == right.derivation_plan
+
+
+def test_second_load_comes_from_cache(tmp_path, monkeypatch):
+    path = _catalog(tmp_path)
+    compiled = SignalsCatalog.from_file(path)
+    assert cache_path_for(path).exists()
+
+    monkeypatch.setattr(SignalsCatalog, "__init__", lambda *a, **k: (_ for _ in ()).throw(AssertionError))
+    cached = SignalsCatalog.from_file(path)
+    _assert_same(cached, compiled)
+    assert cached.derivation_plan["momentary"] and cached.derivation_plan["state_sections"]
+
+
+def test_cache_rebuilt_when_source_or_version_changes(tmp_path, monkeypatch):
+    path = _catalog(tmp_path)
+    SignalsCatalog.from_file(path)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["signals"]["extra_signal"] = {
+        "type": "bool", "title": "Extra", "ui": {"label": "Extra", "category": "Core", "tier": "core"},
+        "derive": {"op": "path", "path": "state.Extra", "default": False},
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert "extra_signal" in SignalsCatalog.from_file(path).signals
+    assert SignalsCatalog.from_file(path).derivation_plan["state_sections"]["Extra"] == ["extra_signal"]
+
+    monkeypatch.setattr(catalog_cache, "__version__", "999.0.0")
+    key = catalog_cache.cache_key(path.read_bytes())
+    assert catalog_cache.read_cache(cache_path_for(path), key) is None
+    SignalsCatalog.from_file(path)
+    assert catalog_cache.read_cache(cache_path_for(path), key) is not None
+
+
+def test_corrupt_cache_falls_back_to_json(tmp_path):
+    path = _catalog(tmp_path)
+    expected = SignalsCatalog.from_file(path, use_cache=False)
+    assert not cache_path_for(path).exists()
+
+    cache_path_for(path).write_bytes(b"\x00not marshal")
+    _assert_same(SignalsCatalog.from_file(path), expected)
+    _assert_same(SignalsCatalog.from_file(path), expected)
+
+
+def test_runtime_use_does_not_load_ui_metadata(tmp_path):
+    path = _catalog(tmp_path)
+    full = SignalsCatalog.from_file(path)
+    assert full.ui_loaded
+
+    catalog = SignalsCatalog.from_file(path)
+    actions = []
+    engine = RuleEngine(
+        [{"id": "docked", "title": "Docked", "when": {"all": [{"signal": "docking_state", "op": "eq", "value": "docked"}]},
+          "then": [{"vkb_set_shift": ["Shift1"]}]}],
+        catalog,
+        action_handler=actions.append,
+    )
+    engine.on_notification("Jameson", False, "dashboard", "Status", {"event": "Status", "Flags": 1})
+    assert actions and actions[-1].matched
+    assert catalog.get_signal_values("docking_state") == full.get_signal_values("docking_state")
+    assert catalog.get_all_known_events() == full.get_all_known_events()
+    assert "ui" not in catalog.runtime_signals["docking_state"]
+    assert not catalog.ui_loaded
+
+    assert catalog.get_core_signals() == full.get_core_signals()
+    assert catalog.ui_loaded
+    _assert_same(catalog, full)
+
+
+def test_runtime_core_derives_like_full_catalog():
+    catalog = SignalsCatalog.from_file(ROOT / "data" / "signals_catalog.json", use_cache=False)
+    runtime = SignalDerivation(catalog.runtime_data)
+    full = SignalDerivation(catalog._data)
+    entries = [
+        {"event": "Status", "Flags": 0x01000000 | 0x1, "GuiFocus": 6, "Fuel": {"FuelMain": 4.0}},
+        {"event": "Docked", "StationName": "Jameson Memorial"},
+        {"event": "Loadout", "state": {"ShipType": "anaconda", "CargoCapacity": 64}},
+    ]
+    for entry in entries:
+        assert runtime.derive_all_signals(entry) == full.derive_all_signals(entry)
+
+
+def test_missing_ui_cache_falls_back_to_json(tmp_path):
+    path = _catalog(tmp_path)
+    expected = SignalsCatalog.from_file(path)
+    cache_path_for(path, UI_CACHE_SECTION).unlink()
+
+    catalog = SignalsCatalog.from_file(path)
+    assert not catalog.ui_loaded
+    _assert_same(catalog, expected)
+
+
+def test_concurrent_writers_use_distinct_temp_files(tmp_path, monkeypatch):
+    cache_path = tmp_path / "signals_catalog.cache"
+    temp_files = []
+    real_replace = catalog_cache.os.replace
+
+    def _spy_replace(src, dst):
+        temp_files.append(Path(src))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(catalog_cache.os, "replace", _spy_replace)
+    assert catalog_cache.write_cache(cache_path, "k1", {"value": 1})
+    assert catalog_cache.write_cache(cache_path, "k2", {"value": 2})
+
+    assert len(set(temp_files)) == 2
+    assert all(path.parent == tmp_path and path.name.endswith(".tmp") for path in temp_files)
+    assert catalog_cache.read_cache(cache_path, "k2")["value"] == 2
+    assert [path.name for path in tmp_path.iterdir()] == ["signals_catalog.cache"]
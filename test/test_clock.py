@@ -0,0 +1,68 @@
+"""
+Tests for the injectable clock and its use across the pipeline.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import ReplayConfig
+from edmcruleengine.events.unregistered_events_tracker import UnregisteredEventsTracker
+from edmcruleengine.utils.clock import SYSTEM_CLOCK, SystemClock, VirtualClock
+from edmcruleengine.vkb import vkb_link_manager as vkbm
+
+ROOT = Path(__file__).parent.parent
+RULES = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+
+
+def test_system_clock_reads_real_time():
+    assert isinstance(SYSTEM_CLOCK, SystemClock)
+    assert abs(SYSTEM_CLOCK.time() - time.time()) < 1.0
+    assert SYSTEM_CLOCK.monotonic() <= time.monotonic()
+
+
+def test_virtual_clock_moves_only_forward():
+    clock = VirtualClock(100.0)
+    assert clock.time() == clock.monotonic() == 100.0
+    clock.advance(3600.0)
+    clock.sleep(0.5)
+    assert clock.time() == 3700.5
+    clock.advance_to(50.0)
+    clock.advance(-10.0)
+    assert clock.time() == 3700.5
+    assert clock.advance_to(4000.0) == 4000.0
+
+
+def test_poll_until_with_virtual_clock_times_out_without_waiting():
+    clock = VirtualClock()
+    started = time.monotonic()
+    assert vkbm._poll_until(lambda: False, timeout=600.0, max_interval=5.0, clock=clock) is False
+    assert time.monotonic() - started < 1.0
+    assert clock.monotonic() >= 600.0
+
+
+def test_event_handler_shares_clock_with_rules_and_tracker(tmp_path):
+    clock = VirtualClock(5000.0)
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES)}),
+        plugin_dir=str(ROOT),
+        clock=clock,
+    )
+    assert handler.rule_engine.signal_derivation.clock is clock
+    assert handler.unregistered_events_tracker.clock is clock
+
+    tracker = UnregisteredEventsTracker(tmp_path, clock=clock, save_interval_seconds=60)
+    tracker.track_event("Mystery", {"Value": 1})
+    clock.advance(30.0)
+    tracker.track_event("Mystery", {"Value": 2})
+    entry = tracker.get_unregistered_events()[0]
+    assert (entry["first_seen"], entry["last_seen"]) == (5000.0, 5030.0)
+    tracker.flush()
+
+
+def test_manager_send_scheduler_uses_injected_clock(tmp_path):
+    clock = VirtualClock(10.0)
+    manager = vkbm.VKBLinkManager(ReplayConfig(), tmp_path, clock=clock)
+    assert manager._send_scheduler._clock == clock.monotonic
@@ -103,6 +103,105 @@ def test_message_formatter():
     print("[OK] MessageFormatter test passed")
 
 
+class _FakeEDMCConfig:
+    """Minimal stand-in for EDMC's config store, counting reads."""
+
+    def __init__(self, **values):
+        self.values = {f"{config_module.CONFIG_PREFIX}{k}": v for k, v in values.items()}
+        self.reads = 0
+
+    def _get(self, key, default=None):
+        self.reads += 1
+        return self.values.get(key, default)
+
+    def get(self, key):
+        return self._get(key)
+
+    def get_str(self, key, *, default=None):
+        return self._get(key, default)
+
+    def get_int(self, key, *, default=None):
+        return self._get(key, default)
+
+    def get_list(self, key, *, default=None):
+        return self._get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+def test_snapshot_serves_typed_values_without_store_reads(monkeypatch):
+    store = _FakeEDMCConfig(vkb_port="50996", enabled="0", vkb_link_poll_interval_seconds="0.5")
+    monkeypatch.setattr(config_module, "config", store)
+    config = Config()
+
+    assert config.get("vkb_port") == 50996
+    assert config.get("enabled") is False
+    assert config.get("vkb_link_poll_interval_seconds") == 0.5
+    # Unset keys fall back to the caller's default, then DEFAULTS.
+    assert config.get("vkb_host", "10.0.0.1") == "10.0.0.1"
+    assert config.get("vkb_host") == config_module.DEFAULTS["vkb_host"]
+
+    reads_after_load = store.reads
+    for _ in range(10):
+        config.get("vkb_port")
+    assert store.reads == reads_after_load
+
+    snapshot = config.snapshot()
+    assert snapshot.is_stored("vkb_port") and not snapshot.is_stored("vkb_host")
+    try:
+        snapshot.foo = 1
+        raise AssertionError("snapshot should be immutable")
+    except AttributeError:
+        pass
+
+
+def test_set_and_refresh_notify_changed_keys(monkeypatch):
+    store = _FakeEDMCConfig()
+    monkeypatch.setattr(config_module, "config", store)
+    config = Config()
+    config.snapshot()
+    notifications = []
+    unsubscribe = config.subscribe(lambda snap, changed: notifications.append((snap, changed)))
+
+    config.set("vkb_port", 50997)
+    assert config.get("vkb_port") == 50997
+    assert notifications[-1][1] == frozenset({"vkb_port"})
+
+    # Setting the same value again is not a change.
+    config.set("vkb_port", 50997)
+    assert len(notifications) == 1
+
+    # Values changed behind our back are picked up by refresh().
+    store.values[f"{config_module.CONFIG_PREFIX}vkb_host"] = "192.168.0.2"
+    assert config.refresh() == frozenset({"vkb_host"})
+    assert notifications[-1][0]["vkb_host"] == "192.168.0.2"
+
+    config.delete("vkb_host")
+    assert config.get("vkb_host") == config_module.DEFAULTS["vkb_host"]
+    assert notifications[-1][1] == frozenset({"vkb_host"})
+
+    unsubscribe()
+    config.set("vkb_port", 1)
+    assert len(notifications) == 3
+
+
+def test_event_handler_reacts_to_config_changes(monkeypatch):
+    from edmcruleengine.events.event_handler import EventHandler
+
+    store = _FakeEDMCConfig()
+    monkeypatch.setattr(config_module, "config", store)
+    config = Config()
+    handler = EventHandler(config, endpoints=[])
+    assert handler.enabled is True
+
+    config.set("enabled", False)
+    assert handler.enabled is False
+
+
 if __name__ == "__main__":
     try:
         test_config_defaults()
@@ -0,0 +1,92 @@
+"""
+Tests for the diagnostics report collector.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig
+from edmcruleengine.utils.clock import VirtualClock
+from edmcruleengine.utils.diagnostics import DiagnosticsCollector, report_sections
+from edmcruleengine.utils.metrics import MetricsRegistry
+from edmcruleengine.vkb.send_scheduler import SendStats
+
+ROOT = Path(__file__).parent.parent
+RULES = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+
+
+class _FakeManager:
+    def get_send_stats(self) -> SendStats:
+        return SendStats(sent=3, suppressed=2, pending=True)
+
+
+def test_report_covers_rates_stages_rules_and_vkb():
+    registry = MetricsRegistry()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES)}),
+        endpoints=[NullEndpoint()],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+        metrics=registry,
+    )
+    ticks = iter([10.0, 12.0])
+    collector = DiagnosticsCollector(
+        get_event_handler=lambda: handler,
+        get_vkb_manager=_FakeManager,
+        metrics=registry,
+        clock=lambda: next(ticks),
+    )
+
+    first = collector.collect()
+    assert first.event_rates == {}
+    assert first.queues["vkb send pending"] == 1.0
+    assert first.vkb["suppressed"] == 2
+
+    for flags in (1, 0, 1, 0):
+        handler.handle_event("Status", {"event": "Status", "Flags": flags}, source="dashboard", cmdr="Jameson")
+    handler.handle_event("Music", {"event": "Music"}, source="journal", cmdr="Jameson")
+
+    report = collector.collect()
+    assert report.event_totals == {"dashboard": 4, "journal": 1}
+    assert report.event_rates == {"dashboard": 2.0, "journal": 0.5}
+    assert [stage.name for stage in report.stages][:4] == [
+        "event.handle", "rules.reload_check", "rules.derive", "rules.evaluate",
+    ]
+    assert report.slowest_rules and all(rule.name.startswith("rule.") for rule in report.slowest_rules)
+    assert report.slowest_rules[0].p95_ms >= report.slowest_rules[-1].p95_ms
+
+    sections = dict(report_sections(report))
+    assert list(sections) == ["Event rate", "Stage latency", "Queues", "VKB sends", "Slowest rules", "Memory"]
+    assert sections["Event rate"][0] == ("dashboard", "2.0/s  (4 total)")
+    assert ("suppressed", "2") in sections["VKB sends"]
+
+
+def test_report_without_components():
+    report = DiagnosticsCollector(metrics=MetricsRegistry(enabled=False)).collect()
+    assert report.metrics_enabled is False
+    assert report.slowest_rules == []
+    sections = dict(report_sections(report))
+    assert sections["Stage latency"] == [("-", "no samples yet")]
+    assert sections["Memory"] == [("tracker", "0 B"), ("recorder", "0 B")]
+
+
+def test_reset_clears_registry_and_per_rule_latencies():
+    registry = MetricsRegistry()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES)}),
+        endpoints=[NullEndpoint()],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+        metrics=registry,
+    )
+    collector = DiagnosticsCollector(get_event_handler=lambda: handler, metrics=registry)
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    assert collector.collect().slowest_rules
+
+    collector.reset()
+    report = collector.collect()
+    assert report.slowest_rules == []
+    assert report.event_totals == {"dashboard": 0}
+    assert all(stage.count == 0 for stage in report.stages)
@@ -8,7 +8,7 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from edmcruleengine.events.event_anonymizer import EventAnonymizer
+from edmcruleengine.events.event_anonymizer import CompiledAnonymizer, EventAnonymizer
 
 
 def test_anonymizer_basic():
@@ -113,6 +113,62 @@ def test_anonymizer_ip_addresses():
     print("✓ IP address anonymization works")
 
 
+def test_anonymizer_copy_on_write():
+    """Untouched subtrees are shared and the input is never mutated."""
+    anonymizer = EventAnonymizer(mock_commander_name="TestCMDR")
+    modules = [{"Item": "Module1", "Health": 1.0}]
+    event = {"Commander": "RealCMDR", "Modules": modules, "Stats": {"Count": 3}}
+
+    anonymized = anonymizer.anonymize_event(event)
+
+    assert event["Commander"] == "RealCMDR"
+    assert anonymized["Commander"] == "TestCMDR"
+    assert anonymized["Modules"] is modules
+    assert anonymized["Stats"] is event["Stats"]
+    assert anonymizer.anonymize_event({"event": "Music"}) == {"event": "Music"}
+
+
+def test_anonymizer_urls_and_non_string_fields():
+    """URLs keep their path and non-string identity fields are walked, not replaced."""
+    anonymizer = EventAnonymizer()
+    event = {"Link": "https://example.com/a/b", "FID": 12345, "Port": {"IP": "10.1.1.1"}}
+
+    anonymized = anonymizer.anonymize_event(event)
+
+    assert anonymized["Link"] == "https://example.com/a/b"
+    assert anonymized["FID"] == 12345
+    assert anonymized["Port"] == {"IP": "127.0.0.1"}
+
+
+def test_compiled_anonymizer_applies_rules_in_order():
+    """String rules run in order over each other's output; pre-filtered strings are returned as-is."""
+    engine = CompiledAnonymizer(
+        {"Secret": (False, lambda value: "x")},
+        [(r"/home/[^/\s]+", "/home/redacted"), (r"\d+", lambda match: "#" * len(match.group(0)))],
+    )
+    plain = "no candidates here"
+
+    assert engine.scrub_string(plain) is plain
+    assert engine.scrub_string("/home/bob/file 42") == "/home/redacted/file ##"
+    assert engine.anonymize({"Secret": {"deep": 1}, "v": [plain]}) == {"Secret": "x", "v": [plain]}
+
+
+def test_anonymizer_scrubs_ips_inside_urls_and_paths():
+    """An IP inside text matched by a path rule is still replaced."""
+    anonymizer = EventAnonymizer()
+    event = {
+        "Status": "http://10.1.2.3/status",
+        "Api": "https://192.168.1.5:8080/x",
+        "Log": r"C:\Users\bob\host-10.1.2.3.log",
+    }
+
+    anonymized = anonymizer.anonymize_event(event)
+
+    assert anonymized["Status"] == "http://127.0.0.1/status"
+    assert anonymized["Api"] == "https://127.0.0.1:8080/x"
+    assert "10.1.2.3" not in anonymized["Log"]
+
+
 if __name__ == "__main__":
     print("Testing EventAnonymizer...")
     test_anonymizer_basic()
@@ -120,4 +176,8 @@ if __name__ == "__main__":
     test_anonymizer_paths()
     test_anonymizer_nested()
     test_anonymizer_ip_addresses()
+    test_anonymizer_copy_on_write()
+    test_anonymizer_urls_and_non_string_fields()
+    test_compiled_anonymizer_applies_rules_in_order()
+    test_anonymizer_scrubs_ips_inside_urls_and_paths()
     print("\n✅ All tests passed!")
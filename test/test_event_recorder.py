@@ -0,0 +1,124 @@
+"""
+Tests for the batched background EventRecorder.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+
+from edmcruleengine.events.event_recorder import EventRecorder
+
+
+def _read_jsonl(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_records_are_written_in_order_and_anonymized(tmp_path):
+    recorder = EventRecorder(flush_interval_seconds=0.05)
+    out = tmp_path / "rec.jsonl"
+    recorder.start(out)
+    for i in range(20):
+        recorder.record("journal", "Music", {"MusicTrack": f"T{i}", "Commander": "Jameson"})
+    recorder.stop()
+
+    rows = _read_jsonl(out)
+    assert [r["data"]["MusicTrack"] for r in rows] == [f"T{i}" for i in range(20)]
+    assert all(r["data"]["Commander"] == recorder.mock_commander for r in rows)
+    assert recorder.event_count == 20
+    assert recorder.last_event_type == "Music"
+
+
+def test_ips_inside_windows_paths_are_scrubbed():
+    recorder = EventRecorder()
+    assert recorder._scrub_string(r"C:\Users\bob\host-10.1.2.3.log") == r"X:\Redacted\host-0.0.0.0.log"
+    assert recorder._scrub_string("see http://10.1.2.3/status") == "see http://0.0.0.0/status"
+
+
+def test_record_only_enqueues_on_dispatch_thread(tmp_path, monkeypatch):
+    recorder = EventRecorder(flush_interval_seconds=0.05)
+    threads = []
+    original = recorder._anonymize_data
+
+    def _spy(data):
+        threads.append(threading.current_thread().name)
+        return original(data)
+
+    monkeypatch.setattr(recorder, "_anonymize_data", _spy)
+    recorder.start(tmp_path / "rec.jsonl")
+    recorder.record("journal", "FSDJump", {"StarSystem": "Sol"})
+    recorder.stop()
+    assert threads == ["EventRecorderWriter"]
+
+
+def test_payload_is_snapshotted_when_recorded(tmp_path):
+    recorder = EventRecorder(flush_interval_seconds=0.05)
+    out = tmp_path / "rec.jsonl"
+    recorder.start(out)
+    entry = {"Inventory": [{"Name": "gold", "Count": 1}]}
+    recorder.record("journal", "Cargo", entry)
+    entry["Inventory"].append({"Name": "silver", "Count": 2})
+    entry["Inventory"][0]["Count"] = 99
+    recorder.stop()
+
+    assert _read_jsonl(out)[0]["data"] == {"Inventory": [{"Name": "gold", "Count": 1}]}
+
+
+def test_gzip_output(tmp_path):
+    recorder = EventRecorder(compress=True, flush_interval_seconds=0.05)
+    recorder.start(tmp_path / "rec.jsonl")
+    recorder.record("dashboard", "Status", {"Flags": 1})
+    recorder.stop()
+
+    assert recorder.output_path.name == "rec.jsonl.gz"
+    assert _read_jsonl(recorder.output_path)[0]["data"] == {"Flags": 1}
+
+
+def test_size_rotation_splits_output(tmp_path):
+    recorder = EventRecorder(rotate_max_bytes=200, flush_interval_seconds=0.05)
+    recorder.start(tmp_path / "rec.jsonl")
+    for i in range(10):
+        recorder.record("journal", "Music", {"MusicTrack": "x" * 50, "n": i})
+    recorder.stop()
+
+    paths = recorder.output_paths
+    assert len(paths) > 1
+    assert paths[1].name == "rec.001.jsonl"
+    rows = [row for path in paths for row in _read_jsonl(path)]
+    assert [r["data"]["n"] for r in rows] == list(range(10))
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    recorder = EventRecorder(queue_size=1, flush_interval_seconds=10)
+    gate = threading.Event()
+    original = recorder._serialize
+
+    def _blocked(item):
+        gate.wait(timeout=2.0)
+        return original(item)
+
+    recorder._serialize = _blocked
+    recorder.start(tmp_path / "rec.jsonl")
+    for i in range(5):
+        recorder.record("journal", "Music", {"n": i})
+    assert recorder.dropped_count > 0
+    gate.set()
+    recorder.stop()
+
+
+def test_compressed_rotation_uses_size_on_disk(tmp_path):
+    recorder = EventRecorder(compress=True, rotate_max_bytes=400, flush_interval_seconds=10)
+    recorder.start(tmp_path / "rec.jsonl")
+    line = json.dumps({"source": "journal", "event": "Music", "data": {"MusicTrack": "x" * 1000}}) + "\n"
+    for _ in range(40):
+        recorder._write_batch([line] * 5)  # one flush per batch
+    recorder.stop()
+
+    paths = recorder.output_paths
+    # 200 KB of text compresses to a few KB: a handful of parts, not ~500
+    assert 1 < len(paths) < 40
+    assert all(path.stat().st_size >= 400 for path in paths[:-1])
+    assert sum(len(_read_jsonl(path)) for path in paths) == 200
@@ -0,0 +1,134 @@
+"""
+Tests for lazy, sampled hot-path debug logging and the explain buffer.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig
+from edmcruleengine.utils.clock import VirtualClock
+from edmcruleengine.utils.hot_path_log import (
+    CONDITIONS,
+    PAYLOAD,
+    RULES,
+    SIGNALS,
+    HotPathLog,
+    parse_sample_rates,
+)
+from edmcruleengine.utils.metrics import MetricsRegistry
+from edmcruleengine.utils.tracing import SpanTracer
+
+ROOT = Path(__file__).parent.parent
+RULES_FILE = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+
+
+def _logger(level: int) -> logging.Logger:
+    log = logging.getLogger(f"test_hot_path_log.{level}")
+    log.setLevel(level)
+    return log
+
+
+class _Unformattable:
+    def __repr__(self) -> str:
+        raise AssertionError("formatted eagerly")
+
+
+def test_parse_sample_rates():
+    rates = parse_sample_rates("payload=0.1, conditions=0.25,bogus=1,rules=x")
+    assert rates == {PAYLOAD: 0.1, SIGNALS: 1.0, RULES: 1.0, CONDITIONS: 0.25}
+    assert parse_sample_rates({"signals": 5, "rules": -1})[SIGNALS] == 1.0
+    assert parse_sample_rates({"signals": 5, "rules": -1})[RULES] == 0.0
+    assert parse_sample_rates("") == parse_sample_rates(None)
+
+
+def test_disabled_log_records_nothing():
+    hot_log = HotPathLog(_logger(logging.INFO))
+    assert hot_log.begin_event("journal", "Docked") is None
+    assert hot_log.explain() == []
+
+
+def test_records_are_formatted_lazily():
+    hot_log = HotPathLog(_logger(logging.INFO), capacity=2)
+    event_log = hot_log.begin_event("journal", "Docked")
+    assert event_log is not None
+    event_log.add(PAYLOAD, "Payload: %r", _Unformattable())  # stored, not formatted
+
+
+def test_sampling_is_per_category_and_per_event():
+    hot_log = HotPathLog(_logger(logging.INFO), capacity=10, sample_rates="payload=0.25,rules=0")
+    events = [hot_log.begin_event("journal", f"E{index}") for index in range(8)]
+    for event_log in events:
+        assert event_log is not None
+        event_log.add(PAYLOAD, "payload")
+        event_log.add(RULES, "rule")
+        event_log.add(SIGNALS, "signals")
+    assert [event_log.wants(PAYLOAD) for event_log in events] == [False, False, False, True] * 2
+    assert not any(event_log.wants(RULES) for event_log in events)
+    lines = hot_log.explain()
+    assert sum("[payload]" in line for line in lines) == 2
+    assert sum("[signals]" in line for line in lines) == 8
+    assert not any("[rules]" in line for line in lines)
+
+
+def test_explain_buffer_is_bounded():
+    hot_log = HotPathLog(_logger(logging.INFO), capacity=3)
+    for index in range(5):
+        hot_log.begin_event("journal", f"Event{index}").add(SIGNALS, "value=%d", index)
+    lines = hot_log.explain()
+    assert [line.split()[-1] for line in lines if line.startswith("#")] == [
+        "journal/Event2", "journal/Event3", "journal/Event4",
+    ]
+    assert hot_log.explain(1)[-1] == "  [signals] value=4"
+    assert hot_log.explain(0) == []
+
+    hot_log.configure(capacity=0)
+    assert hot_log.explain() == [] and hot_log.begin_event("journal", "Docked") is None
+
+
+def test_debug_level_logs_without_buffering():
+    class ListHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.records = []
+
+        def emit(self, record):
+            self.records.append(record)
+
+    log = _logger(logging.DEBUG)
+    handler = ListHandler()
+    log.addHandler(handler)
+    try:
+        HotPathLog(log).begin_event("journal", "Docked").add(SIGNALS, "docked=%s", True)
+    finally:
+        log.removeHandler(handler)
+    assert [record.getMessage() for record in handler.records] == ["docked=True"]
+    assert handler.records[0].funcName == "test_debug_level_logs_without_buffering"
+
+
+def test_event_handler_explains_recent_events():
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES_FILE), "debug_explain_events": 2}),
+        endpoints=[NullEndpoint()],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+        metrics=MetricsRegistry(enabled=False),
+        tracer=SpanTracer(),
+    )
+    for flags in (0, 1, 0):
+        handler.handle_event("Status", {"event": "Status", "Flags": flags}, source="dashboard", cmdr="Jameson")
+
+    lines = handler.explain_recent_events()
+    assert sum(line.startswith("#") for line in lines) == 2
+    assert any(line.startswith("  [signals] Derived signals:") for line in lines)
+    assert any(line.startswith("  [rules] Evaluating rule") for line in lines)
+    assert any(line.startswith("  [conditions]") for line in lines)
+
+    handler.config.set("debug_sample_rates", "conditions=0")
+    handler._on_config_changed(handler.config, {"debug_sample_rates"})
+    handler.hot_log.clear()
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    lines = handler.explain_recent_events()
+    assert lines and not any("[conditions]" in line for line in lines)
@@ -0,0 +1,122 @@
+"""
+Tests for headless journal tailing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from edmcruleengine.events.journal_tailer import (
+    HeadlessRunner,
+    JournalTailer,
+    StatusWatcher,
+    find_latest_journal,
+)
+
+
+def _line(event: str, **fields) -> str:
+    return json.dumps({"timestamp": "2026-01-01T00:00:00Z", "event": event, **fields}) + "\n"
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.events = []
+
+    def handle_event(self, event_type, data, *, source, cmdr, is_beta):
+        self.events.append((source, event_type, cmdr, is_beta))
+
+
+def test_find_latest_journal_uses_mtime(tmp_path):
+    old = tmp_path / "Journal.2026-01-02T000000.01.log"
+    new = tmp_path / "Journal.2026-01-01T000000.01.log"
+    old.write_text("")
+    new.write_text("")
+    _touch(old, 1_000_000_000)
+    _touch(new, 2_000_000_000)
+    (tmp_path / "Status.json").write_text("{}")
+    assert find_latest_journal(tmp_path) == new
+    assert find_latest_journal(tmp_path / "missing") is None
+
+
+def test_tailer_reads_increments_and_holds_partial_lines(tmp_path):
+    journal = tmp_path / "Journal.2026-01-01T000000.01.log"
+    journal.write_text(_line("Fileheader"))
+
+    tailer = JournalTailer(tmp_path, start_at_end=False)
+    assert [e["event"] for e in tailer.poll()] == ["Fileheader"]
+    assert tailer.poll() == []
+
+    text = _line("Docked", StationName="Jameson")
+    _append(journal, text[:10])
+    assert tailer.poll() == []
+    _append(journal, text[10:] + "not json\n" + _line("Undocked"))
+    assert [e["event"] for e in tailer.poll()] == ["Docked", "Undocked"]
+    assert tailer.offset == journal.stat().st_size
+
+
+def test_tailer_starts_at_end_and_follows_rollover(tmp_path):
+    first = tmp_path / "Journal.2026-01-01T000000.01.log"
+    first.write_text(_line("Fileheader") + _line("LoadGame"))
+    _touch(first, 1_000_000_000)
+
+    tailer = JournalTailer(tmp_path)
+    assert tailer.poll() == []
+
+    _append(first, _line("Shutdown"))
+    _touch(first, 1_000_000_000)
+    second = tmp_path / "Journal.2026-01-01T010000.01.log"
+    second.write_text(_line("Fileheader", part=1) + _line("Location"))
+    _touch(second, 2_000_000_000)
+
+    assert [e["event"] for e in tailer.poll()] == ["Shutdown", "Fileheader", "Location"]
+    assert tailer.path == second
+
+
+def test_status_watcher_only_rereads_on_change(tmp_path):
+    status = tmp_path / "Status.json"
+    watcher = StatusWatcher(status)
+    assert watcher.poll() is None
+
+    status.write_text(json.dumps({"event": "Status", "Flags": 1}))
+    _touch(status, 1_000_000_000)
+    assert watcher.poll() == {"event": "Status", "Flags": 1}
+    assert watcher.poll() is None
+
+    status.write_text("")
+    _touch(status, 2_000_000_000)
+    assert watcher.poll() is None  # mid-write: retried on the next poll
+
+    status.write_text(json.dumps({"event": "Status", "Flags": 5}))
+    _touch(status, 3_000_000_000)
+    assert watcher.poll()["Flags"] == 5
+
+
+def test_runner_feeds_handler_with_session_details(tmp_path):
+    journal = tmp_path / "Journal.2026-01-01T000000.01.log"
+    journal.write_text(
+        _line("Fileheader", gameversion="4.0.0.100 Beta")
+        + _line("LoadGame", Commander="Jameson")
+        + _line("Docked")
+    )
+    (tmp_path / "Status.json").write_text(json.dumps({"event": "Status", "Flags": 1}))
+
+    handler = RecordingHandler()
+    runner = HeadlessRunner(handler, tmp_path, start_at_end=False)
+    assert runner.poll_once() == 4
+    assert handler.events[-2:] == [
+        ("journal", "Docked", "Jameson", True),
+        ("dashboard", "Status", "Jameson", True),
+    ]
+    assert runner.poll_once() == 0
+    assert (runner.journal_events, runner.status_updates) == (3, 1)
@@ -0,0 +1,63 @@
+"""
+Tests that plugin startup only imports the event hot path.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+DEFERRED = [
+    "urllib.request",
+    "edmcruleengine.utils.mega_downloader",
+    "edmcruleengine.utils.pure_python_aes",
+    "edmcruleengine.utils.plugin_update_manager",
+    "edmcruleengine.events.event_recorder",
+    "edmcruleengine.ui.prefs_panel",
+    "edmcruleengine.ui.rule_editor",
+]
+
+
+def _modules_after(code: str) -> list:
+    script = "\n".join([
+        "import json, sys",
+        f"sys.path[:0] = [{str(ROOT)!r}, {str(ROOT / 'src')!r}]",
+        code,
+        "print(json.dumps(sorted(sys.modules)))",
+    ])
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=str(ROOT))
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_package_import_is_lightweight():
+    modules = _modules_after("import edmcruleengine; from edmcruleengine.config.version import __version__")
+    assert "edmcruleengine.events.event_handler" not in modules
+    assert "edmcruleengine.rules.rules_engine" not in modules
+
+
+def test_startup_imports_defer_download_update_and_ui_code():
+    modules = _modules_after("\n".join([
+        "import load",
+        "from edmcruleengine import Config, EventHandler",
+        "from edmcruleengine.vkb.vkb_link_manager import VKBLinkManager",
+        "from edmcruleengine.vkb.vkb_target_pool import VKBTargetPool",
+    ]))
+    assert "edmcruleengine.events.event_handler" in modules
+    assert [name for name in DEFERRED if name in modules] == []
+
+
+def test_lazy_exports_resolve(tmp_path):
+    import edmcruleengine
+    from edmcruleengine.events.event_handler import EventHandler
+    from edmcruleengine.vkb.vkb_link_manager import VKBLinkManager
+
+    assert edmcruleengine.EventHandler is EventHandler
+    assert set(edmcruleengine.__all__) <= set(dir(edmcruleengine))
+
+    manager = VKBLinkManager(None, tmp_path)
+    assert manager._downloader is None
+    assert type(manager.downloader).__name__ == "MegaDownloader"
@@ -42,6 +42,7 @@ def test_plugin_stop_calls_manager_shutdown_and_handler_disconnect(monkeypatch):
     plugin_load.plugin_stop()
 
     manager.shutdown.assert_called_once()
+    handler.flush_unregistered_events.assert_called_once()
     handler.disconnect.assert_called_once()
 
 
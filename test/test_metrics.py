@@ -0,0 +1,111 @@
+"""
+Tests for the pipeline metrics registry.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig
+from edmcruleengine.utils.clock import VirtualClock
+from edmcruleengine.utils.metrics import MetricsRegistry
+
+ROOT = Path(__file__).parent.parent
+RULES = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+
+
+def test_histogram_percentiles_within_bucket_resolution():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage")
+    for micros in range(1, 1001):
+        histogram.observe(micros / 1e6)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 1000
+    assert snapshot.max_ms == pytest.approx(1.0)
+    assert snapshot.mean_ms == pytest.approx(0.5005)
+    # Quarter-octave buckets keep estimates within ~19% of the true value
+    assert snapshot.p50_ms == pytest.approx(0.5, rel=0.2)
+    assert snapshot.p95_ms == pytest.approx(0.95, rel=0.2)
+    assert snapshot.p99_ms == pytest.approx(0.99, rel=0.2)
+    assert snapshot.p99_ms <= snapshot.max_ms
+    assert registry.percentiles("stage") == (snapshot.p50_ms, snapshot.p95_ms, snapshot.p99_ms)
+    assert registry.percentiles("missing") is None
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    histogram = registry.histogram("stage")
+    counter = registry.counter("events")
+    gauge = registry.gauge("depth")
+
+    assert registry.start() is None
+    histogram.observe_since(registry.start())
+    histogram.observe(0.01)
+    counter.inc()
+    gauge.set(3)
+    assert (histogram.count, counter.value, gauge.value) == (0, 0, 0.0)
+
+    registry.enabled = True
+    counter.inc(2)
+    assert counter.value == 2
+
+
+def test_snapshot_is_a_copy_and_reset_keeps_metrics():
+    ticks = iter([1.0, 1.25])
+    registry = MetricsRegistry(timer=lambda: next(ticks))
+    histogram = registry.histogram("stage")
+    assert registry.histogram("stage") is histogram
+
+    histogram.observe_since(registry.start())
+    registry.counter("events").inc()
+    registry.gauge("depth").set(4)
+    snapshot = registry.snapshot()
+
+    registry.reset()
+    histogram.observe(0.5)
+    assert snapshot.histograms["stage"].count == 1
+    assert snapshot.histograms["stage"].sum_ms == pytest.approx(250.0)
+    assert snapshot.counters == {"events": 1}
+    assert snapshot.gauges == {"depth": 4}
+    after = registry.snapshot()
+    assert after.counters == {"events": 0}
+    assert after.histograms["stage"].count == 1
+
+
+def test_event_handler_records_pipeline_stages():
+    registry = MetricsRegistry()
+    endpoint = NullEndpoint()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES)}),
+        endpoints=[endpoint],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+        metrics=registry,
+    )
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    handler.handle_event("Status", {"event": "Status", "Flags": 0}, source="dashboard", cmdr="Jameson")
+
+    snapshot = registry.snapshot()
+    assert snapshot.counters["events.received"] == 2
+    for name in ("event.handle", "rules.reload_check", "rules.derive", "rules.evaluate"):
+        assert snapshot.histograms[name].count == 2, name
+    assert snapshot.counters["rules.dispatched"] == snapshot.histograms["rules.dispatch"].count > 0
+    assert snapshot.gauges["rules.loaded"] > 0
+
+
+def test_metrics_enabled_config_switches_registry_off():
+    registry = MetricsRegistry()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES), "metrics_enabled": False}),
+        endpoints=[NullEndpoint()],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+        metrics=registry,
+    )
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    assert registry.enabled is False
+    assert registry.snapshot().histograms["rules.derive"].count == 0
@@ -0,0 +1,126 @@
+"""
+Tests for the on-demand sampling profiler and tracemalloc hooks.
+"""
+
+from __future__ import annotations
+
+import pstats
+import threading
+import time
+from pathlib import Path
+
+import load as plugin_load
+from edmcruleengine.utils.profiling import (
+    PROFILE_DIR_NAME,
+    MemoryProfiler,
+    ProfilingSession,
+    SamplingProfiler,
+)
+
+HERE = Path(__file__).parent
+
+
+def _busy_plugin_work(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(2000))
+
+
+def _run_busy_thread(seconds: float, profiler: SamplingProfiler) -> None:
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_plugin_work, args=(stop,), name="BusyWorker")
+    worker.start()
+    profiler.start()
+    time.sleep(seconds)
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+
+def test_sampler_counts_stacks_under_roots(tmp_path):
+    profiler = SamplingProfiler(0.002, roots=[HERE])
+    _run_busy_thread(0.2, profiler)
+
+    assert profiler.sample_count > 0
+    stacks = profiler.stacks()
+    assert stacks
+    assert any(
+        thread == "BusyWorker" and any(name == "_busy_plugin_work" for _file, _line, name in frames)
+        for thread, frames in stacks
+    )
+
+    collapsed = profiler.write_collapsed(tmp_path / "p.collapsed").read_text(encoding="utf-8").splitlines()
+    assert any(line.startswith("BusyWorker;") and "_busy_plugin_work_(test_profiling.py:" in line for line in collapsed)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+
+    stats = pstats.Stats(str(profiler.write_pstats(tmp_path / "p.pstats")))
+    busy = [key for key in stats.stats if key[2] == "_busy_plugin_work"]
+    assert busy
+    cc, nc, tt, ct, _callers = stats.stats[busy[0]]
+    assert nc > 0 and ct >= tt >= 0
+
+
+def test_sampler_ignores_threads_outside_roots(tmp_path):
+    profiler = SamplingProfiler(0.002, roots=[tmp_path])
+    _run_busy_thread(0.05, profiler)
+    assert profiler.sample_count > 0
+    assert profiler.stacks() == {}
+
+
+def test_memory_profiler_reports_growth(tmp_path):
+    memory = MemoryProfiler(top=5)
+    memory.start()
+    retained = [bytearray(1024) for _ in range(200)]
+    memory.stop()
+    assert any(stat.size_diff > 0 for stat in memory.diff())
+    report, snapshot = memory.write(tmp_path / "m.txt", tmp_path / "m.tracemalloc")
+    assert "Top 5 changes since start" in report.read_text(encoding="utf-8")
+    assert snapshot.stat().st_size > 0
+    del retained
+
+
+def test_session_writes_profile_files(tmp_path):
+    finished = []
+    session = ProfilingSession(
+        tmp_path,
+        duration_seconds=10,
+        interval_seconds=0.002,
+        memory=True,
+        roots=[HERE],
+        on_finished=finished.append,
+    )
+    session.start()
+    time.sleep(0.05)
+    session.stop()
+    result = session.wait(5)
+
+    assert result is not None and result.error is None and finished == [result]
+    suffixes = sorted("".join(path.suffixes) for path in result.paths)
+    assert suffixes == [".collapsed", ".pstats", ".tracemalloc", ".tracemalloc.txt"]
+    assert all(path.parent == tmp_path / PROFILE_DIR_NAME and path.exists() for path in result.paths)
+
+
+def test_plugin_profiling_trigger_is_one_shot(tmp_path, monkeypatch):
+    class DictConfig:
+        def __init__(self, **values):
+            self._values = dict(values)
+
+        def get(self, key, default=None):
+            return self._values.get(key, default)
+
+        def set(self, key, value):
+            self._values[key] = value
+
+    config = DictConfig(profiling_enabled=True, profiling_duration_seconds=0.05, profiling_interval_ms=2)
+    monkeypatch.setattr(plugin_load._state, "config", config)
+    monkeypatch.setattr(plugin_load._state, "plugin_dir", str(tmp_path))
+    monkeypatch.setattr(plugin_load._state, "profiling_session", None)
+
+    assert plugin_load._start_profiling("test")
+    session = plugin_load._state.profiling_session
+    assert not plugin_load._start_profiling("second request while running")
+    result = session.wait(5)
+
+    assert result is not None and result.error is None
+    assert config.get("profiling_enabled") is False
+    assert plugin_load._state.profiling_session is None
+    assert (tmp_path / PROFILE_DIR_NAME).is_dir()
@@ -0,0 +1,134 @@
+"""
+Tests for replaying recorded sessions through the event handler.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.event_recorder import EventRecorder
+from edmcruleengine.events.replay import (
+    NullEndpoint,
+    RecordedEvent,
+    ReplayConfig,
+    ReplayEngine,
+    iter_recording,
+)
+from edmcruleengine.utils.clock import VirtualClock
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FakeTimer:
+    """perf_counter/sleep pair where sleeping advances the timer."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class SpyHandler:
+    """Minimal handler recording what it receives and the clock reading."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self.clock = clock
+        self.endpoints = []
+        self.calls = []
+
+    def handle_event(self, event_type, event_data, *, source="journal", cmdr="", is_beta=False):
+        self.calls.append((event_type, source, self.clock.time()))
+
+
+def _events(*timestamps):
+    return [RecordedEvent(ts, "journal", f"E{i}", {"n": i}) for i, ts in enumerate(timestamps)]
+
+
+def test_iter_recording_reads_recorder_gzip_output(tmp_path):
+    recorder = EventRecorder(compress=True, flush_interval_seconds=0.05)
+    recorder.start(tmp_path / "session.jsonl")
+    recorder.record("journal", "Docked", {"StationName": "Jameson Memorial"})
+    recorder.record("dashboard", "Status", {"Flags": 1})
+    recorder.stop()
+
+    events = list(iter_recording(recorder.output_path))
+    assert [(e.source, e.event_type) for e in events] == [("journal", "Docked"), ("dashboard", "Status")]
+    assert events[0].timestamp > 0
+
+
+def test_iter_recording_skips_malformed_lines(tmp_path):
+    path = tmp_path / "bad.jsonl"
+    path.write_text('not json\n{"ts": "2026-01-01T00:00:00+00:00", "event": "Music", "data": {}}\n{"data": {}}\n')
+    assert [e.event_type for e in iter_recording(path)] == ["Music"]
+
+
+def test_max_speed_never_sleeps_and_drives_virtual_clock():
+    clock = VirtualClock()
+    handler = SpyHandler(clock)
+    timer = FakeTimer()
+    report = ReplayEngine(handler, clock=clock, sleep=timer.sleep, timer=timer).replay(_events(100.0, 105.0, 160.0))
+
+    assert timer.sleeps == []
+    assert [call[2] for call in handler.calls] == [100.0, 105.0, 160.0]
+    assert report.events == 3
+    assert report.recorded_seconds == 60.0
+    assert set(report.stages) == {"read", "handle_event", "rules", "endpoint"}
+
+
+def test_scaled_speed_sleeps_recorded_gaps_divided_by_speed():
+    clock = VirtualClock()
+    timer = FakeTimer()
+    engine = ReplayEngine(SpyHandler(clock), clock=clock, speed=10.0, sleep=timer.sleep, timer=timer)
+    engine.replay(_events(0.0, 5.0, 25.0), limit=3)
+    assert timer.sleeps == [0.5, 2.0]
+
+
+def test_recent_signal_uses_recorded_time_at_any_speed(tmp_path):
+    clock = VirtualClock()
+    sink = NullEndpoint()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(FIXTURES / "docking_state_rules.json")}),
+        endpoints=[sink],
+        plugin_dir=str(Path(__file__).parent.parent),
+        clock=clock,
+    )
+    events = [
+        RecordedEvent(1000.0, "journal", "Music", {"event": "Music", "MusicTrack": "Exploration"}),
+        RecordedEvent(2000.0, "journal", "Music", {"event": "Music", "MusicTrack": "Combat"}),
+    ]
+    ReplayEngine(handler, clock=clock).replay(events)
+
+    assert handler._recent_events == {"Music": 2000.0}
+    derivation = handler.rule_engine.signal_derivation
+    assert derivation.clock is clock
+    spec = {"op": "recent", "event_name": "Music", "within_seconds": 5}
+    context = {"recent_events": handler._recent_events}
+    clock.advance(4.0)
+    assert derivation._derive_recent(spec, context)
+    clock.advance(2.0)
+    assert not derivation._derive_recent(spec, context)
+
+
+def test_fixture_recording_replays_with_null_endpoint():
+    clock = VirtualClock()
+    sink = NullEndpoint()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(FIXTURES / "docking_state_rules.json")}),
+        endpoints=[sink],
+        plugin_dir=str(Path(__file__).parent.parent),
+        clock=clock,
+    )
+    report = ReplayEngine(handler, clock=clock).replay(iter_recording(FIXTURES / "test_event_1.jsonl"))
+
+    assert report.events > 200
+    assert report.skipped == 0
+    assert report.actions == sink.actions
+    assert handler.endpoints == [sink]
+    assert "events/s" in report.format_summary()
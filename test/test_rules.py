@@ -81,6 +81,30 @@ class TestSignalsCatalog:
         assert len(detail_signals) > 0
 
 
+    def test_catalog_indexes_match_full_scan(self):
+        """Precomputed tier/category/enum/event indexes agree with scanning the signals."""
+        catalog_path = Path(__file__).parent.parent / "data" / "signals_catalog.json"
+        catalog = SignalsCatalog.from_file(catalog_path, use_cache=False)
+        signals = catalog.signals
+
+        assert catalog.get_signals_by_tier("core") == [
+            name for name, sig in signals.items() if sig["ui"]["tier"] == "core"
+        ]
+        category = signals["hardpoints"]["ui"]["category"]
+        assert "hardpoints" in catalog.get_signals_by_category(category)
+        assert catalog.get_signals_by_category("no such category") == []
+
+        assert catalog.get_signal_values("hardpoints") == [v["value"] for v in signals["hardpoints"]["values"]]
+        assert catalog.get_signal_value_set("hardpoints") == frozenset(catalog.get_signal_values("hardpoints"))
+        assert catalog.get_signal_value_set("docked") is None
+        with pytest.raises(TypeError):
+            catalog.enum_value_sets["hardpoints"] = frozenset()
+
+        known = catalog.get_all_known_events()
+        assert isinstance(known, frozenset)
+        assert known is catalog.get_all_known_events()
+
+
 class TestGenerateIdFromTitle:
     """Test ID generation from title."""
     
@@ -761,6 +785,13 @@ class TestUnknownDataPolicy:
             "an out-of-range enum value must not be coerced to any valid value"
         )
 
+    def test_unhashable_enum_value_returns_unknown(self, mini_catalog):
+        """A dict or list where an enum value is expected must return 'unknown', not raise."""
+        signal_def = mini_catalog.signals["enum_invalid_value"]
+        for raw in ({"Name": "alpha"}, ["alpha"]):
+            entry = {"Flags": 0, "Flags2": 0, "RankField": raw}
+            assert mini_catalog.derive_signal("enum_invalid_value", signal_def, entry) == "unknown"
+
     def test_present_data_is_not_unknown(self, mini_catalog):
         """Sanity check: when data is present the signal resolves normally."""
         entry = {"Flags": 0, "Flags2": 0, "RankField": "alpha"}
@@ -0,0 +1,117 @@
+"""
+Tests for outbound shift-state rate limiting and flap damping.
+"""
+
+from __future__ import annotations
+
+import time
+
+from edmcruleengine.vkb.send_scheduler import ShiftSendScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Recorder:
+    """transmit() stand-in that records packets and reports them to the scheduler."""
+
+    def __init__(self) -> None:
+        self.packets = []
+        self.scheduler = None
+
+    def __call__(self, shift, subshift):
+        self.packets.append((shift, subshift))
+        self.scheduler.record_sent(shift, subshift)
+        return True
+
+
+def _scheduler(clock, **kwargs):
+    recorder = Recorder()
+    scheduler = ShiftSendScheduler(recorder, clock=clock, **kwargs)
+    recorder.scheduler = scheduler
+    return scheduler, recorder
+
+
+def test_disabled_scheduler_transmits_every_change():
+    clock = FakeClock()
+    scheduler, rec = _scheduler(clock)
+    assert not scheduler.enabled
+    scheduler.submit(1, 0)
+    scheduler.submit(0, 0)
+    scheduler.submit(1, 0)
+    assert rec.packets == [(1, 0), (0, 0), (1, 0)]
+
+
+def test_min_interval_suppresses_burst_and_flushes_trailing_state():
+    clock = FakeClock()
+    scheduler, rec = _scheduler(clock, min_interval_seconds=0.05)
+
+    scheduler.submit(0, 1)          # leading edge goes out immediately
+    scheduler.submit(0, 2)          # superseded
+    scheduler.submit(0, 3)          # final state
+    assert rec.packets == [(0, 1)]
+    assert scheduler.stats().pending
+
+    clock.now += 0.05
+    scheduler._flush()
+    assert rec.packets == [(0, 1), (0, 3)]
+
+    stats = scheduler.stats()
+    assert stats.sent == 2
+    assert stats.suppressed == 1
+    assert not stats.pending
+
+
+def test_trailing_flush_fires_from_timer():
+    scheduler, rec = _scheduler(time.monotonic, min_interval_seconds=0.05)
+    scheduler.submit(1, 0)
+    scheduler.submit(2, 0)
+    deadline = time.monotonic() + 1.0
+    while len(rec.packets) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert rec.packets == [(1, 0), (2, 0)]
+
+
+def test_hysteresis_drops_bit_that_flaps_back():
+    clock = FakeClock()
+    scheduler, rec = _scheduler(clock, hysteresis_seconds=0.1)
+    scheduler.submit(0, 0)          # initial state goes out
+    assert rec.packets == [(0, 0)]
+
+    clock.now += 1.0
+    scheduler.submit(0, 1)          # bit 0 set ...
+    clock.now += 0.02
+    scheduler.submit(0, 0)          # ... and cleared before it held for 100ms
+    clock.now += 0.2
+    scheduler._flush()
+
+    assert rec.packets == [(0, 0)]
+    assert scheduler.stats().suppressed == 1
+
+
+def test_hysteresis_sends_bit_once_stable():
+    clock = FakeClock()
+    scheduler, rec = _scheduler(clock, hysteresis_seconds=0.1)
+    scheduler.submit(0, 0)
+    clock.now += 1.0
+    scheduler.submit(1, 0)
+    assert rec.packets == [(0, 0)]
+
+    clock.now += 0.1
+    scheduler._flush()
+    assert rec.packets == [(0, 0), (1, 0)]
+
+
+def test_cancel_counts_unsent_request_as_suppressed():
+    clock = FakeClock()
+    scheduler, rec = _scheduler(clock, min_interval_seconds=1.0)
+    scheduler.submit(1, 0)
+    scheduler.submit(2, 0)
+    scheduler.cancel()
+    assert scheduler.stats().suppressed == 1
+    assert not scheduler.stats().pending
@@ -0,0 +1,167 @@
+"""
+Tests for the persisted signal snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig
+from edmcruleengine.rules.signal_snapshot import (
+    SNAPSHOT_FILE_NAME,
+    SignalSnapshot,
+    SnapshotWriter,
+    load_snapshot,
+    save_snapshot,
+)
+from edmcruleengine.utils.clock import VirtualClock
+
+ROOT = Path(__file__).parent.parent
+RULES = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+# landing_gear is only known from dashboard Flags; journal events leave it unknown
+GEAR_RULES = [
+    {
+        "id": "gear-down",
+        "title": "Gear down",
+        "when": {"all": [{"signal": "landing_gear", "op": "eq", "value": "deployed"}]},
+        "then": [{"vkb_set_shift": ["Subshift1"]}],
+        "else": [{"vkb_clear_shift": ["Subshift1"]}],
+    },
+]
+MUSIC = {"event": "Music", "MusicTrack": "Starport"}
+
+
+def _gear_rules(tmp_path: Path) -> Path:
+    rules = tmp_path / "gear_rules.json"
+    rules.write_text(json.dumps(GEAR_RULES), encoding="utf-8")
+    return rules
+
+
+def _handler(plugin_dir: Path, rules: Path, endpoint: NullEndpoint, **overrides) -> EventHandler:
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(rules), "signal_snapshot_enabled": True, **overrides}),
+        endpoints=[endpoint],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+    )
+    handler._snapshot_path = plugin_dir / SNAPSHOT_FILE_NAME
+    return handler
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / SNAPSHOT_FILE_NAME
+    snapshot = SignalSnapshot("c", "r", "Jameson", False, {"docking_state": "docked"}, [("Jameson", False, "a", True)])
+    assert save_snapshot(path, snapshot)
+    loaded = load_snapshot(path)
+    assert loaded == snapshot
+    assert loaded.matches("c", "r") and not loaded.matches("c", "other")
+
+    path.write_text(json.dumps({"version": 0}))
+    assert load_snapshot(path) is None
+
+
+def test_restart_restores_edge_state_and_resends_actions(tmp_path):
+    first = NullEndpoint()
+    handler = _handler(tmp_path, RULES, first)
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    assert handler.rule_engine.last_known_signals["docking_state"] == "docked"
+    assert handler.save_signal_snapshot()
+
+    second = NullEndpoint()
+    restarted = _handler(tmp_path, RULES, second)
+    assert restarted.restore_signal_snapshot(cmdr="Jameson")
+    assert restarted.rule_engine.edge_states() == handler.rule_engine.edge_states()
+    assert restarted.rule_engine.last_known_signals["docking_state"] == "docked"
+    assert second.actions == first.actions
+
+    # Same state after restart: no transition, so nothing is sent again
+    restarted.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    assert second.actions == first.actions
+    assert not restarted.restore_signal_snapshot(cmdr="SomeoneElse")
+
+
+def test_snapshot_ignored_when_rules_change(tmp_path):
+    rules = tmp_path / "rules.json"
+    rules.write_text(RULES.read_text(encoding="utf-8"), encoding="utf-8")
+    handler = _handler(tmp_path, rules, NullEndpoint())
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    handler.save_signal_snapshot()
+
+    rules.write_text(json.dumps(json.loads(rules.read_text(encoding="utf-8"))[:1]), encoding="utf-8")
+    endpoint = NullEndpoint()
+    assert not _handler(tmp_path, rules, endpoint).restore_signal_snapshot()
+    assert endpoint.actions == 0
+
+
+def test_snapshot_saved_periodically_on_clock(tmp_path):
+    handler = _handler(tmp_path, RULES, NullEndpoint(), signal_snapshot_interval_seconds=30)
+    path = tmp_path / SNAPSHOT_FILE_NAME
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    assert not path.exists()
+    handler.clock.advance(30.0)
+    handler.handle_event("Status", {"event": "Status", "Flags": 0}, source="dashboard", cmdr="Jameson")
+    # Written by the background writer, not on the event thread
+    handler._snapshot_writer.wait(5)
+    assert load_snapshot(path).signals["docking_state"] == "in_space"
+
+
+def test_restored_signals_feed_evaluation_until_live_values_arrive(tmp_path):
+    rules = _gear_rules(tmp_path)
+    handler = _handler(tmp_path, rules, NullEndpoint())
+    handler.handle_event("Status", {"event": "Status", "Flags": 4}, source="dashboard", cmdr="Jameson")
+    assert handler.save_signal_snapshot()
+    # Drop the edge state so the first evaluation after restart is a transition
+    snapshot = load_snapshot(tmp_path / SNAPSHOT_FILE_NAME)
+    snapshot.edges = []
+    save_snapshot(tmp_path / SNAPSHOT_FILE_NAME, snapshot)
+
+    endpoint = NullEndpoint()
+    restarted = _handler(tmp_path, rules, endpoint)
+    assert restarted.restore_signal_snapshot(cmdr="Jameson")
+    assert endpoint.actions == 0
+
+    # A journal event carries no Flags, so landing_gear comes from the snapshot
+    restarted.handle_event("Music", MUSIC, source="journal", cmdr="Jameson")
+    assert restarted.rule_engine.edge_states() == [("Jameson", False, "gear-down", True)]
+    assert endpoint.actions == 1
+
+    # The live value replaces the restored one as soon as it is known
+    restarted.handle_event("Status", {"event": "Status", "Flags": 0}, source="dashboard", cmdr="Jameson")
+    assert restarted.rule_engine.edge_states() == [("Jameson", False, "gear-down", False)]
+    assert "landing_gear" not in restarted.rule_engine._restored_signals
+    restarted.handle_event("Music", MUSIC, source="journal", cmdr="Jameson")
+    assert restarted.rule_engine.edge_states() == [("Jameson", False, "gear-down", False)]
+    assert endpoint.actions == 2
+
+
+def test_snapshot_writer_flush_supersedes_queued_write(tmp_path):
+    path = tmp_path / SNAPSHOT_FILE_NAME
+    writer = SnapshotWriter(delay_seconds=0.05)
+    writer.submit(path, SignalSnapshot("c", "r", "Jameson", False, {"docking_state": "docked"}))
+    assert not path.exists()
+    assert writer.flush(path, SignalSnapshot("c", "r", "Jameson", False, {"docking_state": "in_space"}))
+    writer.wait(5)
+    assert load_snapshot(path).signals == {"docking_state": "in_space"}
+
+
+def test_restore_waits_for_commander_and_skips_other_commanders(tmp_path):
+    rules = _gear_rules(tmp_path)
+    handler = _handler(tmp_path, rules, NullEndpoint())
+    handler.handle_event("Status", {"event": "Status", "Flags": 4}, source="dashboard", cmdr="Jameson")
+    assert handler.save_signal_snapshot()
+
+    other = NullEndpoint()
+    restarted = _handler(tmp_path, rules, other)
+    assert not restarted.restore_signal_snapshot_when_known(None)
+    restarted.handle_event("Music", MUSIC, source="journal", cmdr="SomeoneElse")
+    assert other.actions == 0
+    assert restarted.rule_engine.edge_states() == []
+
+    same = NullEndpoint()
+    restarted = _handler(tmp_path, rules, same)
+    restarted.restore_signal_snapshot_when_known(None)
+    restarted.seed_state({}, cmdr="Jameson")
+    assert restarted.rule_engine.edge_states() == handler.rule_engine.edge_states()
+    assert same.actions == 1
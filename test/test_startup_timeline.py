@@ -0,0 +1,66 @@
+"""
+Tests for the startup stage timeline.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from edmcruleengine.utils.startup_timeline import StartupTimeline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_stage_records_offset_and_duration():
+    clock = FakeClock()
+    timeline = StartupTimeline(clock=clock)
+    clock.now = 100.5
+    with timeline.stage("catalog_load"):
+        clock.now = 100.75
+
+    stage = timeline.get_stage("catalog_load")
+    assert stage is not None
+    assert stage.start_seconds == pytest.approx(0.5)
+    assert stage.duration_seconds == pytest.approx(0.25)
+    assert stage.ok is True
+    assert stage.thread == threading.current_thread().name
+    assert timeline.total_seconds() == pytest.approx(0.75)
+
+
+def test_failed_stage_is_recorded_and_reraised():
+    timeline = StartupTimeline(clock=FakeClock())
+    with pytest.raises(RuntimeError):
+        with timeline.stage("rules_compile"):
+            raise RuntimeError("boom")
+
+    stage = timeline.get_stage("rules_compile")
+    assert stage is not None and stage.ok is False
+    assert "rules_compile=" in timeline.format_summary()
+    assert "FAILED" in timeline.format_summary()
+
+
+def test_last_branch_completion_reported_once():
+    timeline = StartupTimeline(branches=("main", "vkb_link"))
+    assert timeline.mark_branch_done("main") is False
+    assert not timeline.complete
+    assert timeline.mark_branch_done("vkb_link") is True
+    assert timeline.complete
+    # Repeated or unknown branches never report completion again.
+    assert timeline.mark_branch_done("vkb_link") is False
+    assert timeline.mark_branch_done("other") is False
+
+
+def test_stages_are_ordered_by_start():
+    clock = FakeClock()
+    timeline = StartupTimeline(clock=clock)
+    timeline.record("connect", 102.0, 103.0)
+    timeline.record("config", 100.0, 100.1)
+    assert [s.name for s in timeline.stages()] == ["config", "connect"]
@@ -0,0 +1,110 @@
+"""
+Tests for incremental ingestion of EDMC's state dict.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from edmcruleengine.rules.rules_engine import RuleEngine
+from edmcruleengine.rules.signals_catalog import SignalsCatalog
+from edmcruleengine.rules import state_ingest
+from edmcruleengine.rules.state_ingest import StateIngest, fingerprint, state_sections
+
+ROOT = Path(__file__).parent.parent
+
+RULES = [
+    {
+        "id": "big-anaconda",
+        "title": "Big Anaconda",
+        "when": {"all": [
+            {"signal": "ship_type", "op": "eq", "value": "anaconda"},
+            {"signal": "ship_cargo_capacity", "op": "gt", "value": 100},
+        ]},
+        "then": [{"vkb_set_shift": ["Shift1"]}],
+        "else": [{"vkb_clear_shift": ["Shift1"]}],
+    },
+]
+
+
+def test_fingerprint_sees_in_place_changes():
+    state = {"Rank": {"Combat": (3, 0)}, "Cargo": {"gold": 1}, "Route": [{"StarSystem": "Sol"}]}
+    ingest = StateIngest(["Rank", "Cargo", "Route", "Missing"])
+    assert ingest.changed_sections(state) == {"Rank", "Cargo", "Route", "Missing"}
+    assert ingest.changed_sections(state) == set()
+
+    state["Cargo"]["gold"] = 2
+    state["Route"][0]["StarSystem"] = "Alpha Centauri"
+    assert ingest.changed_sections(state) == {"Cargo", "Route"}
+
+    state["Route"][0]["Hops"] = ["Sol"]
+    assert ingest.changed_sections(state) == {"Route"}
+    state["Route"][0]["Hops"].append("Barnard's Star")
+    assert ingest.changed_sections(state) == {"Route"}
+
+    state["Missing"] = 1
+    assert ingest.changed_sections(state) == {"Missing"}
+    assert fingerprint({"a": [1]}) == fingerprint({"a": [1]})
+
+
+def test_unchanged_sections_are_not_refingerprinted(monkeypatch):
+    cargo = {"gold": 1}
+    state = {"Cargo": cargo, "Route": [{"StarSystem": "Sol"}], "Credits": 100}
+    ingest = StateIngest(["Cargo", "Route", "Credits"])
+    ingest.changed_sections(state)
+
+    built = []
+    original = state_ingest.fingerprint
+    monkeypatch.setattr(state_ingest, "fingerprint", lambda value, *args: built.append(value) or original(value, *args))
+    assert ingest.changed_sections(state) == set()
+    assert built == []
+
+    # A replaced container is reported from its identity alone.
+    state["Route"] = [{"StarSystem": "Sol"}]
+    assert ingest.changed_sections(state) == {"Route"}
+    assert built[0] is state["Route"]
+
+
+def test_state_sections_only_for_pure_state_specs():
+    assert state_sections({"op": "path", "path": "state.Rank.Combat"}) == {"Rank"}
+    assert state_sections({"op": "sum", "values": [
+        {"op": "count", "path": "state.Raw"}, {"op": "count", "path": "state.Encoded"},
+    ]}) == {"Raw", "Encoded"}
+    assert state_sections({"op": "first_match", "cases": [
+        {"when": {"op": "recent", "event_name": "HullDamage"}, "value": "x"},
+        {"when": {"op": "lt", "left": {"op": "path", "path": "state.HullHealth"}, "right": 30}, "value": "y"},
+    ]}) is None
+    assert state_sections({"op": "path", "path": "dashboard.Cargo"}) is None
+
+
+def test_engine_rederives_only_changed_sections():
+    actions = []
+    engine = RuleEngine(RULES, SignalsCatalog.from_plugin_dir(str(ROOT)), action_handler=actions.append)
+    derived = []
+    derive_signals = engine.signal_derivation.derive_signals
+
+    def _spy(names, entry, context=None, **kwargs):
+        if entry.keys() == {"state"}:
+            derived.append(set(names))
+        return derive_signals(names, entry, context, **kwargs)
+
+    engine.signal_derivation.derive_signals = _spy
+
+    state = {"ShipType": "anaconda", "CargoCapacity": 32, "Rank": {"Combat": 3}}
+    engine.on_notification("Jameson", False, "journal", "Loadout", {"event": "Loadout"}, state=state)
+    assert actions[-1].matched is False
+    assert "ship_cargo_capacity" in derived[0]
+
+    engine.on_notification("Jameson", False, "journal", "Music", {"event": "Music"}, state=state)
+    assert len(derived) == 1
+
+    state["CargoCapacity"] = 256
+    engine.on_notification("Jameson", False, "journal", "Loadout", {"event": "Loadout"}, state=state)
+    assert derived[1] == {"ship_cargo_capacity"}
+    assert actions[-1].matched is True
+
+    # Dashboard events carry no state but still see the cached state signals
+    count = len(actions)
+    engine.on_notification("Jameson", False, "dashboard", "Status", {"event": "Status", "Flags": 0})
+    assert len(actions) == count
+    assert engine._prev_match_state[("Jameson", False, "big-anaconda")] is True
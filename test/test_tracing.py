@@ -0,0 +1,116 @@
+"""
+Tests for the pipeline span tracer and its Chrome Trace Event export.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig
+from edmcruleengine.utils.clock import VirtualClock
+from edmcruleengine.utils.metrics import MetricsRegistry
+from edmcruleengine.utils.tracing import SpanTracer, trace_file_path
+
+ROOT = Path(__file__).parent.parent
+RULES = Path(__file__).parent / "fixtures" / "docking_state_rules.json"
+
+
+def _ticking_timer(step: float = 0.001):
+    now = [0.0]
+
+    def _timer() -> float:
+        now[0] += step
+        return now[0]
+
+    return _timer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = SpanTracer(capacity=4)
+    assert tracer.begin() is None
+    tracer.end("stage", tracer.begin())
+    with tracer.span("stage"):
+        pass
+    assert tracer.spans() == []
+
+
+def test_ring_buffer_keeps_most_recent_spans():
+    tracer = SpanTracer(capacity=3, enabled=True, timer=_ticking_timer())
+    for index in range(5):
+        tracer.end(f"span{index}", tracer.begin())
+    assert [span[0] for span in tracer.spans()] == ["span2", "span3", "span4"]
+
+    tracer.configure(capacity=2)
+    assert tracer.spans() == []
+    tracer.end("after", tracer.begin())
+    tracer.clear()
+    assert tracer.spans() == []
+
+
+def test_chrome_trace_format(tmp_path):
+    tracer = SpanTracer(enabled=True, timer=_ticking_timer(0.5))
+    with tracer.span("outer", "pipeline", args={"event": "Status"}):
+        tracer.end("inner", tracer.begin(), "io")
+
+    trace = tracer.to_chrome_trace()
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in spans] == ["outer", "inner"]
+    outer, inner = spans
+    assert outer["args"] == {"event": "Status"} and "args" not in inner
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert outer["dur"] == 1.5e6
+    assert any(event["ph"] == "M" and event["name"] == "thread_name" for event in trace["traceEvents"])
+
+    path = tracer.dump(trace_file_path(tmp_path))
+    assert path.parent == tmp_path / "traces"
+    assert json.loads(path.read_text(encoding="utf-8")) == json.loads(json.dumps(trace))
+
+
+def test_event_handler_traces_pipeline_spans():
+    tracer = SpanTracer()
+    handler = EventHandler(
+        ReplayConfig({"rules_path": str(RULES), "trace_enabled": True, "trace_buffer_size": 500}),
+        endpoints=[NullEndpoint()],
+        plugin_dir=str(ROOT),
+        clock=VirtualClock(1000.0),
+        metrics=MetricsRegistry(enabled=False),
+        tracer=tracer,
+    )
+    assert tracer.enabled and tracer.capacity == 500
+
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+    names = [span[0] for span in tracer.spans()]
+    assert names[0] == "rules.reload_check"
+    assert "rules.derive" in names
+    assert any(name.startswith("rule.") for name in names)
+    assert any(name.startswith("action.") for name in names)
+
+    handle = next(span for span in tracer.spans() if span[0] == "handle_event")
+    assert handle[5] == {"event": "Status", "source": "dashboard"}
+    for name, _category, started, ended, _thread, _args in tracer.spans():
+        assert handle[2] <= started <= ended <= handle[3], name
+
+
+def test_failed_send_records_span_and_latency():
+    from edmcruleengine.vkb.vkb_client import VKBClient
+
+    class StallingSocket:
+        def sendall(self, data):
+            raise TimeoutError("timed out")
+
+        def close(self):
+            pass
+
+    tracer = SpanTracer(enabled=True, timer=_ticking_timer())
+    metrics = MetricsRegistry()
+    client = VKBClient(metrics=metrics, tracer=tracer)
+    client.socket = StallingSocket()
+    client.connected = True
+
+    assert not client.send_event("VKBShiftBitmap", {"shift": 1, "subshift": 0})
+    (span,) = [span for span in tracer.spans() if span[0] == "vkb.sendall"]
+    assert span[5]["error"] == "timed out" and span[5]["bytes"] > 0
+    assert metrics.snapshot().histograms["vkb.send_event"].count == 1
+    assert metrics.snapshot().counters["vkb.send_errors"] == 1
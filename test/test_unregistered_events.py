@@ -116,6 +116,7 @@ class TestUnregisteredEventsTracker:
         tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog)
         
         tracker.track_event("TestEvent", {"field": "value"}, source="journal")
+        tracker.flush()
         
         # Check file was created
         tracker_file = temp_dir / "unregistered_events.json"
@@ -137,6 +138,7 @@ class TestUnregisteredEventsTracker:
         tracker1 = UnregisteredEventsTracker(temp_dir, catalog=catalog)
         tracker1.track_event("Event1", {"data": "1"}, source="journal")
         tracker1.track_event("Event2", {"data": "2"}, source="dashboard")
+        tracker1.flush()
         
         # Create new tracker instance - should load from file
         tracker2 = UnregisteredEventsTracker(temp_dir, catalog=catalog)
@@ -147,6 +149,57 @@ class TestUnregisteredEventsTracker:
         assert event_names == {"Event1", "Event2"}
         print("[OK] Load from file test passed")
 
+    def test_saves_are_debounced_and_atomic(self, temp_dir, catalog, monkeypatch):
+        """Repeated events coalesce into few background writes via temp file + rename."""
+        import edmcruleengine.events.unregistered_events_tracker as tracker_module
+
+        replaced = []
+        real_replace = tracker_module.os.replace
+
+        def _spy_replace(src, dst):
+            replaced.append((Path(src).name, Path(dst).name))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(tracker_module.os, "replace", _spy_replace)
+        tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog, save_interval_seconds=0.2)
+        for i in range(50):
+            tracker.track_event("Chatty", {"n": i}, source="journal")
+
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            data = json.loads((temp_dir / "unregistered_events.json").read_text()) if replaced else None
+            if data and data["events"]["Chatty"]["occurrences"] == 50:
+                break
+            time.sleep(0.02)
+
+        assert data["events"]["Chatty"]["occurrences"] == 50
+        assert 1 <= len(replaced) <= 3
+        assert replaced[0] == ("unregistered_events.json.tmp", "unregistered_events.json")
+        assert not (temp_dir / "unregistered_events.json.tmp").exists()
+
+    def test_timer_write_creates_missing_plugin_dir(self, temp_dir, catalog):
+        """A pending write is not dropped when the directory does not exist yet."""
+        plugin_dir = temp_dir / "not-created-yet"
+        tracker = UnregisteredEventsTracker(plugin_dir, catalog=catalog, save_interval_seconds=0.05)
+        tracker.track_event("Pending", {"n": 1}, source="journal")
+
+        tracker_file = plugin_dir / "unregistered_events.json"
+        deadline = time.monotonic() + 2.0
+        while not tracker_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert set(json.loads(tracker_file.read_text())["events"]) == {"Pending"}
+
+    def test_flush_writes_pending_changes_immediately(self, temp_dir, catalog):
+        """flush() (plugin_stop) persists changes still waiting for the debounce."""
+        tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog, save_interval_seconds=60)
+        tracker.track_event("First", {"n": 1}, source="journal")
+        tracker.flush()
+        tracker.track_event("Second", {"n": 2}, source="journal")
+        tracker.flush()
+
+        data = json.loads((temp_dir / "unregistered_events.json").read_text())
+        assert set(data["events"]) == {"First", "Second"}
+
     def test_clear_specific_event(self, temp_dir, catalog):
         """Test clearing a specific event."""
         tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog)
@@ -249,6 +302,59 @@ class TestUnregisteredEventsTracker:
         assert len(sample["LongString"]) <= 1003  # 1000 + "..."
         print("[OK] Sanitize event data test passed")
 
+    def test_schema_fingerprint_ignores_values_but_not_shape(self):
+        """Fingerprints depend on key paths and value types only."""
+        from edmcruleengine.events.unregistered_events_tracker import schema_fingerprint
+
+        fp1, fields = schema_fingerprint({"Name": "a", "Items": [{"Count": 1}]})
+        fp2, _ = schema_fingerprint({"Items": [{"Count": 7}], "Name": "b"})
+        fp3, _ = schema_fingerprint({"Name": "a", "Items": [{"Count": "1"}]})
+
+        assert fp1 == fp2
+        assert fp1 != fp3
+        assert "Items[].Count:number" in fields
+
+    def test_repeated_schema_stops_sanitizing_once_samples_full(self, temp_dir, catalog):
+        """Repeat occurrences only bump counters after the sample reservoir is full."""
+        tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog, save_interval_seconds=60)
+        calls = []
+        original = tracker._sanitize_event_data
+
+        def _spy(data):
+            calls.append(data)
+            return original(data)
+
+        tracker._sanitize_event_data = _spy
+        for i in range(100):
+            tracker.track_event("Chatty", {"Track": f"T{i}"}, source="journal")
+        tracker.track_event("Chatty", {"Track": "T", "Extra": True}, source="journal")
+
+        entry = tracker.get_unregistered_events()[0]
+        assert entry["occurrences"] == 101
+        assert len(calls) == UnregisteredEventsTracker.MAX_SAMPLES_PER_SCHEMA + 1
+        assert len(entry["schemas"]) == 2
+        counts = sorted(schema["count"] for schema in entry["schemas"].values())
+        assert counts == [1, 100]
+        assert entry["sample_data"] == {"Track": "T", "Extra": True}
+        assert all(len(schema["samples"]) <= 3 for schema in entry["schemas"].values())
+        tracker.flush()
+
+    def test_sample_data_anonymized_when_anonymizer_attached(self, temp_dir, catalog):
+        """Stored samples go through the shared anonymizer without touching the event."""
+        from edmcruleengine.events.event_anonymizer import EventAnonymizer
+
+        tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog)
+        tracker.anonymizer = EventAnonymizer(mock_commander_name="TestCMDR")
+        event = {"Commander": "RealCMDR", "Path": "C:\\Users\\real\\x.txt", "Count": 2}
+
+        tracker.track_event("TestEvent", event, source="journal")
+
+        sample = tracker.get_unregistered_events()[0]["sample_data"]
+        assert sample["Commander"] == "TestCMDR"
+        assert "real" not in sample["Path"]
+        assert sample["Count"] == 2
+        assert event["Commander"] == "RealCMDR"
+
     def test_events_sorted_by_last_seen(self, temp_dir, catalog):
         """Test that events are sorted by last_seen timestamp (newest first)."""
         tracker = UnregisteredEventsTracker(temp_dir, catalog=catalog)
@@ -714,3 +714,141 @@ def test_startup_does_not_set_started_by_manager_when_already_running(tmp_path,
 
     manager.startup()
     assert manager._started_by_manager is False
+
+
+def test_probe_listener_detects_accepting_socket():
+    """The non-blocking probe must succeed as soon as a listener accepts."""
+    import socket
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    try:
+        port = listener.getsockname()[1]
+        assert vkbm._probe_listener("127.0.0.1", port, timeout=1.0) is True
+    finally:
+        listener.close()
+
+
+def test_probe_listener_refused_port_returns_false():
+    import socket
+    import time
+
+    closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    closed.bind(("127.0.0.1", 0))
+    port = closed.getsockname()[1]
+    closed.close()
+
+    start = time.monotonic()
+    assert vkbm._probe_listener("127.0.0.1", port, timeout=1.0) is False
+    assert time.monotonic() - start < 1.0
+
+
+def test_poll_until_backs_off_and_returns_last_result(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(vkbm.time, "sleep", lambda seconds: sleeps.append(seconds))
+    results = iter([None, None, None, "found"])
+
+    assert vkbm._poll_until(lambda: next(results), timeout=10.0, max_interval=0.03) == "found"
+    assert sleeps == [0.01, 0.02, 0.03]
+
+
+def test_startup_records_concurrent_timeline_stages(tmp_path, monkeypatch):
+    from edmcruleengine.utils.startup_timeline import StartupTimeline
+
+    manager, _ = _make_manager(tmp_path, vkb_link_auto_manage=True)
+    monkeypatch.setattr(manager, "get_status", lambda check_running=False: vkbm.VKBLinkStatus(
+        exe_path="/exe", install_dir=None, version="1.0", running=True, managed=True
+    ))
+    monkeypatch.setattr(manager, "_prefetch_ini_resolution", lambda: None)
+    monkeypatch.setattr(manager, "connect", lambda: True)
+    monkeypatch.setattr(manager, "set_connection_status_override", lambda _: None)
+
+    timeline = StartupTimeline(branches=("vkb_link",))
+    assert manager.startup(timeline=timeline) is True
+
+    names = {stage.name for stage in timeline.stages()}
+    assert {"process_discovery", "ini_resolution", "vkb_connect"} <= names
+    assert "ensure_running" not in names
+
+
+def test_socket_loss_triggers_recovery(tmp_path, monkeypatch):
+    client = Mock()
+    cfg = DictConfig()
+    manager = VKBLinkManager(cfg, tmp_path, downloader=MagicMock(spec=Downloader), client=client)
+    client.set_on_disconnected.assert_called_once_with(manager._on_socket_lost)
+
+    recovery = Mock()
+    monkeypatch.setattr(manager, "_attempt_recovery", recovery)
+    manager._on_socket_lost("peer_closed")
+    recovery.assert_called_once_with(reason="socket_closed", on_connected_callback=manager._on_socket_connected)
+
+
+def test_shift_sends_are_rate_limited_when_configured(tmp_path):
+    client = Mock()
+    client.send_event.return_value = True
+    cfg = DictConfig(vkb_send_min_interval_ms=60000)
+    manager = VKBLinkManager(cfg, tmp_path, downloader=MagicMock(spec=Downloader), client=client)
+    result = Mock(rule_id="r1")
+
+    manager.handle_action("vkb_set_shift", ["Subshift1"], result)
+    manager.handle_action("vkb_set_shift", ["Subshift2"], result)
+    manager.handle_action("vkb_clear_shift", ["Subshift2"], result)
+    assert client.send_event.call_count == 1
+
+    # A forced resend (e.g. session reset) bypasses the limiter and drops the pending flush.
+    manager.on_session_event("LoadGame")
+    assert client.send_event.call_count == 2
+    stats = manager.get_send_stats()
+    assert stats.sent == 2
+    assert stats.suppressed >= 1
+    assert not stats.pending
+
+
+def test_sends_before_startup_connects_are_deferred(tmp_path, monkeypatch):
+    client = Mock()
+    client.is_connected.return_value = False
+    client.send_event.return_value = True
+    manager = VKBLinkManager(DictConfig(), tmp_path, downloader=MagicMock(spec=Downloader), client=client)
+    recovery = Mock()
+    monkeypatch.setattr(manager, "_attempt_recovery", recovery)
+
+    manager.defer_sends_until_connected()
+    manager.handle_action("vkb_set_shift", ["Shift1"], Mock(rule_id="warm"))
+    client.send_event.assert_not_called()
+    recovery.assert_not_called()
+
+    def _connect():
+        client.is_connected.return_value = True
+        manager._on_socket_connected()
+        return True
+
+    monkeypatch.setattr(manager, "get_status", lambda check_running=False: vkbm.VKBLinkStatus(
+        exe_path="/exe", install_dir=None, version="1.0", running=True, managed=True
+    ))
+    monkeypatch.setattr(manager, "_prefetch_ini_resolution", lambda: None)
+    monkeypatch.setattr(manager, "connect", _connect)
+    monkeypatch.setattr(manager, "restore_last_startup_minimized_setting", lambda: None)
+    assert manager.startup() is True
+
+    client.send_event.assert_called_once_with("VKBShiftBitmap", {"shift": 1, "subshift": 0})
+    recovery.assert_not_called()
+
+
+def test_deferred_sends_start_recovery_when_startup_fails(tmp_path, monkeypatch):
+    client = Mock()
+    client.is_connected.return_value = False
+    client.send_event.return_value = False
+    manager = VKBLinkManager(DictConfig(), tmp_path, downloader=MagicMock(spec=Downloader), client=client)
+    recovery = Mock()
+    monkeypatch.setattr(manager, "_attempt_recovery", recovery)
+
+    manager.defer_sends_until_connected()
+    manager.handle_action("vkb_set_shift", ["Shift1"], Mock(rule_id="warm"))
+    monkeypatch.setattr(manager, "get_status", lambda check_running=False: vkbm.VKBLinkStatus(
+        exe_path="/exe", install_dir=None, version="1.0", running=True, managed=True
+    ))
+    monkeypatch.setattr(manager, "_prefetch_ini_resolution", lambda: None)
+    monkeypatch.setattr(manager, "connect", lambda: False)
+    assert manager.startup() is False
+    recovery.assert_called_once_with(reason="send_failure", on_connected_callback=manager._on_socket_connected)
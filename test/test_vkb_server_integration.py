@@ -339,6 +339,66 @@ def test_disconnect_during_reconnection():
     print("  OK: Disconnect-during-reconnection test passed")
 
 
+def test_client_detects_peer_close_without_sending():
+    """The socket watcher must notice a peer close before any further send."""
+    import socket
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+    lost = threading.Event()
+    reasons = []
+
+    def _on_lost(reason):
+        reasons.append(reason)
+        lost.set()
+
+    client = VKBClient(host="127.0.0.1", port=port, socket_timeout=2, on_disconnected=_on_lost)
+    try:
+        assert client.connect()
+        peer, _addr = listener.accept()
+        assert client.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+        assert client.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) != 0
+
+        # Acknowledgement bytes are drained without being treated as a loss.
+        peer.sendall(b"\x00\x01")
+        time.sleep(0.2)
+        assert client.connected and not lost.is_set()
+
+        peer.close()
+        assert lost.wait(timeout=3.0), "Peer close was not detected"
+        assert not client.connected
+        assert client.socket is None
+        assert reasons and reasons[0] in ("peer_closed", "connection_reset")
+    finally:
+        client.disconnect()
+        listener.close()
+
+
+def test_local_disconnect_does_not_report_peer_loss():
+    """Closing the socket locally must stop the watcher without invoking the callback."""
+    import socket
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+    on_lost = Mock()
+
+    client = VKBClient(host="127.0.0.1", port=port, socket_timeout=2, on_disconnected=on_lost)
+    try:
+        assert client.connect()
+        peer, _addr = listener.accept()
+        client.disconnect()
+        time.sleep(client.WATCH_INTERVAL_SECONDS * 2)
+        peer.close()
+        time.sleep(0.2)
+        on_lost.assert_not_called()
+    finally:
+        listener.close()
+
+
 def test_visual_shift_combinations():
     """
     Visual test: Cycles through shift/subshift combinations with delays.
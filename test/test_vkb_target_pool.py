@@ -0,0 +1,187 @@
+"""
+Tests for the multi-target VKB endpoint pool.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from edmcruleengine.vkb.vkb_target_pool import (
+    VKBTarget,
+    VKBTargetPool,
+    parse_vkb_targets,
+)
+
+
+class FakeClient:
+    """VKBClient stand-in recording sends, with optional delay/failure."""
+
+    def __init__(self, *, connect_ok: bool = True, send_delay: float = 0.0):
+        self.connect_ok = connect_ok
+        self.send_delay = send_delay
+        self.connected = False
+        self.sent = []
+        self.sent_event = threading.Event()
+        self.on_disconnected = None
+
+    def set_on_disconnected(self, callback):
+        self.on_disconnected = callback
+
+    def connect(self):
+        self.connected = self.connect_ok
+        return self.connected
+
+    def disconnect(self):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    def send_event(self, event_type, payload):
+        if not self.connected:
+            return False
+        if self.send_delay:
+            time.sleep(self.send_delay)
+        self.sent.append((payload["shift"], payload["subshift"]))
+        self.sent_event.set()
+        return True
+
+
+def _result(rule_id="r1"):
+    return SimpleNamespace(rule_id=rule_id)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _pool(**clients):
+    targets = [VKBTarget(name, "127.0.0.1", 50995 + i) for i, name in enumerate(clients)]
+    return VKBTargetPool(targets, clients, reconnect_interval=0.1)
+
+
+def test_parse_vkb_targets_named_unnamed_and_invalid():
+    targets = parse_vkb_targets(["left=127.0.0.1:50995", "192.168.1.20:50996", "bad", "left=1.2.3.4:1"])
+    assert targets == [
+        VKBTarget("left", "127.0.0.1", 50995),
+        VKBTarget("target2", "192.168.1.20", 50996),
+    ]
+    assert parse_vkb_targets("a=h:1, b=h:2") == [VKBTarget("a", "h", 1), VKBTarget("b", "h", 2)]
+    assert parse_vkb_targets([]) == []
+
+
+def test_from_config_returns_none_without_targets():
+    config = SimpleNamespace(get=lambda key, default=None: default)
+    assert VKBTargetPool.from_config(config) is None
+
+
+def test_unscoped_tokens_are_mirrored_and_scoped_tokens_sliced():
+    left, right = FakeClient(), FakeClient()
+    pool = _pool(left=left, right=right)
+    try:
+        assert pool.connect()
+        pool.handle_action("vkb_set_shift", ["Shift1", "right:Subshift3"], _result())
+
+        assert pool.get_shift_state("left") == (0x01, 0x00)
+        assert pool.get_shift_state("right") == (0x01, 0x04)
+        assert _wait_for(lambda: left.sent and left.sent[-1] == (0x01, 0x00))
+        assert _wait_for(lambda: right.sent and right.sent[-1] == (0x01, 0x04))
+    finally:
+        pool.disconnect()
+
+
+def test_slow_target_does_not_delay_others():
+    fast, slow = FakeClient(), FakeClient(send_delay=0.5)
+    pool = _pool(fast=fast, slow=slow)
+    try:
+        pool.connect()
+        time.sleep(0.6)  # let initial resends drain
+        fast.sent.clear()
+        fast.sent_event.clear()
+
+        started = time.monotonic()
+        pool.handle_action("vkb_set_shift", ["Shift2"], _result())
+        assert fast.sent_event.wait(timeout=1.0)
+        assert time.monotonic() - started < 0.3
+    finally:
+        pool.disconnect()
+
+
+def test_dead_target_reports_health_and_does_not_block_live_target():
+    live, dead = FakeClient(), FakeClient(connect_ok=False)
+    pool = _pool(live=live, dead=dead)
+    try:
+        assert pool.connect() is True
+        pool.handle_action("vkb_set_shift", ["Subshift1"], _result())
+        assert _wait_for(lambda: live.sent and live.sent[-1] == (0x00, 0x01))
+
+        health = {h.name: h for h in pool.get_health()}
+        assert health["live"].connected and health["live"].sent >= 1
+        assert not health["dead"].connected
+        assert health["dead"].consecutive_failures >= 1
+        assert "connect" in health["dead"].last_error
+    finally:
+        pool.disconnect()
+
+
+def test_session_reset_and_disconnect_clear_all_targets():
+    left, right = FakeClient(), FakeClient()
+    pool = _pool(left=left, right=right)
+    pool.connect()
+    pool.handle_action("vkb_set_shift", ["Shift1", "Subshift2"], _result())
+    pool.on_session_event("LoadGame")
+    assert pool.get_shift_state("left") == (0, 0)
+    assert _wait_for(lambda: left.sent and left.sent[-1] == (0, 0))
+    pool.disconnect()
+    assert not left.connected and not right.connected
+
+
+def test_unknown_target_token_is_ignored():
+    client = FakeClient()
+    pool = _pool(only=client)
+    try:
+        pool.connect()
+        assert pool.handle_action("vkb_set_shift", ["other:Shift1"], _result()) is True
+        assert pool.get_shift_state("only") == (0, 0)
+        assert pool.handle_action("vkb_set_shift", ["only:Subshift8", "Shift3"], _result()) is True
+        assert pool.get_shift_state("only") == (0, 0)
+        assert pool.handle_action("unrelated", [], _result()) is False
+    finally:
+        pool.disconnect()
+
+
+def test_event_handler_dispatches_shift_actions_to_manager_and_pool(tmp_path):
+    from edmcruleengine.events.event_handler import EventHandler
+    from edmcruleengine.events.replay import ReplayConfig
+    from edmcruleengine.vkb.vkb_link_manager import VKBLinkManager
+
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps([{
+        "title": "Docked",
+        "enabled": True,
+        "when": {"all": [{"signal": "docking_state", "op": "eq", "value": "docked"}]},
+        "then": [{"vkb_set_shift": ["Shift1", "left:Subshift2"]}],
+        "else": [{"vkb_clear_shift": ["Shift1", "left:Subshift2"]}],
+    }]))
+    config = ReplayConfig({"rules_path": str(rules_path)})
+    manager = VKBLinkManager(config, tmp_path)
+    manager.defer_sends_until_connected()
+    pool = _pool(left=FakeClient(), right=FakeClient())
+
+    handler = EventHandler(config, endpoints=[], plugin_dir=str(Path(__file__).parent.parent))
+    handler.add_endpoint(manager)
+    handler.add_endpoint(pool)
+    handler.handle_event("Status", {"event": "Status", "Flags": 1}, source="dashboard", cmdr="Jameson")
+
+    assert manager._shift_bitmap == 0x01
+    assert pool.get_shift_state("left") == (0x01, 0x02)
+    assert pool.get_shift_state("right") == (0x01, 0x00)
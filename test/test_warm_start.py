@@ -0,0 +1,136 @@
+"""
+Tests for warm start from the latest journal.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from edmcruleengine.events.event_handler import EventHandler
+from edmcruleengine.events.replay import NullEndpoint, ReplayConfig
+from edmcruleengine.events.warm_start import (
+    build_state,
+    required_state_sections,
+    scan_journal_backwards,
+    warm_start,
+)
+
+ROOT = Path(__file__).parent.parent
+
+SHIP_RULES = [
+    {
+        "id": "big-ship",
+        "title": "Big ship",
+        "when": {"all": [
+            {"signal": "ship_type", "op": "eq", "value": "anaconda"},
+            {"signal": "ship_cargo_capacity", "op": "gt", "value": 100},
+        ]},
+        "then": [{"vkb_set_shift": ["Shift1"]}],
+        "else": [{"vkb_clear_shift": ["Shift1"]}],
+    },
+]
+
+
+def _line(event: str, **fields) -> str:
+    return json.dumps({"timestamp": "2026-01-01T00:00:00Z", "event": event, **fields})
+
+
+def _write_journal(directory: Path, filler: int = 2000) -> Path:
+    lines = [
+        _line("Fileheader", gameversion="4.0.0.1"),
+        _line("LoadGame", Commander="Jameson", Ship="SideWinder", gameversion="4.0.0.1"),
+        _line("Loadout", Ship="Anaconda", ShipName="Longhaul", CargoCapacity=32, HullHealth=1.0),
+    ]
+    lines += [_line("Music", MusicTrack="Exploration")] * (filler // 2)
+    lines.append(_line("Loadout", Ship="Anaconda", ShipName="Longhaul", CargoCapacity=256, HullHealth=0.5))
+    lines += [_line("Music", MusicTrack="Exploration")] * (filler // 2)
+    path = directory / "Journal.2026-01-01T000000.01.log"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _handler(tmp_path: Path, endpoint: NullEndpoint) -> EventHandler:
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps(SHIP_RULES), encoding="utf-8")
+    return EventHandler(ReplayConfig({"rules_path": str(rules)}), endpoints=[endpoint], plugin_dir=str(ROOT))
+
+
+def test_required_sections_follow_rule_signals(tmp_path):
+    handler = _handler(tmp_path, NullEndpoint())
+    assert required_state_sections(handler.rule_engine) == {"ShipType", "CargoCapacity"}
+
+
+def test_reverse_scan_stops_once_sections_are_found(tmp_path):
+    journal = _write_journal(tmp_path)
+    size = journal.stat().st_size
+
+    result = scan_journal_backwards(journal, {"CargoCapacity"}, block_size=4096)
+    assert [e["CargoCapacity"] for e in result.entries] == [256]
+    assert result.sections_missing == set()
+    assert result.bytes_read < size
+
+    result = scan_journal_backwards(journal, {"CargoCapacity", "Commander", "Rank"}, block_size=4096)
+    assert [e["event"] for e in result.entries] == ["LoadGame", "Loadout"]
+    assert result.sections_missing == {"Rank"}
+    assert result.bytes_read == size
+
+
+def test_reverse_scan_is_bounded_by_max_bytes(tmp_path):
+    journal = _write_journal(tmp_path)
+
+    # FleetCarrier is never written, so only the budget stops the scan
+    result = scan_journal_backwards(journal, {"FleetCarrier"}, block_size=4096, max_bytes=8192)
+    assert result.truncated
+    assert result.bytes_read == 8192
+    assert result.sections_missing == {"FleetCarrier"}
+
+    result = scan_journal_backwards(journal, {"FleetCarrier"}, block_size=4096, max_bytes=None)
+    assert not result.truncated and result.bytes_read == journal.stat().st_size
+
+
+def test_cargo_without_inventory_does_not_satisfy_the_section(tmp_path):
+    journal = tmp_path / "Journal.2026-01-01T000000.01.log"
+    journal.write_text("\n".join([
+        _line("Cargo", Vessel="Ship", Count=4, Inventory=[{"Name": "gold", "Count": 4}]),
+        _line("Cargo", Vessel="SRV", Count=0, Inventory=[]),
+        _line("Cargo", Vessel="Ship", Count=4),
+    ]) + "\n", encoding="utf-8")
+
+    result = scan_journal_backwards(journal, {"Cargo"})
+    assert [e.get("Inventory") for e in result.entries] == [[{"Name": "gold", "Count": 4}]]
+    assert result.sections_missing == set()
+    assert build_state(result.entries)["Cargo"] == [{"Name": "gold", "Count": 4}]
+
+
+def test_build_state_applies_entries_in_order():
+    state = build_state([
+        {"event": "LoadGame", "Commander": "Jameson", "Ship": "SideWinder"},
+        {"event": "Location", "StarSystem": "Sol", "Docked": True, "StationName": "Abraham Lincoln"},
+        {"event": "Loadout", "Ship": "Anaconda", "CargoCapacity": 256, "HullHealth": 0.5},
+        {"event": "Undocked", "StationName": "Abraham Lincoln"},
+    ])
+    assert state["Commander"] == "Jameson"
+    assert state["ShipType"] == "anaconda"
+    assert state["HullHealth"] == 50.0
+    assert state["StarSystem"] == "Sol"
+    assert "StationName" not in state
+
+
+def test_warm_start_seeds_rules_before_live_events(tmp_path):
+    _write_journal(tmp_path)
+    endpoint = NullEndpoint()
+    handler = _handler(tmp_path, endpoint)
+
+    result = warm_start(handler, tmp_path, block_size=4096)
+
+    assert result.cmdr == "Jameson"
+    assert result.state["CargoCapacity"] == 256
+    assert handler.rule_engine._prev_match_state == {("Jameson", False, "big-ship"): True}
+    assert endpoint.actions == 1
+    handler.flush_unregistered_events()
+
+
+def test_warm_start_without_journal_or_state_rules(tmp_path):
+    handler = _handler(tmp_path, NullEndpoint())
+    assert warm_start(handler, tmp_path / "empty") is None